@@ -32,6 +32,13 @@ from . import globals_and_threading
 from . import misc_utils
 from . import tint_utils
 from . import blender_utils
+from . import dds_utils
+from . import texture_utils
+from . import p4k_utils
+from . import concurrency_utils
+from . import texconv_utils
+from . import lock_utils
+from . import dae_utils
 from . import import_utils
 from . import operators
 from . import panels
@@ -100,9 +107,11 @@ classes = (
     operators.VIEW3D_OT_refresh_button,
     operators.VIEW3D_OT_import_loadout,
     operators.VIEW3D_OT_make_instance_real,
+    operators.VIEW3D_OT_make_components_real,
     operators.VIEW3D_OT_reload,
     operators.GetGUIDOperator,
     operators.VIEW3D_OT_export_missing,
+    operators.VIEW3D_OT_upgrade_textures,
     operators.VIEW3D_OT_separate_decals,
     operators.VIEW3D_OT_open_preferences,
     operators.SCORG_OT_show_missing_files,
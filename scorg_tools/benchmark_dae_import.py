@@ -0,0 +1,89 @@
+# benchmark_dae_import.py - Per-file import time of the native DAE importer against the Collada operator
+#
+# Runs inside Blender with the addon enabled, e.g. from the command line:
+#   blender -b --python benchmark_dae_import.py -- <folder or .dae files> [--limit 50]
+#
+# Each file is imported into an empty scene once with each importer. The native time is split into
+# parsing (dae_utils, can run without Blender) and building the Blender objects.
+import argparse
+import os
+import sys
+import time
+
+import bpy
+from scorg_tools import dae_utils
+from scorg_tools import import_utils
+
+
+def clear_scene():
+    for collection in (bpy.data.objects, bpy.data.meshes, bpy.data.materials):
+        for block in list(collection):
+            collection.remove(block)
+
+
+def collect_inputs(paths, limit):
+    inputs = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                inputs.extend(os.path.join(root, name) for name in files if name.lower().endswith('.dae'))
+        elif path.lower().endswith('.dae'):
+            inputs.append(path)
+    return sorted(inputs)[:limit]
+
+
+def time_native(path):
+    clear_scene()
+    start = time.perf_counter()
+    parsed = dae_utils.SCOrg_tools_dae.parse(path)
+    parsed_at = time.perf_counter()
+    if parsed['unsupported']:
+        return None
+    objects = import_utils.SCOrg_tools_import.build_dae_objects(parsed)
+    return parsed_at - start, time.perf_counter() - parsed_at, len(objects)
+
+
+def time_collada(path):
+    clear_scene()
+    start = time.perf_counter()
+    bpy.ops.wm.collada_import(filepath=path, auto_connect=False)
+    return time.perf_counter() - start, len(bpy.data.objects)
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(description="Compare the native DAE importer with the Collada operator")
+    parser.add_argument('paths', nargs='+')
+    parser.add_argument('--limit', type=int, default=100)
+    args = parser.parse_args(argv)
+
+    inputs = collect_inputs(args.paths, args.limit)
+    if not inputs:
+        print("ERROR: No .dae files found")
+        return
+    has_collada = import_utils.SCOrg_tools_import.is_collada_operator_available()
+    print(f"{'file':<48} {'KB':>7} {'parse ms':>9} {'build ms':>9} {'native ms':>10} {'collada ms':>11} {'speedup':>8} {'objects':>9}")
+    totals = [0.0, 0.0]
+    for path in inputs:
+        name = os.path.basename(path)[:48]
+        native = time_native(path)
+        if native is None:
+            print(f"{name:<48} skipped, uses features the native importer doesn't handle")
+            continue
+        parse_time, build_time, native_objects = native
+        native_time = parse_time + build_time
+        collada_time, collada_objects = time_collada(path) if has_collada else (None, None)
+        totals[0] += native_time
+        totals[1] += collada_time or 0.0
+        collada_text = f"{collada_time * 1000:>11.0f} {collada_time / native_time:>7.1f}x" if collada_time else f"{'-':>11} {'-':>8}"
+        objects_text = f"{native_objects}/{collada_objects}" if collada_objects is not None else str(native_objects)
+        print(f"{name:<48} {os.path.getsize(path) / 1024:>7.0f} {parse_time * 1000:>9.0f} {build_time * 1000:>9.0f} "
+              f"{native_time * 1000:>10.0f} {collada_text} {objects_text:>9}")
+    if totals[1]:
+        print(f"Total: native {totals[0]:.2f}s, collada {totals[1]:.2f}s ({totals[1] / totals[0]:.1f}x)")
+    else:
+        print(f"Total: native {totals[0]:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,348 @@
+# benchmark_extraction.py - Headless throughput benchmark for extract_missing_files
+#
+# Runs under plain Python on Linux (or macOS), without Blender, Data.p4k or the Windows tools:
+#   python benchmark_extraction.py [--batch-sizes 50 200 800] [--threads 1 4 8] [--auto]
+#                                  [--cgf-latency 0.05] [--texconv-latency 0.2] [--texconv-file-latency 0.01]
+#
+# Builds a synthetic archive (an ordinary zip with Data.p4k style paths: geometry with companion
+# files, materials, and split .dds textures with .dds.N mip parts), writes stand-in cgf-converter and
+# texconv executables that sleep for a configurable time and write plausible outputs, then runs the
+# real planning and processing code at every batch size and thread count. Each run happens in its
+# own child process so peak RSS is measured per run.
+#
+# Blender-only modules (bpy, gpu, blf, ...) and scdatatools are replaced by inert stand-ins so
+# import_utils can be imported, nothing that touches them is called during extraction.
+import argparse
+import importlib.machinery
+import json
+import os
+import random
+import resource
+import shutil
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import types
+import zipfile
+from types import SimpleNamespace
+
+ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+MANUFACTURERS = ['AEGS', 'ANVL', 'DRAK', 'MISC', 'RSI', 'ORIG', 'CRUS']
+PARTS = ['hull', 'wing_left', 'wing_right', 'landing_gear', 'canopy', 'thruster', 'turret', 'seat', 'door', 'light']
+TEXTURE_KINDS = ['diff', 'ddna', 'spec', 'disp']
+
+
+# --- Stand-ins for Blender ------------------------------------------------------------------
+
+class _StandInType(type):
+    """Any attribute or call on a stand-in gives back the stand-in, decorators return the function."""
+    def __getattr__(cls, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return cls
+
+    def __call__(cls, *args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return cls
+
+    def __iter__(cls):
+        return iter(())
+
+    def __bool__(cls):
+        return False
+
+
+class StandIn(metaclass=_StandInType):
+    pass
+
+
+class StandInFinder:
+    ROOTS = {'bpy', 'bpy_extras', 'gpu', 'gpu_extras', 'blf', 'mathutils', 'bmesh', 'scdatatools'}
+
+    def find_spec(self, name, path, target=None):
+        if name.split('.')[0] in self.ROOTS:
+            return importlib.machinery.ModuleSpec(name, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        module = types.ModuleType(spec.name)
+        module.__path__ = []
+
+        def module_getattr(name):
+            if name.startswith('__'):
+                raise AttributeError(name)
+            return StandIn
+        module.__getattr__ = module_getattr
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+def import_addon():
+    """Import import_utils without running the add-on's __init__ (which registers Blender classes)."""
+    sys.meta_path.insert(0, StandInFinder())
+    package = types.ModuleType('scorg_tools')
+    package.__path__ = [ADDON_DIR]
+    sys.modules['scorg_tools'] = package
+    from scorg_tools import concurrency_utils, globals_and_threading, import_utils
+    return import_utils, globals_and_threading, concurrency_utils
+
+
+class ArchiveStandIn(zipfile.ZipFile):
+    """A zip file with the search() call extract_missing_files uses on Data.p4k."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.by_lower_name = {info.filename.lower(): info for info in self.filelist}
+
+    def search(self, path):
+        info = self.by_lower_name.get(path.replace("\\", "/").lower())
+        return [info] if info else []
+
+
+# --- Synthetic archive ----------------------------------------------------------------------
+
+def make_dds_header(width, height, mip_count, fourcc):
+    header = bytearray(128)
+    header[0:4] = b'DDS '
+    struct.pack_into('<7I', header, 4, 124, 0x1 | 0x2 | 0x4 | 0x1000 | 0x20000 | 0x80000, height, width,
+                     max(1, width // 4) * max(1, height // 4) * 8, 0, mip_count)
+    struct.pack_into('<2I4s', header, 76, 32, 0x4, fourcc)
+    struct.pack_into('<I', header, 108, 0x1000 | 0x400000 | 0x8)
+    return bytes(header)
+
+
+def payload(rng, size):
+    """Partly compressible bytes, roughly like game assets in deflate/zstd."""
+    block = rng.randbytes(min(size, 4096))
+    repeated = (block * (size // (len(block) * 2) + 1))[:size // 2]
+    return repeated + rng.randbytes(size - len(repeated))
+
+
+def build_archive(path, geometry_count, texture_count, material_count, large_count, large_mb, seed=1):
+    """
+    Write a synthetic Data.p4k stand-in and return the list of requests an import would make for
+    it, in the order they appear in the missing files list (geometry as .dae, textures as .tif).
+    """
+    rng = random.Random(seed)
+    requests = []
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        def ship_dir(i):
+            return f"Data/Objects/Spaceships/Ships/{MANUFACTURERS[i % len(MANUFACTURERS)]}/Ship_{i // 25:02d}"
+
+        for i in range(geometry_count):
+            base = f"{ship_dir(i)}/{PARTS[i % len(PARTS)]}_{i:04d}"
+            size = large_mb * 1024 * 1024 if i < large_count else rng.randint(20, 400) * 1024
+            archive.writestr(base + ".cga", payload(rng, size))
+            archive.writestr(base + ".cgam", payload(rng, size // 2))
+            requests.append(base + ".dae")
+
+        for i in range(material_count):
+            base = f"{ship_dir(i * 5)}/ship_{i:03d}"
+            materials = "".join(f'<Material Name="mat {j}" Shader="HardSurface"/>' for j in range(20))
+            archive.writestr(base + ".mtl", f'<Material><SubMaterials>{materials}</SubMaterials></Material>')
+            requests.append(base + ".mtl")
+
+        for i in range(texture_count):
+            kind = TEXTURE_KINDS[i % len(TEXTURE_KINDS)]
+            base = f"{ship_dir(i * 3)}/textures/tex_{i:04d}_{kind}"
+            size = 2 ** rng.randint(7, 11)
+            part_count = max(0, size.bit_length() - 8)  # the largest mips live in .dds.N parts
+            fourcc = b'BC5S' if kind == 'ddna' else b'DXT1'
+            mip_count = size.bit_length()
+            top = (size // 4) ** 2 * 8
+            tail = sum(max(1, (size >> level) // 4) ** 2 * 8 for level in range(part_count, mip_count))
+            archive.writestr(base + ".dds", make_dds_header(size, size, mip_count, fourcc) + payload(rng, tail))
+            for part in range(1, part_count + 1):
+                # .dds.1 is the smallest split mip, the highest N is the full size image
+                archive.writestr(f"{base}.dds.{part}", payload(rng, top >> (2 * (part_count - part))))
+            requests.append(base + ".tif")
+
+    rng.shuffle(requests)
+    return requests
+
+
+# --- Stand-in converters --------------------------------------------------------------------
+
+CGF_CONVERTER_SCRIPT = '''#!{python}
+import sys, time
+from pathlib import Path
+time.sleep({latency})
+source = next(Path(arg) for arg in sys.argv[1:] if arg.lower().endswith(('.cga', '.cgf', '.chr', '.skin')))
+source.with_suffix('.dae').write_text('<COLLADA>' + '<node/>' * (source.stat().st_size // 2048) + '</COLLADA>')
+'''
+
+TEXCONV_SCRIPT = '''#!{python}
+import os, sys, time
+args = sys.argv[1:]
+output_dir = args[args.index('-o') + 1]
+output_format = args[args.index('-ft') + 1]
+suffix = args[args.index('-sx') + 1] if '-sx' in args else ''
+inputs = [arg for arg in args if arg.lower().endswith('.dds')]
+time.sleep({latency})
+for path in inputs:
+    time.sleep({file_latency})
+    print('reading ' + path + ' (synthetic)')
+    name = os.path.splitext(os.path.basename(path))[0] + suffix + '.' + output_format
+    with open(path, 'rb') as src, open(os.path.join(output_dir, name), 'wb') as dst:
+        dst.write(src.read())
+    print('writing ' + name)
+'''
+
+
+def write_tool(path, source):
+    with open(path, 'w') as f:
+        f.write(source)
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+# --- Running --------------------------------------------------------------------------------
+
+def run_one(config):
+    """Run one extraction in this process and return its measurements."""
+    import_utils, globals_and_threading, concurrency_utils = import_addon()
+
+    archive = ArchiveStandIn(config['archive'])
+    globals_and_threading.p4k = archive
+    globals_and_threading.sc = SimpleNamespace(p4k=archive)
+    globals_and_threading.debug = False
+
+    # Keep hold of the limiters so per-stage busy time can be reported
+    captured = {}
+    create_limiters = concurrency_utils.SCOrg_tools_concurrency.create_limiters
+
+    def capture_limiters(max_threads, auto):
+        thread_count, limiters = create_limiters(max_threads, auto)
+        captured.update(limiters)
+        return thread_count, limiters
+    concurrency_utils.SCOrg_tools_concurrency.create_limiters = capture_limiters
+
+    prefs = SimpleNamespace(
+        cgf_converter_path=config['cgf_converter'],
+        texconv_path=config['texconv'],
+        extract_dir=config['extract_dir'],
+        max_extraction_threads=config['threads'],
+        auto_extraction_threads=config['auto'],
+        texture_mip_cap=0,
+        texture_converter=config['converter'],
+        texture_decoder_processes=0,
+        process_decompress_threshold_mb=config['decompress_threshold_mb'],
+        texconv_batch_size=config['texconv_batch_size'],
+    )
+
+    stage_times = {}
+    start = time.perf_counter()
+
+    def progress(current, total, message):
+        if message.startswith("Planning extraction") and total and current == total:
+            stage_times['planning'] = time.perf_counter() - start
+
+    success, failed, report = import_utils.SCOrg_tools_import.extract_missing_files(
+        "\n".join(config['requests']), prefs, progress_callback=progress
+    )
+    elapsed = time.perf_counter() - start
+    stage_times['processing'] = elapsed - stage_times.get('planning', 0.0)
+    for name, limiter in captured.items():
+        stage_times[f"{name}_busy"] = limiter.total_busy
+        stage_times[f"{name}_limit"] = limiter.limit
+
+    written = sum(os.path.getsize(os.path.join(root, name))
+                  for root, _, names in os.walk(config['extract_dir']) for name in names)
+    scale = 1 if sys.platform == 'darwin' else 1024  # ru_maxrss is bytes on macOS, KB on Linux
+    return {
+        'success': success,
+        'failed': failed,
+        'elapsed': elapsed,
+        'bytes_written': written,
+        'peak_rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+        'peak_child_rss': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale,
+        'stages': stage_times,
+        'errors': [line for line in report if line.startswith('❌')][:5],
+    }
+
+
+def run_in_child(config):
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), '--run-one', json.dumps(config)],
+                            capture_output=True, text=True)
+    lines = [line for line in result.stdout.splitlines() if line.startswith('{')]
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(f"Benchmark run failed:\n{result.stdout}\n{result.stderr}")
+    return json.loads(lines[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extract_missing_files against a synthetic archive")
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[50, 200, 800])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--auto', action='store_true', help="Also run with Auto Thread Count")
+    parser.add_argument('--converter', choices=['TEXCONV', 'BUILTIN'], default='TEXCONV')
+    parser.add_argument('--texconv-batch-size', type=int, default=32)
+    parser.add_argument('--cgf-latency', type=float, default=0.05, help="Seconds per cgf-converter run")
+    parser.add_argument('--texconv-latency', type=float, default=0.2, help="Seconds per texconv start-up")
+    parser.add_argument('--texconv-file-latency', type=float, default=0.01, help="Seconds per texture in texconv")
+    parser.add_argument('--large-files', type=int, default=2, help="Geometry entries above the decompression threshold")
+    parser.add_argument('--large-mb', type=int, default=12)
+    parser.add_argument('--decompress-threshold-mb', type=int, default=8)
+    parser.add_argument('--keep', action='store_true', help="Keep the work directory")
+    parser.add_argument('--run-one', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(json.loads(args.run_one))))
+        return
+
+    work_dir = tempfile.mkdtemp(prefix="scorg_extractbench_")
+    try:
+        largest = max(args.batch_sizes)
+        archive_path = os.path.join(work_dir, "Data.p4k.zip")
+        requests = build_archive(archive_path, geometry_count=largest // 4, texture_count=largest * 2 // 3,
+                                 material_count=max(1, largest // 12), large_count=args.large_files, large_mb=args.large_mb)
+        cgf_converter = write_tool(os.path.join(work_dir, "cgf-converter"),
+                                   CGF_CONVERTER_SCRIPT.format(python=sys.executable, latency=args.cgf_latency))
+        texconv = write_tool(os.path.join(work_dir, "texconv"),
+                             TEXCONV_SCRIPT.format(python=sys.executable, latency=args.texconv_latency, file_latency=args.texconv_file_latency))
+        print(f"Synthetic archive: {len(requests)} requests, {os.path.getsize(archive_path) / (1024 * 1024):.1f} MB")
+
+        thread_settings = [(threads, False) for threads in args.threads] + ([(0, True)] if args.auto else [])
+        print(f"{'batch':>6} {'threads':>8} {'ok':>5} {'fail':>5} {'files/s':>8} {'MB/s':>7} {'rss MB':>7} "
+              f"{'plan s':>7} {'proc s':>7} {'io busy':>8} {'dec busy':>9} {'conv busy':>10} {'limits':>10}")
+        for batch_size in args.batch_sizes:
+            for threads, auto in thread_settings:
+                extract_dir = os.path.join(work_dir, f"extract_{batch_size}_{threads}_{int(auto)}")
+                os.makedirs(extract_dir)
+                result = run_in_child({
+                    'archive': archive_path,
+                    'requests': requests[:batch_size],
+                    'extract_dir': extract_dir,
+                    'cgf_converter': cgf_converter,
+                    'texconv': texconv,
+                    'threads': threads or 4,
+                    'auto': auto,
+                    'converter': args.converter,
+                    'texconv_batch_size': args.texconv_batch_size,
+                    'decompress_threshold_mb': args.decompress_threshold_mb,
+                })
+                stages = result['stages']
+                limits = "/".join(str(stages.get(f"{name}_limit", '-')) for name in ('io', 'decompress', 'convert'))
+                print(f"{batch_size:>6} {'auto' if auto else threads:>8} {result['success']:>5} {result['failed']:>5} "
+                      f"{result['success'] / result['elapsed']:>8.1f} {result['bytes_written'] / (1024 * 1024) / result['elapsed']:>7.1f} "
+                      f"{result['peak_rss'] / (1024 * 1024):>7.0f} {stages.get('planning', 0.0):>7.2f} {stages['processing']:>7.2f} "
+                      f"{stages.get('io_busy', 0.0):>8.2f} {stages.get('decompress_busy', 0.0):>9.2f} {stages.get('convert_busy', 0.0):>10.2f} {limits:>10}")
+                for error in result['errors']:
+                    print(f"       {error}")
+                shutil.rmtree(extract_dir, ignore_errors=True)
+    finally:
+        if args.keep:
+            print(f"Work directory kept at {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# benchmark_geometry_format.py - Converted size and import time of .dae against .glb geometry
+#
+# Runs inside Blender with the addon enabled, e.g. from the command line:
+#   blender -b --python benchmark_geometry_format.py -- <cgf-converter> <folder or .cga/.cgf files> [--limit 50]
+#
+# Each source file is copied (with its .cgam/.cgfm/.mtl companions) into a scratch folder per format and
+# converted there, so the extract directory is left alone. Then each result is imported into an empty scene:
+# DAE with the selected Geometry Importer, GLB with Blender's glTF importer.
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import bpy
+from scorg_tools import import_utils
+
+SOURCE_EXTS = ('.cga', '.cgf')
+COMPANION_EXTS = ('.cgam', '.cgfm', '.mtl')
+FORMATS = ('dae', 'glb')
+
+
+def clear_scene():
+    for collection in (bpy.data.objects, bpy.data.meshes, bpy.data.materials):
+        for block in list(collection):
+            collection.remove(block)
+
+
+def collect_inputs(paths, limit):
+    inputs = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                inputs.extend(os.path.join(root, name) for name in files if name.lower().endswith(SOURCE_EXTS))
+        elif path.lower().endswith(SOURCE_EXTS):
+            inputs.append(path)
+    return sorted(inputs)[:limit]
+
+
+def copy_with_companions(source, folder):
+    source = Path(source)
+    for ext in ('',) + COMPANION_EXTS:
+        candidate = source if not ext else source.with_suffix(ext)
+        if candidate.is_file():
+            shutil.copy2(candidate, folder / candidate.name)
+    return folder / source.name
+
+
+def convert(source, folder, converter, output_format):
+    """Convert a copy of `source` in `folder`, returning (output path or None, seconds)."""
+    copy = copy_with_companions(source, folder)
+    output = copy.with_suffix('.' + output_format)
+    start = time.perf_counter()
+    converted = import_utils.SCOrg_tools_import.convert_cgf_to_dae(copy, output, converter_path=converter, output_format=output_format)
+    return (output if converted and output.is_file() else None), time.perf_counter() - start
+
+
+def time_import(path):
+    clear_scene()
+    start = time.perf_counter()
+    if path.suffix == '.glb':
+        imported = import_utils.SCOrg_tools_import.import_glb(path)
+    else:
+        imported = import_utils.SCOrg_tools_import.import_dae(path)
+    return (time.perf_counter() - start) if imported else None
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(description="Compare .dae and .glb output of cgf-converter")
+    parser.add_argument('converter', help="Path to cgf-converter")
+    parser.add_argument('paths', nargs='+')
+    parser.add_argument('--limit', type=int, default=100)
+    args = parser.parse_args(argv)
+
+    inputs = collect_inputs(args.paths, args.limit)
+    if not inputs:
+        print("ERROR: No .cga/.cgf files found")
+        return
+
+    totals = {fmt: [0, 0.0, 0.0] for fmt in FORMATS}  # bytes, convert seconds, import seconds
+    print(f"{'file':<40} {'dae KB':>8} {'glb KB':>8} {'dae conv ms':>12} {'glb conv ms':>12} {'dae imp ms':>11} {'glb imp ms':>11}")
+    with tempfile.TemporaryDirectory(prefix="scorg_geometry_format_") as scratch:
+        for index, source in enumerate(inputs):
+            row = {}
+            for fmt in FORMATS:
+                folder = Path(scratch) / fmt / str(index)
+                folder.mkdir(parents=True)
+                output, convert_time = convert(source, folder, args.converter, fmt)
+                import_time = time_import(output) if output else None
+                row[fmt] = (output.stat().st_size if output else None, convert_time, import_time)
+            name = os.path.basename(source)[:40]
+            if any(size is None or import_time is None for size, _, import_time in row.values()):
+                print(f"{name:<40} skipped, conversion or import failed in one of the formats")
+                continue
+            for fmt, (size, convert_time, import_time) in row.items():
+                totals[fmt][0] += size
+                totals[fmt][1] += convert_time
+                totals[fmt][2] += import_time
+            print(f"{name:<40} {row['dae'][0] / 1024:>8.0f} {row['glb'][0] / 1024:>8.0f} "
+                  f"{row['dae'][1] * 1000:>12.0f} {row['glb'][1] * 1000:>12.0f} "
+                  f"{row['dae'][2] * 1000:>11.0f} {row['glb'][2] * 1000:>11.0f}")
+
+    dae, glb = totals['dae'], totals['glb']
+    if dae[0] and glb[0]:
+        print(f"Total size: dae {dae[0] / 1048576:.1f} MB, glb {glb[0] / 1048576:.1f} MB ({glb[0] / dae[0]:.0%} of dae)")
+        print(f"Total convert: dae {dae[1]:.2f}s, glb {glb[1]:.2f}s")
+        print(f"Total import: dae {dae[2]:.2f}s, glb {glb[2]:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
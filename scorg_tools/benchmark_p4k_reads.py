@@ -0,0 +1,74 @@
+# benchmark_p4k_reads.py - Archive read throughput with a shared handle vs per-thread handles
+#
+# Runs under plain Python, outside Blender:
+#   python benchmark_p4k_reads.py <Data.p4k or any .zip> [--threads 1 2 4 8] [--files 500] [--filter .dds]
+#
+# Data.p4k needs scdatatools installed, any ordinary zip file works with the standard library.
+# Reads the same set of entries at each thread count (like max_extraction_threads), once through
+# the shared archive object and once through p4k_utils.ThreadHandles per-thread handles.
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from p4k_utils import ThreadHandles  # noqa: E402
+
+
+def open_archive(path):
+    if path.lower().endswith('.p4k'):
+        from scdatatools.p4k import P4KFile
+        return P4KFile(path)
+    return zipfile.ZipFile(path)
+
+
+def read_shared(archive, info):
+    with archive.open(info) as f:
+        return len(f.read())
+
+
+def read_per_thread(handles, info):
+    return len(handles.read_entry(info))
+
+
+def run(archive, infos, threads, reader):
+    handles = ThreadHandles(archive)
+    source = handles if reader is read_per_thread else archive
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        total = sum(executor.map(lambda info: reader(source, info), infos))
+    elapsed = time.perf_counter() - start
+    handles.close()
+    return total, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark threaded archive reads")
+    parser.add_argument('archive')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--files', type=int, default=500)
+    parser.add_argument('--filter', default='', help="Only read entries whose name contains this text")
+    args = parser.parse_args()
+
+    archive = open_archive(args.archive)
+    infos = [info for info in archive.infolist() if args.filter.lower() in info.filename.lower() and info.file_size > 0]
+    infos = infos[:args.files]
+    if not infos:
+        print("ERROR: No matching entries")
+        return
+    print(f"{len(infos)} entries, {sum(i.file_size for i in infos) / (1024 * 1024):.1f} MB uncompressed")
+    print(f"{'threads':>8} {'shared MB/s':>12} {'per-thread MB/s':>16} {'speedup':>8}")
+
+    # Warm the OS file cache so the first run is not penalised
+    run(archive, infos, 1, read_shared)
+    for threads in args.threads:
+        total, shared_time = run(archive, infos, threads, read_shared)
+        _, per_thread_time = run(archive, infos, threads, read_per_thread)
+        mb = total / (1024 * 1024)
+        print(f"{threads:>8} {mb / shared_time:>12.1f} {mb / per_thread_time:>16.1f} {shared_time / per_thread_time:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
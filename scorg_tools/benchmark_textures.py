@@ -0,0 +1,91 @@
+# benchmark_textures.py - Throughput of the built-in BCn decoder against texconv on the same inputs
+#
+# Runs under plain Python (numpy required), outside Blender:
+#   python benchmark_textures.py <folder of .dds files> [path to texconv.exe] [--format tif|png|tga] [--processes N]
+#
+# Point it at a folder of complete (already assembled) .dds files. Both converters are timed on
+# the same files, texconv is skipped if no path is given.
+import argparse
+import concurrent.futures
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from texture_utils import SCOrg_tools_texture  # noqa: E402
+
+
+def collect_inputs(folder):
+    inputs = []
+    for root, _, files in os.walk(folder):
+        for name in files:
+            if name.lower().endswith('.dds'):
+                path = os.path.join(root, name)
+                with open(path, 'rb') as f:
+                    block_format, _ = SCOrg_tools_texture.get_block_format(f.read(148))
+                if block_format:
+                    inputs.append(path)
+    return sorted(inputs)
+
+
+def report(label, elapsed, inputs):
+    total_mb = sum(os.path.getsize(p) for p in inputs) / (1024 * 1024)
+    print(f"{label:<28} {elapsed:8.2f}s  {len(inputs) / elapsed:8.1f} files/s  {total_mb / elapsed:8.1f} MB/s")
+
+
+def run_builtin(inputs, out_dir, output_format, processes):
+    outputs = [os.path.join(out_dir, f"{i}.{output_format}") for i in range(len(inputs))]
+    start = time.perf_counter()
+    if processes > 0:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn')) as pool:
+            list(pool.map(SCOrg_tools_texture.convert_dds_file, inputs, outputs))
+    else:
+        for src, dst in zip(inputs, outputs):
+            SCOrg_tools_texture.convert_dds_file(src, dst)
+    return time.perf_counter() - start
+
+
+def run_texconv(inputs, out_dir, output_format, texconv_path):
+    start = time.perf_counter()
+    for src in inputs:
+        with open(src, 'rb') as f:
+            extra_args = ['-f', 'R8G8B8A8_UNORM'] if SCOrg_tools_texture.get_block_format(f.read(148)) == ('BC5', True) else []
+        subprocess.run([texconv_path, '-nologo', '-y'] + extra_args + ['-ft', output_format, src, '-o', out_dir],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the built-in BCn decoder against texconv")
+    parser.add_argument('folder')
+    parser.add_argument('texconv', nargs='?')
+    parser.add_argument('--format', default='tif', choices=SCOrg_tools_texture.OUTPUT_FORMATS)
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 4)
+    args = parser.parse_args()
+
+    if not SCOrg_tools_texture.is_available():
+        print("ERROR: numpy is required for the built-in decoder")
+        return
+    inputs = collect_inputs(args.folder)
+    if not inputs:
+        print("ERROR: No supported .dds files found")
+        return
+    print(f"{len(inputs)} textures, {sum(os.path.getsize(p) for p in inputs) / (1024 * 1024):.1f} MB, output {args.format}")
+
+    out_dir = tempfile.mkdtemp(prefix="scorg_texbench_")
+    try:
+        report("built-in (1 process)", run_builtin(inputs, out_dir, args.format, 0), inputs)
+        if args.processes > 0:
+            report(f"built-in ({args.processes} processes)", run_builtin(inputs, out_dir, args.format, args.processes), inputs)
+        if args.texconv:
+            report("texconv", run_texconv(inputs, out_dir, args.format, args.texconv), inputs)
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
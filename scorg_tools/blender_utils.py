@@ -1,4 +1,5 @@
 import bpy
+import bmesh
 import re
 import time  # Add time import
 import os
@@ -63,9 +64,17 @@ class SCOrg_tools_blender():
         
         return False
 
+    # The post-processing passes below come in pairs: iter_<pass> yields between the objects or materials it
+    # works on, so the import operator can spread it over its modal timer ticks, and <pass> runs it in one go.
     @staticmethod
     def add_weld_and_weighted_normal_modifiers():
+        for _ in __class__.iter_add_weld_and_weighted_normal_modifiers():
+            pass
+
+    @staticmethod
+    def iter_add_weld_and_weighted_normal_modifiers():
         for i, obj in enumerate(bpy.data.objects):
+            yield
             ui_tools.progress_bar_popup("add_weld_modifiers", i, len(bpy.data.objects), f"Adding weld modifiers to {obj.name}")
             if obj.type != 'MESH':
                 continue
@@ -131,8 +140,14 @@ class SCOrg_tools_blender():
 
     @staticmethod
     def add_displace_modifiers_for_decal(displacement_strength = 0.005):
+        for _ in __class__.iter_add_displace_modifiers_for_decal(displacement_strength):
+            pass
+
+    @staticmethod
+    def iter_add_displace_modifiers_for_decal(displacement_strength = 0.005):
         objects_list = list(bpy.data.objects)
         for i, obj in enumerate(objects_list):
+            yield
             ui_tools.progress_bar_popup("add_displace_modifiers", i, len(objects_list), "Adding Displace modifiers for POM and Decal")
             if obj.type != 'MESH':
                 continue
@@ -169,8 +184,14 @@ class SCOrg_tools_blender():
 
     @staticmethod
     def remove_duplicate_displace_modifiers():
+        for _ in __class__.iter_remove_duplicate_displace_modifiers():
+            pass
+
+    @staticmethod
+    def iter_remove_duplicate_displace_modifiers():
         objects_list = list(bpy.data.objects)
         for i, obj in enumerate(objects_list):
+            yield
             ui_tools.progress_bar_popup("remove_duplicate_displace", i, len(objects_list), f"Removing duplicate Displace modifiers from {obj.name}")
             if obj.type != 'MESH':
                 continue
@@ -373,14 +394,22 @@ class SCOrg_tools_blender():
 
     @staticmethod
     def remove_proxy_material_geometry():
+        for _ in __class__.iter_remove_proxy_material_geometry():
+            pass
+
+    @staticmethod
+    def iter_remove_proxy_material_geometry():
+        # Edited with bmesh rather than edit mode operators, so objects outside the view layer
+        # (like the sources of instanced components) are cleaned up as well
         objects_list = list(bpy.data.objects)
         for i, obj in enumerate(objects_list):
+            yield
             ui_tools.progress_bar_popup("remove_proxy_geometry", i, len(objects_list), "Removing proxy material geometry")
             if obj.type != 'MESH':
                 continue
             
             # Find all slots with proxy materials
-            slots_to_remove = []
+            proxy_slots = []
             for slot_idx, slot in enumerate(obj.material_slots):
                 mat = slot.material
                 if mat:
@@ -388,42 +417,41 @@ class SCOrg_tools_blender():
                     if (mat_name_lower.endswith('_mtl_proxy') or 
                         mat_name_lower.endswith('_nodraw') or 
                         mat_name_lower.endswith('_physics_proxy')):
-                        
-                        # Set this object as active and enter edit mode
-                        bpy.context.view_layer.objects.active = obj
-                        bpy.ops.object.mode_set(mode='OBJECT')
-                        
-                        # Deselect all faces first
-                        for poly in obj.data.polygons:
-                            poly.select = False
-                        
-                        # Select faces that use this material
-                        faces_selected = 0
-                        for poly in obj.data.polygons:
-                            if poly.material_index == slot_idx:
-                                poly.select = True
-                                faces_selected += 1
-                        
-                        if faces_selected > 0:
-                            if globals_and_threading.debug: 
-                                print(f"DEBUG: Removing {faces_selected} faces with material '{mat.name}' from object '{obj.name}'")
-                            
-                            # Enter edit mode and delete selected faces
-                            bpy.ops.object.mode_set(mode='EDIT')
-                            bpy.ops.mesh.delete(type='FACE')
-                            bpy.ops.object.mode_set(mode='OBJECT')
-                            
-                            # Mark this slot for removal
-                            slots_to_remove.append(slot_idx)
-                        else:
-                            if globals_and_threading.debug:
-                                print(f"DEBUG: No faces found for material '{mat.name}' in object '{obj.name}'")
+                        proxy_slots.append(slot_idx)
+            if not proxy_slots:
+                continue
+
+            bm = bmesh.new()
+            bm.from_mesh(obj.data)
+            faces_by_slot = {slot_idx: [] for slot_idx in proxy_slots}
+            for face in bm.faces:
+                if face.material_index in faces_by_slot:
+                    faces_by_slot[face.material_index].append(face)
+
+            slots_to_remove = []
+            faces_to_delete = []
+            for slot_idx, faces in faces_by_slot.items():
+                mat = obj.material_slots[slot_idx].material
+                if faces:
+                    if globals_and_threading.debug: 
+                        print(f"DEBUG: Removing {len(faces)} faces with material '{mat.name}' from object '{obj.name}'")
+                    faces_to_delete.extend(faces)
+                    # Mark this slot for removal
+                    slots_to_remove.append(slot_idx)
+                else:
+                    if globals_and_threading.debug:
+                        print(f"DEBUG: No faces found for material '{mat.name}' in object '{obj.name}'")
+
+            if faces_to_delete:
+                bmesh.ops.delete(bm, geom=faces_to_delete, context='FACES')
+                bm.to_mesh(obj.data)
+                obj.data.update()
+            bm.free()
             
-            # Remove material slots (in reverse order to avoid index shifting)
+            # Remove material slots (in reverse order to avoid index shifting), popping from the mesh remaps the face indices
             for slot_idx in sorted(slots_to_remove, reverse=True):
-                if slot_idx < len(obj.material_slots):  # Safety check
-                    obj.active_material_index = slot_idx
-                    bpy.ops.object.material_slot_remove()
+                if slot_idx < len(obj.data.materials):  # Safety check
+                    obj.data.materials.pop(index=slot_idx)
                     if globals_and_threading.debug:
                         print(f"DEBUG: Removed material slot {slot_idx} from object '{obj.name}'")
 
@@ -512,6 +540,11 @@ class SCOrg_tools_blender():
 
     @staticmethod
     def remap_material_users():
+        for _ in __class__.iter_remap_material_users():
+            pass
+
+    @staticmethod
+    def iter_remap_material_users():
         # Regex pattern to detect material names with numeric suffixes
         suffix_pattern = re.compile(r"^(.+)\.(\d{3})$")
         
@@ -554,6 +587,7 @@ class SCOrg_tools_blender():
         # Batch process material reassignments
         mapping_items = list(material_mapping.items())
         for i, (duplicate_mat, original_mat) in enumerate(mapping_items):
+            yield
             ui_tools.progress_bar_popup("remap_materials", i, len(mapping_items), "Remapping .001 materials")
             
             # Only process if the duplicate material still exists
@@ -795,10 +829,17 @@ class SCOrg_tools_blender():
         """
         Fixes materials that have been imported due to different case in names.
         """
+        for _ in __class__.iter_fix_materials_case_sensitivity():
+            pass
+
+    @staticmethod
+    def iter_fix_materials_case_sensitivity():
+        """fix_materials_case_sensitivity as a generator, yielding before each material it works on."""
         # Get a list of material names instead of material objects
         material_names = list(bpy.data.materials.keys())
         
         for i, mat_name in enumerate(material_names):
+            yield
             ui_tools.progress_bar_popup("fix_mat_case", i, len(material_names), "Fixing mat case sensitivity")
             
             # Get fresh reference to the material
@@ -827,10 +868,17 @@ class SCOrg_tools_blender():
         Find all materials containing '_glass' (case insensitive) and set their 
         viewport display alpha to 0.3 for partial transparency in the viewport.
         """        
+        for _ in __class__.iter_set_glass_materials_transparent():
+            pass
+
+    @staticmethod
+    def iter_set_glass_materials_transparent():
+        """set_glass_materials_transparent as a generator, yielding before each material it works on."""
         # Get a list of material names instead of material objects
         material_names = list(bpy.data.materials.keys())
         
         for i, mat_name in enumerate(material_names):
+            yield
             ui_tools.progress_bar_popup("set_glass_transparent", i, len(material_names), "Setting glass to transparent")
             
             # Get fresh reference to the material
@@ -851,10 +899,17 @@ class SCOrg_tools_blender():
         """
         Fix materials that use stencil textures by ensuring they are set up correctly.
         """
+        for _ in __class__.iter_fix_stencil_materials():
+            pass
+
+    @staticmethod
+    def iter_fix_stencil_materials():
+        """fix_stencil_materials as a generator, yielding before each material it works on."""
         if globals_and_threading.debug: print("Fixing stencil materials.")
         # Iterate through all materials in the scene
         material_list = list(bpy.data.materials)
         for i, mat in enumerate(material_list):
+            yield
             ui_tools.progress_bar_popup("fix_stencil_materials", i, len(material_list), "Fixing stencil materials")
             # Check if material uses nodes
             if not mat.use_nodes or not mat.node_tree:
@@ -948,6 +1003,7 @@ class SCOrg_tools_blender():
         mesh_to_objects = {}
         
         # Make sure all objects are real (not instances) for exporting to 3DS MAX
+        import_utils.SCOrg_tools_import.make_component_instances_real()
         bpy.ops.object.select_all(action='SELECT')
         bpy.ops.object.duplicates_make_real()
         for obj in bpy.context.selected_objects:
@@ -1347,6 +1403,12 @@ class SCOrg_tools_blender():
         """
         Replace all _pom_decal materials in the scene with the 'scorg_pom' material.
         """       
+        for _ in __class__.iter_replace_pom_materials():
+            pass
+
+    @staticmethod
+    def iter_replace_pom_materials():
+        """replace_pom_materials as a generator, yielding before each material it works on."""
         pom_material = bpy.data.materials.get("scorg_pom")
         if not pom_material:
             pom_material = __class__.append_pom_material()
@@ -1364,6 +1426,7 @@ class SCOrg_tools_blender():
         # Iterate through all materials in the scene
         material_list = list(bpy.data.materials)
         for i, mat in enumerate(material_list):
+            yield
             ui_tools.progress_bar_popup("replace_pom_materials", i, len(material_list), "Replacing POM materials")
             # Check if material uses nodes
             if not mat.use_nodes or not mat.node_tree:
@@ -1610,9 +1673,15 @@ class SCOrg_tools_blender():
 
     @staticmethod
     def deduplicate_images():
+        for _ in __class__.iter_deduplicate_images():
+            pass
+
+    @staticmethod
+    def iter_deduplicate_images():
         images = {}
         image_list = list(bpy.data.images)
         for i, img in enumerate(image_list):
+            yield
             ui_tools.progress_bar_popup("deduplicate_images", i, len(image_list), "Deduplicating images")
             if not img.filepath in images.keys():
                 images[img.filepath] = img
@@ -1634,7 +1703,14 @@ class SCOrg_tools_blender():
         - De-duplicate images
         - Remove orphaned data blocks (images, materials, meshes, etc.)
         """
-        __class__.deduplicate_images()
+        for _ in __class__.iter_tidyup():
+            pass
+
+    @staticmethod
+    def iter_tidyup():
+        """tidyup as a generator, yielding between the images it de-duplicates and before the purge."""
+        yield from __class__.iter_deduplicate_images()
+        yield
         bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
     
     @staticmethod
@@ -1643,9 +1719,16 @@ class SCOrg_tools_blender():
         Set all engine flame materials to be transparent in the viewport.
         This is useful for engine flames that need to be rendered with transparency.
         """
+        for _ in __class__.iter_set_engine_flame_mat_transparent():
+            pass
+
+    @staticmethod
+    def iter_set_engine_flame_mat_transparent():
+        """set_engine_flame_mat_transparent as a generator, yielding before each material it works on."""
         if globals_and_threading.debug: print("Setting engine flame materials to transparent.")
         material_list = list(bpy.data.materials)
         for i, mat in enumerate(material_list):
+            yield
             ui_tools.progress_bar_popup("set_engine_flame_transparent", i, len(material_list), "Setting engine flame materials transparent")
             if 'engine_flame' in mat.name.lower() and mat.use_nodes:
                 # Find material output node
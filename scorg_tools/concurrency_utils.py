@@ -0,0 +1,188 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Adaptive worker limits for the extraction pipeline.
+# This module must not import bpy so it can be used from worker threads and standalone scripts.
+
+class AdaptiveLimiter:
+    """
+    A resizable semaphore for one pipeline stage (archive I/O, decompression or conversion).
+
+    In adaptive mode it hill-climbs: after each measurement window it compares the stage's
+    throughput with the previous window and keeps moving the limit in the same direction while
+    throughput improves, reverses when it drops, and holds when it is flat.
+    In fixed mode it is a plain semaphore of `initial` slots.
+    """
+
+    IMPROVEMENT = 1.05  # throughput must change by more than 5% to count as better or worse
+
+    def __init__(self, name, initial, minimum=1, maximum=None, adaptive=False):
+        self.name = name
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum if maximum is not None else initial)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.adaptive = adaptive
+        self.in_use = 0
+        self.condition = threading.Condition()
+        # Measurement state
+        self.direction = 1
+        self.last_rate = None
+        self.window_start = None
+        self.window_count = 0
+        self.window_bytes = 0
+        self.window_latency = 0.0
+        self.total_count = 0
+        self.total_busy = 0.0
+        self.history = []  # (limit, rate) per window, for the log
+
+    def acquire(self):
+        with self.condition:
+            while self.in_use >= self.limit:
+                self.condition.wait()
+            self.in_use += 1
+            if self.window_start is None:
+                self.window_start = time.perf_counter()
+
+    def release(self, elapsed=0.0, byte_count=0):
+        with self.condition:
+            self.in_use -= 1
+            self.total_count += 1
+            self.total_busy += elapsed
+            if self.adaptive:
+                self.window_count += 1
+                self.window_bytes += byte_count
+                self.window_latency += elapsed
+                # Measure over enough operations to see every slot finish a couple of times
+                if self.window_count >= max(4, self.limit * 2):
+                    self._adjust()
+            self.condition.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """
+        Hold one slot for the duration of the block. The block can set `meter['bytes']`
+        to report how much data it moved, which is used as the throughput measure.
+        """
+        self.acquire()
+        meter = {'bytes': 0}
+        start = time.perf_counter()
+        try:
+            yield meter
+        finally:
+            self.release(time.perf_counter() - start, meter['bytes'])
+
+    def _adjust(self):
+        now = time.perf_counter()
+        elapsed = max(now - self.window_start, 1e-6)
+        # Bytes per second when the stage reports sizes, otherwise operations per second
+        rate = (self.window_bytes or self.window_count) / elapsed
+        self.history.append((self.limit, rate))
+
+        if self.last_rate is not None:
+            if rate < self.last_rate / self.IMPROVEMENT:
+                # The last step made things worse, go back the other way
+                self.direction = -self.direction
+            elif rate <= self.last_rate * self.IMPROVEMENT:
+                # No real difference, stay where we are
+                self._reset_window(now, rate)
+                return
+        self.limit = min(max(self.limit + self.direction, self.minimum), self.maximum)
+        self._reset_window(now, rate)
+
+    def _reset_window(self, now, rate):
+        self.last_rate = rate
+        self.window_start = now
+        self.window_count = 0
+        self.window_bytes = 0
+        self.window_latency = 0.0
+
+    def describe(self):
+        """One line summary of where the limit ended up."""
+        average = (self.total_busy / self.total_count) if self.total_count else 0.0
+        mode = "auto" if self.adaptive else "fixed"
+        return f"{self.name}={self.limit} ({mode}, {self.minimum}-{self.maximum}, {self.total_count} ops, {average * 1000:.0f} ms avg)"
+
+
+class SCOrg_tools_concurrency():
+    MEMORY_PER_IO_SLOT = 256 * 1024 * 1024  # worst case in-flight data per I/O slot (largest split textures)
+    MAX_THREADS = 32
+
+    @staticmethod
+    def get_available_memory():
+        """Return available physical memory in bytes, or None if it cannot be determined."""
+        try:
+            import psutil
+            return psutil.virtual_memory().available
+        except ImportError:
+            pass
+        try:
+            with open('/proc/meminfo', 'r') as f:
+                for line in f:
+                    if line.startswith('MemAvailable:'):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        if os.name == 'nt':
+            try:
+                import ctypes
+
+                class MEMORYSTATUSEX(ctypes.Structure):
+                    _fields_ = [
+                        ('dwLength', ctypes.c_ulong), ('dwMemoryLoad', ctypes.c_ulong),
+                        ('ullTotalPhys', ctypes.c_ulonglong), ('ullAvailPhys', ctypes.c_ulonglong),
+                        ('ullTotalPageFile', ctypes.c_ulonglong), ('ullAvailPageFile', ctypes.c_ulonglong),
+                        ('ullTotalVirtual', ctypes.c_ulonglong), ('ullAvailVirtual', ctypes.c_ulonglong),
+                        ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+                    ]
+                status = MEMORYSTATUSEX()
+                status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+                if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                    return status.ullAvailPhys
+            except Exception:
+                pass
+        return None
+
+    @staticmethod
+    def create_limiters(max_threads, auto):
+        """
+        Create the per-stage limiters for one extraction batch.
+
+        Args:
+            max_threads (int): The max_extraction_threads preference, used as-is when auto is off
+            auto (bool): Tune each stage between 1 and its CPU/memory bound instead
+
+        Returns:
+            tuple: (thread_count, {'io': limiter, 'decompress': limiter, 'convert': limiter})
+        """
+        if not auto:
+            return max_threads, {
+                'io': AdaptiveLimiter('io', max_threads),
+                'decompress': AdaptiveLimiter('decompress', max_threads),
+                'convert': AdaptiveLimiter('convert', max_threads),
+            }
+
+        cpu_count = os.cpu_count() or 4
+        io_max = min(__class__.MAX_THREADS, cpu_count * 2)
+        available_memory = __class__.get_available_memory()
+        if available_memory:
+            io_max = max(1, min(io_max, available_memory // __class__.MEMORY_PER_IO_SLOT))
+        limiters = {
+            # Archive reads and extract dir writes, can overlap beyond the core count but thrash on HDDs
+            'io': AdaptiveLimiter('io', min(4, io_max), maximum=io_max, adaptive=True),
+            # CPU bound work in worker processes
+            'decompress': AdaptiveLimiter('decompress', max(1, cpu_count // 2), maximum=cpu_count, adaptive=True),
+            # Converter subprocesses, each mostly single threaded
+            'convert': AdaptiveLimiter('convert', max(1, cpu_count // 2), maximum=cpu_count, adaptive=True),
+        }
+        # Enough threads that every stage can reach its upper bound at once
+        thread_count = min(__class__.MAX_THREADS, max(limiter.maximum for limiter in limiters.values()))
+        return thread_count, limiters
+
+    @staticmethod
+    def describe_limiters(limiters):
+        """Summary line for the log and extraction report."""
+        available_memory = __class__.get_available_memory()
+        memory_text = f", {available_memory / (1024 ** 3):.1f} GB free" if available_memory else ""
+        return f"Concurrency: {', '.join(limiter.describe() for limiter in limiters.values())} (cpu {os.cpu_count()}{memory_text})"
@@ -0,0 +1,396 @@
+import collections
+import concurrent.futures
+import importlib
+import math
+import multiprocessing
+import os
+import xml.etree.ElementTree as ET
+from multiprocessing import shared_memory
+
+# Streaming parser for the Collada subset cgf-converter writes: node hierarchy with matrices,
+# triangle/polylist meshes with positions, normals and UVs, and material bindings.
+# This module must not import bpy so it can be used from worker processes, numpy is optional here.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+SHARED_ARRAY = '__shared_array__'  # Marks an array moved into shared memory: (SHARED_ARRAY, offset, dtype, shape)
+SHARED_ALIGNMENT = 16
+
+
+class SCOrg_tools_dae():
+    _held_blocks = {}  # In a worker process: shared memory blocks kept open until the main process has read them
+
+    @staticmethod
+    def is_available():
+        return np is not None
+
+    @staticmethod
+    def _tag(element):
+        """Tag without the Collada namespace."""
+        tag = element.tag
+        return tag[tag.index('}') + 1:] if tag[0] == '{' else tag
+
+    @staticmethod
+    def _ref(url):
+        return url[1:] if url and url.startswith('#') else url
+
+    @staticmethod
+    def parse(path):
+        """
+        Parse a .dae file into plain Python/numpy data.
+
+        Returns:
+            dict: {
+                'up_axis': 'Z_UP' | 'Y_UP' | 'X_UP',
+                'materials': {material_id: name},
+                'geometries': {geometry_id: {'name', 'positions' (N,3), 'vertex_indices' (L,),
+                               'loop_starts' (P,), 'loop_totals' (P,), 'normals' (L,3) or None,
+                               'uvs' (L,2) or None, 'material_symbols' [str], 'material_indices' (P,)}},
+                'nodes': [{'name', 'matrix' (4,4), 'geometry' id or None, 'materials' {symbol: material_id},
+                           'children' [...]}],
+                'unsupported': reason string if the file uses features this parser doesn't handle, else None,
+            }
+        """
+        result = {'up_axis': 'Y_UP', 'materials': {}, 'geometries': {}, 'nodes': [], 'unsupported': None}
+        sources = {}  # source id -> (N, stride) array
+        vertices = {}  # vertices id -> position source id
+        geometry = None
+        primitives = []
+        node_stack = []
+        tag_of = __class__._tag
+
+        for event, element in ET.iterparse(str(path), events=('start', 'end')):
+            tag = tag_of(element)
+            if event == 'start':
+                if tag == 'geometry':
+                    geometry = {'id': element.get('id'), 'name': element.get('name') or element.get('id')}
+                    sources = {}
+                    vertices = {}
+                    primitives = []
+                elif tag == 'node':
+                    if element.get('type') == 'JOINT':
+                        result['unsupported'] = "skeleton joints"
+                    node = {'name': element.get('name') or element.get('id') or 'node', 'matrix': np.identity(4),
+                            'geometry': None, 'materials': {}, 'children': []}
+                    (node_stack[-1]['children'] if node_stack else result['nodes']).append(node)
+                    node_stack.append(node)
+                elif tag in ('controller', 'instance_controller'):
+                    result['unsupported'] = "skinned meshes"
+                continue
+
+            # 'end' events, the element is complete
+            if tag == 'up_axis':
+                result['up_axis'] = (element.text or 'Y_UP').strip()
+            elif tag == 'material' and element.get('id') and not node_stack:
+                result['materials'][element.get('id')] = element.get('name') or element.get('id')
+            elif tag == 'source' and geometry is not None:
+                float_array = next((child for child in element if tag_of(child) == 'float_array'), None)
+                accessor = element.find('.//{*}accessor')
+                if float_array is not None:
+                    stride = int(accessor.get('stride', 1)) if accessor is not None else 1
+                    values = np.fromstring(float_array.text or '', dtype=np.float32, sep=' ')
+                    sources[element.get('id')] = values[:len(values) - len(values) % stride].reshape(-1, stride)
+                element.clear()
+            elif tag == 'vertices' and geometry is not None:
+                for child in element:
+                    if tag_of(child) == 'input' and child.get('semantic') == 'POSITION':
+                        vertices[element.get('id')] = __class__._ref(child.get('source'))
+            elif tag in ('triangles', 'polylist', 'polygons') and geometry is not None:
+                if tag == 'polygons':
+                    result['unsupported'] = "<polygons> primitives"
+                else:
+                    primitives.append(__class__._parse_primitive(element, tag))
+                element.clear()
+            elif tag == 'geometry':
+                result['geometries'][geometry['id']] = __class__._build_geometry(geometry, primitives, sources, vertices)
+                geometry = None
+                element.clear()
+            elif tag in ('matrix', 'translate', 'rotate', 'scale') and node_stack and element.text:
+                node_stack[-1]['matrix'] = node_stack[-1]['matrix'] @ __class__._transform(tag, element.text)
+            elif tag == 'instance_geometry' and node_stack:
+                node_stack[-1]['geometry'] = __class__._ref(element.get('url'))
+                for instance_material in element.iter():
+                    if tag_of(instance_material) == 'instance_material':
+                        node_stack[-1]['materials'][instance_material.get('symbol')] = __class__._ref(instance_material.get('target'))
+            elif tag == 'node':
+                node_stack.pop()
+                element.clear()
+        return result
+
+    @staticmethod
+    def _parse_primitive(element, tag):
+        """Read one <triangles>/<polylist> element into its inputs and index table."""
+        inputs = []
+        index_text = ''
+        vcount_text = None
+        for child in element:
+            child_tag = __class__._tag(child)
+            if child_tag == 'input':
+                inputs.append((child.get('semantic'), __class__._ref(child.get('source')), int(child.get('offset', 0)), int(child.get('set', 0))))
+            elif child_tag == 'p':
+                index_text = child.text or ''
+            elif child_tag == 'vcount':
+                vcount_text = child.text or ''
+        stride = max((offset for _, _, offset, _ in inputs), default=0) + 1
+        indices = np.fromstring(index_text, dtype=np.int64, sep=' ')
+        indices = indices[:len(indices) - len(indices) % stride].reshape(-1, stride)
+        if tag == 'triangles' or vcount_text is None:
+            loop_totals = np.full(len(indices) // 3, 3, dtype=np.int64)
+        else:
+            loop_totals = np.fromstring(vcount_text, dtype=np.int64, sep=' ')
+        return {'material': element.get('material'), 'inputs': inputs, 'indices': indices, 'loop_totals': loop_totals}
+
+    @staticmethod
+    def _build_geometry(geometry, primitives, sources, vertices):
+        """Concatenate a geometry's primitives into per-loop arrays, one material index per polygon."""
+        positions = None
+        vertex_indices, normals, uvs, loop_totals, material_indices = [], [], [], [], []
+        material_symbols = []
+        has_normals = all(any(semantic == 'NORMAL' for semantic, _, _, _ in p['inputs']) for p in primitives)
+        has_uvs = all(any(semantic == 'TEXCOORD' for semantic, _, _, _ in p['inputs']) for p in primitives)
+
+        for primitive in primitives:
+            by_semantic = {}
+            for semantic, source, offset, uv_set in primitive['inputs']:
+                # First input of each kind wins (UV set 0)
+                by_semantic.setdefault(semantic, (source, offset))
+            if 'VERTEX' not in by_semantic:
+                continue
+            vertex_source, vertex_offset = by_semantic['VERTEX']
+            primitive_positions = sources.get(vertices.get(vertex_source, vertex_source))
+            if primitive_positions is None:
+                continue
+            if positions is None:
+                positions = primitive_positions[:, :3]
+
+            indices = primitive['indices']
+            loop_count = int(primitive['loop_totals'].sum())
+            indices = indices[:loop_count]
+            vertex_indices.append(indices[:, vertex_offset])
+            if has_normals:
+                normal_source, normal_offset = by_semantic['NORMAL']
+                normals.append(sources[normal_source][:, :3][indices[:, normal_offset]])
+            if has_uvs:
+                uv_source, uv_offset = by_semantic['TEXCOORD']
+                uvs.append(sources[uv_source][:, :2][indices[:, uv_offset]])
+            symbol = primitive['material']
+            if symbol not in material_symbols:
+                material_symbols.append(symbol)
+            loop_totals.append(primitive['loop_totals'])
+            material_indices.append(np.full(len(primitive['loop_totals']), material_symbols.index(symbol), dtype=np.int32))
+
+        if positions is None:
+            positions = np.zeros((0, 3), dtype=np.float32)
+        loop_totals = np.concatenate(loop_totals) if loop_totals else np.zeros(0, dtype=np.int64)
+        loop_starts = np.zeros(len(loop_totals), dtype=np.int64)
+        if len(loop_totals):
+            np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+        return {
+            'name': geometry['name'],
+            'positions': np.ascontiguousarray(positions, dtype=np.float32),
+            'vertex_indices': np.concatenate(vertex_indices).astype(np.int32) if vertex_indices else np.zeros(0, dtype=np.int32),
+            'loop_starts': loop_starts.astype(np.int32),
+            'loop_totals': loop_totals.astype(np.int32),
+            'normals': np.concatenate(normals).astype(np.float32) if has_normals and normals else None,
+            'uvs': np.concatenate(uvs).astype(np.float32) if has_uvs and uvs else None,
+            'material_symbols': material_symbols,
+            'material_indices': np.concatenate(material_indices) if material_indices else np.zeros(0, dtype=np.int32),
+        }
+
+    @staticmethod
+    def _transform(tag, text):
+        """4x4 matrix for one Collada transform element."""
+        values = [float(v) for v in text.split()]
+        matrix = np.identity(4)
+        if tag == 'matrix' and len(values) == 16:
+            matrix = np.array(values, dtype=np.float64).reshape(4, 4)  # Collada matrices are row major
+        elif tag == 'translate' and len(values) == 3:
+            matrix[:3, 3] = values
+        elif tag == 'scale' and len(values) == 3:
+            matrix[0, 0], matrix[1, 1], matrix[2, 2] = values
+        elif tag == 'rotate' and len(values) == 4:
+            x, y, z, angle = values
+            length = math.sqrt(x * x + y * y + z * z) or 1.0
+            x, y, z = x / length, y / length, z / length
+            c, s = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+            t = 1 - c
+            matrix[:3, :3] = [
+                [t * x * x + c, t * x * y - s * z, t * x * z + s * y],
+                [t * x * y + s * z, t * y * y + c, t * y * z - s * x],
+                [t * x * z - s * y, t * y * z + s * x, t * z * z + c],
+            ]
+        return matrix
+
+    @staticmethod
+    def get_up_axis_matrix(up_axis):
+        """Rotation that brings a file's up axis to Blender's Z up."""
+        matrix = np.identity(4)
+        if up_axis == 'Y_UP':
+            matrix[:3, :3] = [[1, 0, 0], [0, 0, -1], [0, 1, 0]]
+        elif up_axis == 'X_UP':
+            matrix[:3, :3] = [[0, -1, 0], [1, 0, 0], [0, 0, 1]]
+        return matrix
+
+    @staticmethod
+    def count(parsed):
+        """(nodes, geometries, polygons) in a parsed file, for logging."""
+        def walk(nodes):
+            return sum(1 + walk(node['children']) for node in nodes)
+        polygons = sum(len(geometry['loop_totals']) for geometry in parsed['geometries'].values())
+        return walk(parsed['nodes']), len(parsed['geometries']), polygons
+
+    @staticmethod
+    def parse_to_shared_memory(path, release=()):
+        """
+        Worker process entry point: parse a .dae and move its geometry arrays into one shared memory block.
+
+        The block stays open here until a later call lists it in `release`, because on Windows it is freed
+        as soon as no process has it open. The main process reads it with from_shared_memory.
+
+        Returns:
+            tuple: (block name, or None if there are no arrays, parsed dict with SHARED_ARRAY descriptors
+            in place of the geometry arrays, names from `release` this process closed)
+        """
+        released = []
+        for name in release:
+            block = __class__._held_blocks.pop(name, None)
+            if block is not None:
+                block.close()
+                released.append(name)
+
+        parsed = __class__.parse(path)
+        arrays = []
+        size = 0
+        for geometry in parsed['geometries'].values():
+            for key, value in geometry.items():
+                if isinstance(value, np.ndarray) and value.nbytes:
+                    arrays.append((geometry, key, value, size))
+                    size += -(-value.nbytes // SHARED_ALIGNMENT) * SHARED_ALIGNMENT
+        if not arrays:
+            return None, parsed, released
+
+        block = shared_memory.SharedMemory(create=True, size=size)
+        for geometry, key, value, offset in arrays:
+            np.ndarray(value.shape, dtype=value.dtype, buffer=block.buf, offset=offset)[...] = value
+            geometry[key] = (SHARED_ARRAY, offset, value.dtype.str, value.shape)
+        __class__._held_blocks[block.name] = block
+        return block.name, parsed, released
+
+    @staticmethod
+    def from_shared_memory(name, parsed):
+        """Copy the arrays of a parse_to_shared_memory result back out of its block, and unlink the block."""
+        if name is None:
+            return parsed
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            for geometry in parsed['geometries'].values():
+                for key, value in geometry.items():
+                    if isinstance(value, tuple) and value and value[0] == SHARED_ARRAY:
+                        _, offset, dtype, shape = value
+                        geometry[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset).copy()
+        finally:
+            block.close()
+            block.unlink()
+        return parsed
+
+    @staticmethod
+    def get_process_entry_point():
+        """
+        Return parse_to_shared_memory from the top level `dae_utils` module rather than from the
+        scorg_tools package, so worker processes can unpickle it without importing bpy.
+        """
+        try:
+            module = importlib.import_module('dae_utils')
+            return module.SCOrg_tools_dae.parse_to_shared_memory
+        except ImportError:
+            return __class__.parse_to_shared_memory
+
+
+class DaePreparser:
+    """
+    Parses the .dae files an import is about to need in worker processes, a few files ahead of it.
+    take() returns a file's parsed data, or None if the caller should parse it itself: a file that
+    was never queued, failed, or hasn't started yet when it's needed (it is cancelled rather than
+    waited for behind the rest of the queue).
+    """
+
+    def __init__(self, processes, window=None):
+        self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'))
+        self.entry = SCOrg_tools_dae.get_process_entry_point()
+        self.window = window or processes * 2  # parsed files waiting in shared memory at most
+        self.pending = collections.deque()  # (key, path) not submitted yet, in import order
+        self.futures = {}  # key -> future
+        self.release = set()  # blocks already read, for the workers to close
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(path):
+        return os.path.normcase(os.path.abspath(str(path)))
+
+    def add(self, paths):
+        for path in paths:
+            self.pending.append((__class__.get_key(path), str(path)))
+        self._fill()
+
+    def _fill(self):
+        while len(self.futures) < self.window and self.pending:
+            key, path = self.pending.popleft()
+            if key in self.futures:
+                continue
+            try:
+                self.futures[key] = self.executor.submit(self.entry, path, sorted(self.release))
+            except concurrent.futures.process.BrokenProcessPool:
+                # A worker died, everything left is parsed on demand
+                self.pending.clear()
+
+    def take(self, path):
+        key = __class__.get_key(path)
+        future = self.futures.pop(key, None)
+        if future is None:
+            self.pending = collections.deque(item for item in self.pending if item[0] != key)
+            self.misses += 1
+            return None
+        if future.cancel():
+            self.misses += 1
+            self._fill()
+            return None
+        try:
+            name, parsed, released = future.result()
+            parsed = SCOrg_tools_dae.from_shared_memory(name, parsed)
+        except Exception as e:
+            print(f"ERROR: Pre-parsing {path} failed: {e}")
+            self.misses += 1
+            self._fill()
+            return None
+        self.release.difference_update(released)
+        if name is not None:
+            self.release.add(name)
+        self.hits += 1
+        self._fill()
+        return parsed
+
+    def close(self):
+        """Stop queued work, and unlink the blocks of files that were parsed but never taken."""
+        self.pending.clear()
+        for future in self.futures.values():
+            future.cancel()
+        self.executor.shutdown(wait=True)
+        for future in self.futures.values():
+            if future.cancelled() or future.exception() is not None:
+                continue
+            name = future.result()[0]
+            if name is not None:
+                try:
+                    block = shared_memory.SharedMemory(name=name)
+                    block.close()
+                    block.unlink()
+                except FileNotFoundError:
+                    pass
+        self.futures = {}
+
+    def describe(self):
+        return f"{self.hits} files parsed ahead in worker processes, {self.misses} parsed on demand"
@@ -0,0 +1,164 @@
+import re
+import struct
+
+# Helpers for Star Citizen's split DDS textures.
+# This module must not import bpy so it can be used from worker threads and processes.
+
+class SCOrg_tools_dds():
+    # Matches "<path>.dds.N", the numbered mip parts that sit next to a split .dds header file
+    SPLIT_PART_RE = re.compile(r"^(.*\.dds)\.(\d+)$", re.IGNORECASE)
+    DDS_MAGIC = b'DDS '
+    DDS_HEADER_SIZE = 128  # magic + DDS_HEADER
+    DX10_HEADER_SIZE = 20
+    WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+    DXGI_FORMAT_BC5_SNORM = 84
+    DDSD_PITCH = 0x8
+    DDSD_LINEARSIZE = 0x80000
+    DDSCAPS2_CUBEMAP = 0x200
+    DDS_RESOURCE_MISC_TEXTURECUBE = 0x4
+    # Legacy FourCC codes texconv reports as BC5_SNORM
+    BC5_SNORM_FOURCCS = (b'BC5S',)
+
+    @staticmethod
+    def build_split_part_index(filelist):
+        """
+        Build a lookup of split DDS parts from a single pass over the archive listing.
+
+        Args:
+            filelist: Iterable of P4K info objects (anything with a .filename)
+
+        Returns:
+            dict: lowercase base .dds path -> list of info objects, largest mip part (highest N) first
+        """
+        index = {}
+        for info in filelist:
+            match = __class__.SPLIT_PART_RE.match(info.filename.replace("\\", "/"))
+            if match:
+                index.setdefault(match.group(1).lower(), []).append((int(match.group(2)), info))
+
+        for base, parts in index.items():
+            parts.sort(key=lambda part: part[0], reverse=True)
+            index[base] = [info for _, info in parts]
+        return index
+
+    @staticmethod
+    def header_size(data):
+        """
+        Return the size of the DDS header (including the DX10 extension if present)
+        at the start of data, or 0 if data is not a DDS file.
+        """
+        if len(data) < __class__.DDS_HEADER_SIZE or data[:4] != __class__.DDS_MAGIC:
+            return 0
+        four_cc = data[84:88]
+        if four_cc == b'DX10':
+            return __class__.DDS_HEADER_SIZE + __class__.DX10_HEADER_SIZE
+        return __class__.DDS_HEADER_SIZE
+
+    @staticmethod
+    def get_format(data):
+        """
+        Read the pixel format from a DDS header.
+
+        Returns:
+            tuple: (four_cc, dxgi_format) where four_cc is the raw FourCC bytes and
+                   dxgi_format is the DX10 DXGI_FORMAT value (None without a DX10 header),
+                   or (None, None) if data is not a DDS file
+        """
+        header_len = __class__.header_size(data)
+        if not header_len:
+            return None, None
+        four_cc = bytes(data[84:88])
+        dxgi_format = None
+        if header_len > __class__.DDS_HEADER_SIZE and len(data) >= header_len:
+            dxgi_format = struct.unpack_from('<I', data, __class__.DDS_HEADER_SIZE)[0]
+        return four_cc, dxgi_format
+
+    @staticmethod
+    def is_bc5_snorm(data):
+        """Return True if the DDS header at the start of data describes a BC5_SNORM texture."""
+        four_cc, dxgi_format = __class__.get_format(data)
+        if dxgi_format is not None:
+            return dxgi_format == __class__.DXGI_FORMAT_BC5_SNORM
+        return four_cc in __class__.BC5_SNORM_FOURCCS
+
+    @staticmethod
+    def get_mip_skip(data, part_count, mip_cap):
+        """
+        Work out how many of the largest split parts can be dropped for a mip cap.
+        Only whole split parts are skipped, the mips in the base file are always kept.
+        Cubemaps and texture arrays store their faces interleaved, so they are never capped.
+
+        Returns:
+            int: Number of parts to skip (0 if the texture must be written at full resolution)
+        """
+        if mip_cap <= 0 or part_count <= 0:
+            return 0
+        header_len = __class__.header_size(data)
+        if not header_len:
+            return 0
+        caps2 = struct.unpack_from('<I', data, 112)[0]
+        if caps2 & __class__.DDSCAPS2_CUBEMAP:
+            return 0
+        if header_len > __class__.DDS_HEADER_SIZE:
+            misc_flag, array_size = struct.unpack_from('<II', data, 136)
+            if misc_flag & __class__.DDS_RESOURCE_MISC_TEXTURECUBE or array_size > 1:
+                return 0
+        mip_count = struct.unpack_from('<I', data, 28)[0]
+        return max(0, min(mip_cap, part_count, mip_count - 1))
+
+    @staticmethod
+    def capped_header(data, skip):
+        """
+        Return a copy of the DDS header with the dimensions, mip count and pitch/linear size
+        reduced to describe the texture with its largest `skip` mips removed.
+        """
+        header = bytearray(data[:__class__.header_size(data)])
+        if skip <= 0:
+            return bytes(header)
+        flags, height, width, pitch, depth, mip_count = struct.unpack_from('<IIIIII', header, 8)
+        height = max(1, height >> skip)
+        width = max(1, width >> skip)
+        mip_count = max(1, mip_count - skip)
+        if flags & __class__.DDSD_LINEARSIZE:
+            pitch = max(8, pitch >> (2 * skip))
+        elif flags & __class__.DDSD_PITCH:
+            pitch = max(1, pitch >> skip)
+        struct.pack_into('<IIIII', header, 12, height, width, pitch, depth, mip_count)
+        return bytes(header)
+
+    @staticmethod
+    def write_assembled(base_content, part_writers, dst, skip=0):
+        """
+        Write a complete DDS file in one pass: header, split mip parts (largest first)
+        and then the small mips stored in the base file.
+
+        Args:
+            base_content (bytes): Content of the base .dds file (header + smallest mips)
+            part_writers: Iterable of callables, one per split part ordered largest mip first,
+                each called as writer(dst) to write its part at dst's current position and
+                return the number of bytes it covers
+            dst: Writable binary file object
+            skip (int): Number of the largest parts to leave out (see get_mip_skip)
+
+        Returns:
+            int: Number of bytes written
+        """
+        header_len = __class__.header_size(base_content)
+        view = memoryview(base_content)
+        written = dst.write(__class__.capped_header(base_content, skip))
+        for write_part in list(part_writers)[skip:]:
+            written += write_part(dst)
+        written += dst.write(view[header_len:])
+        return written
+
+    @staticmethod
+    def copy_part(open_part, dst):
+        """Copy one split part into dst using large reads. open_part returns a readable file object."""
+        written = 0
+        with open_part() as src:
+            while True:
+                chunk = src.read(__class__.WRITE_BUFFER_SIZE)
+                if not chunk:
+                    break
+                written += dst.write(chunk)
+        return written
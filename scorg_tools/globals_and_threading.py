@@ -1,6 +1,8 @@
 import bpy
+import queue
 import threading
 import time
+from types import SimpleNamespace
 from pathlib import Path
 from scdatatools.sc import StarCitizen
 from scdatatools.sc.localization import SCLocalization
@@ -21,6 +23,7 @@ imported_record = None
 sc = None
 localizer = None
 _loading_thread = None # Global to hold the loading thread instance
+_extraction_thread = None # Global to hold the background extraction thread instance
 debug = False
 extraction_started = False
 missing_files = set() # Global set to store missing files for popup display
@@ -159,6 +162,124 @@ def load_p4k_with_progress(p4k_path, addon_prefs, progress_callback):
         progress_callback(f"Failed to load: {str(e)}", 0, 100)
         return False
 
+class ExtractMissingThread(threading.Thread):
+    """
+    Runs extract_missing_files off Blender's main thread.
+    Progress and results are posted to a message queue that check_extraction_status drains on the main thread.
+    file_list_text can also be a callable, called on the thread as file_list_text(progress_callback), that
+    works out the list to extract, for lists that are too slow to build on the main thread.
+    """
+    def __init__(self, file_list_text, addon_prefs, mip_cap=None, on_complete=None, on_geometry_ready=None, on_error=None):
+        threading.Thread.__init__(self, daemon=True)
+        self.file_list_text = file_list_text
+        # Snapshot the preferences, bpy properties must not be read from this thread
+        self.addon_prefs = SimpleNamespace(**{
+            name: getattr(addon_prefs, name)
+            for name in addon_prefs.bl_rna.properties.keys() if name != 'rna_type'
+        })
+        self.mip_cap = mip_cap
+        self.on_complete = on_complete # called on the main thread with (success_count, fail_count, report_lines)
+        self.on_geometry_ready = on_geometry_ready # called once on the main thread when geometry is extracted
+        self.geometry_ready_sent = False
+        self.on_error = on_error # called on the main thread with the error message if the extraction fails
+        self.messages = queue.Queue()
+
+    def run(self):
+        from . import import_utils
+        progress_callback = lambda current, total, message: self.messages.put(('progress', current, total, message))
+        try:
+            file_list_text = self.file_list_text
+            if callable(file_list_text):
+                file_list_text = file_list_text(progress_callback)
+            result = import_utils.SCOrg_tools_import.extract_missing_files(
+                file_list_text,
+                self.addon_prefs,
+                mip_cap=self.mip_cap,
+                on_geometry_ready=lambda: self.messages.put(('geometry_ready',)),
+                progress_callback=progress_callback,
+            )
+            self.messages.put(('done', result))
+        except Exception as e:
+            if debug: print(f"DEBUG: Background extraction failed: {e}")
+            self.messages.put(('error', str(e)))
+
+
+def start_extraction(file_list_text, addon_prefs, mip_cap=None, on_complete=None, on_geometry_ready=None, on_error=None):
+    """
+    Start extracting files in the background. Returns False if an extraction is already running.
+    on_complete, on_geometry_ready and on_error are called on the main thread.
+    """
+    global _extraction_thread
+    if _extraction_thread and _extraction_thread.is_alive():
+        misc_utils.SCOrg_tools_misc.error("An extraction is already running, please wait for it to finish.")
+        return False
+    _extraction_thread = ExtractMissingThread(file_list_text, addon_prefs, mip_cap=mip_cap, on_complete=on_complete, on_geometry_ready=on_geometry_ready, on_error=on_error)
+    _extraction_thread.start()
+    if not bpy.app.timers.is_registered(check_extraction_status):
+        bpy.app.timers.register(check_extraction_status, first_interval=0.1)
+    return True
+
+
+def is_extraction_running():
+    return _extraction_thread is not None and _extraction_thread.is_alive()
+
+
+def notify_geometry_ready(thread):
+    """
+    Call the thread's on_geometry_ready once. Also called when the extraction ends, so an import
+    waiting on it carries on even if the batch had no geometry, failed or never reached that point.
+    """
+    if thread.geometry_ready_sent:
+        return
+    thread.geometry_ready_sent = True
+    if thread.on_geometry_ready:
+        thread.on_geometry_ready()
+
+
+def check_extraction_status():
+    """Timer: drain the extraction thread's message queue on the main thread."""
+    global _extraction_thread
+    thread = _extraction_thread
+    if thread is None:
+        return None
+
+    while True:
+        try:
+            message = thread.messages.get_nowait()
+        except queue.Empty:
+            break
+        kind = message[0]
+        if kind == 'progress':
+            _, current, total, text = message
+            ui_tools.progress_bar_popup("extract_missing_files", current, total, text)
+        elif kind == 'geometry_ready':
+            notify_geometry_ready(thread)
+        elif kind == 'done':
+            ui_tools.close_progress_bar_popup("extract_missing_files")
+            _extraction_thread = None
+            notify_geometry_ready(thread)
+            if thread.on_complete:
+                thread.on_complete(*message[1])
+            return None
+        elif kind == 'error':
+            ui_tools.close_progress_bar_popup("extract_missing_files")
+            _extraction_thread = None
+            misc_utils.SCOrg_tools_misc.error(message[1])
+            notify_geometry_ready(thread)
+            if thread.on_error:
+                thread.on_error(message[1])
+            return None
+
+    if not thread.is_alive() and thread.messages.empty():
+        # Thread ended without posting a result
+        ui_tools.close_progress_bar_popup("extract_missing_files")
+        _extraction_thread = None
+        notify_geometry_ready(thread)
+        if thread.on_error:
+            thread.on_error("Extraction ended without a result")
+        return None
+    return 0.1 # Keep the timer active
+
 def show_missing_files_popup():
     """Show a popup with the list of missing files using ui_tools."""
     global missing_files
@@ -7,6 +7,7 @@ import typing
 import re
 import subprocess
 import time
+import threading
 import shutil
 # Import globals
 from . import globals_and_threading
@@ -14,6 +15,13 @@ from . import misc_utils # For SCOrg_tools_misc.error, get_ship_record, select_b
 from . import ui_tools
 from . import blender_utils # For SCOrg_tools_blender.fix_modifiers
 from . import tint_utils # For SCOrg_tools_tint.get_tint_pallets
+from . import dds_utils # For SCOrg_tools_dds split texture assembly
+from . import texture_utils # For SCOrg_tools_texture built-in BCn decoder
+from . import p4k_utils # For SCOrg_tools_p4k per-thread archive handles
+from . import concurrency_utils # For SCOrg_tools_concurrency extraction stage limits
+from . import texconv_utils # For batched texconv runs
+from . import lock_utils # For SCOrg_tools_lock shared extract_dir locking
+from . import dae_utils # For SCOrg_tools_dae native Collada parsing
 
 # CGF Converter constants
 CGF_CONVERTER_DEFAULT_OPTS = (
@@ -22,6 +30,59 @@ CGF_CONVERTER_DEFAULT_OPTS = (
 CGF_CONVERTER = shutil.which("cgf-converter")
 CGF_CONVERTER_TIMEOUT = 5 * 60  # 5 minutes timeout
 
+class HardpointIndex:
+    """
+    Hardpoint empties by the names a loadout entry can match them with, so an entry is matched with
+    a dict lookup instead of testing every empty. An object is listed under its name and orig_name,
+    each with and without a Blender ".001" suffix, which is exactly what matches_blender_name accepts.
+    Keys are checked again on lookup, so renamed or deleted objects never match under an old name.
+    """
+
+    def __init__(self, objects=()):
+        self.by_key = {}
+        self.order = {}  # object pointer -> position, the first match in the original list wins
+        for obj in objects:
+            self.add(obj)
+
+    @staticmethod
+    def get_keys(obj):
+        keys = set()
+        for name in (obj.name, obj.get('orig_name', '')):
+            if name:
+                name = str(name)
+                keys.add(name)
+                keys.add(re.sub(r'\.\d+$', '', name))
+        return keys
+
+    def __contains__(self, obj):
+        return obj.as_pointer() in self.order
+
+    def add(self, obj):
+        """Add an object, or add the keys of an object already listed under its current names."""
+        pointer = obj.as_pointer()
+        if pointer not in self.order:
+            self.order[pointer] = len(self.order)
+        for key in __class__.get_keys(obj):
+            objects = self.by_key.setdefault(key, [])
+            if not any(existing.as_pointer() == pointer for existing in objects):
+                objects.append(obj)
+
+    def find(self, name, predicate=None, sort_key=None):
+        """The first object that still matches `name` (and the predicate), or None."""
+        best = None
+        best_order = None
+        for obj in self.by_key.get(name, ()):
+            try:
+                if name not in __class__.get_keys(obj) or (predicate and not predicate(obj)):
+                    continue
+                order = sort_key(obj) if sort_key else self.order[obj.as_pointer()]
+            except ReferenceError:
+                continue  # Removed from the file since it was indexed
+            if best is None or order < best_order:
+                best, best_order = obj, order
+        return best
+
+
 class SCOrg_tools_import():
     item_name = None
     item_guid = None
@@ -33,9 +94,23 @@ class SCOrg_tools_import():
     tint_palette_node_group_name = None
     default_tint_guid = None
     imported_guid_objects = {}
+    scene_hardpoint_index = None  # HardpointIndex of every empty in the file, built on first use
+    hardpoint_index_stack = []  # HardpointIndex of each hierarchy level being imported
+    staged_selection = []  # objects the last import_dae_staged left selected
     skip_imported_files = {}
     INCLUDE_HARDPOINTS = [] # all
     _cached_mtl_files = None  # Cache for p4k.search results
+    _cached_p4k_lookup = None  # (p4k, lookup) for the dependency resolver
+    _cached_dds_part_index = None  # (p4k, index) of split DDS mip parts
+    # Extraction queue order, lower runs first
+    EXTRACTION_PRIORITY_GEOMETRY = 0
+    EXTRACTION_PRIORITY_MATERIAL = 1
+    EXTRACTION_PRIORITY_OTHER = 2
+    EXTRACTION_PRIORITY_TEXTURE = 3
+    GEOMETRY_CACHE_DIR_NAME = "scorg_geometry_cache"
+    INSTANCE_LIBRARY_NAME = "SCOrg_component_instances"
+    instance_collections = {}  # guid -> collection holding the component for collection-instance repeats
+    dae_preparser = None  # dae_utils.DaePreparser while an import is running with pre-parsing on
 
     @staticmethod
     def init():
@@ -150,8 +225,9 @@ class SCOrg_tools_import():
             return None
 
     @staticmethod
-    def replace_selected_mesh_with_empties():
-        for obj in list(bpy.context.selected_objects):
+    def replace_selected_mesh_with_empties(objects=None):
+        """Replace the mesh objects in `objects` (by default the selected objects) with empties of the same name."""
+        for obj in list(objects if objects is not None else bpy.context.selected_objects):
             if obj.type == 'MESH':
                 # Store transform and parent info
                 obj_name = obj.name
@@ -182,6 +258,24 @@ class SCOrg_tools_import():
 
     @staticmethod
     def import_by_id(id):
+        """
+        Import an item by GUID or name. The import carries on from a timer once its dependencies are
+        extracted, operators should use prepare_import_by_id and import_record themselves instead.
+        """
+        prepared = __class__.prepare_import_by_id(id)
+        if prepared is None:
+            return False
+        guid, record = prepared
+        # Extract everything the item and its loadout need up front, the import carries on once that's done
+        __class__.pre_extract_dependencies(record=record, on_ready=lambda: __class__.import_record(guid, record))
+        return True
+
+    @staticmethod
+    def prepare_import_by_id(id):
+        """
+        First half of import_by_id: resolve the ID and reset the import state.
+        Returns (guid, record), or None if the ID couldn't be resolved.
+        """
         os.system('cls')
         print("=" * 80)
         print("NEW CODE IS RUNNING - import_by_id() was updated!")
@@ -194,9 +288,12 @@ class SCOrg_tools_import():
         if globals_and_threading.debug: print(f"Resolved GUID: {guid}")
         if not __class__.is_guid(guid):
             misc_utils.SCOrg_tools_misc.error(f"⚠️ Invalid: {guid}")
-            return False
+            return None
 
         __class__.imported_guid_objects = {}
+        __class__.scene_hardpoint_index = None
+        __class__.hardpoint_index_stack = []
+        __class__.instance_collections = {}
         __class__.skip_imported_files = {}
         __class__.INCLUDE_HARDPOINTS = [] # all
         # DON'T clear missing_files here - it's cleared in run_import() at the top level
@@ -210,8 +307,12 @@ class SCOrg_tools_import():
 
         if not record:
             misc_utils.SCOrg_tools_misc.error(f"⚠️ Could not find record for GUID: {guid} - are you using the correct Data.p4k?")
-            return False
-        
+            return None
+        return guid, record
+
+    @staticmethod
+    def import_record(guid, record):
+        """Second half of import_by_id: import the record's geometry and loadout once its dependencies are extracted."""
         __class__.item_name = record.name
         __class__.item_guid = guid
         tint_utils.SCOrg_tools_tint.update_tints(record)  # Update tints for the item
@@ -227,7 +328,9 @@ class SCOrg_tools_import():
         # Handle case where geometry path is None but we have missing files (likely a missing CDF)
         if geometry_path is None and len(globals_and_threading.missing_files) > 0:
             prefs = bpy.context.preferences.addons["scorg_tools"].preferences
-            if prefs.extract_missing_files:
+            if prefs.extract_missing_files and globals_and_threading.is_extraction_running():
+                print("Skipping extraction of missing base files: a background extraction is still running")
+            elif prefs.extract_missing_files:
                 if globals_and_threading.debug: print("Attempting to extract missing base files (CDF)...")
                 
                 # We need to extract the files that were just added to missing_files
@@ -254,7 +357,7 @@ class SCOrg_tools_import():
         # load the main .dae
         if geometry_path:
             if globals_and_threading.debug: print(f"Loading geo: {geometry_path}")
-            if not geometry_path.exists():
+            if not __class__.geometry_file_exists(geometry_path):
                 print(f".DAE file not found at: {geometry_path}")
                 if globals_and_threading.debug:
                     print(f"DEBUG: Attempted DAE import path: {geometry_path}, but file was missing")
@@ -272,10 +375,11 @@ class SCOrg_tools_import():
 
                 # Check if we should auto-extract
                 prefs = bpy.context.preferences.addons["scorg_tools"].preferences
-                if prefs.extract_missing_files:
+                # Not while the background extraction runs, the file will be listed as missing instead
+                if prefs.extract_missing_files and not globals_and_threading.is_extraction_running():
                     print(f"Attempting to auto-extract missing base file: {missing_path}")
                     success, fail, report = __class__.extract_missing_files(missing_path, prefs)
-                    if success > 0 and geometry_path.exists():
+                    if success > 0 and __class__.geometry_file_exists(geometry_path):
                         print(f"Successfully extracted {geometry_path.name}. Retrying import...")
                         # Remove from missing files since we fixed it
                         if missing_path in globals_and_threading.missing_files:
@@ -290,21 +394,13 @@ class SCOrg_tools_import():
                         globals_and_threading.show_missing_files_popup()
                     return None
             
-            # Get a set of all objects before import
-            before = set(bpy.data.objects)
-
-            bpy.ops.object.select_all(action='DESELECT')
-            result = __class__.import_dae(geometry_path)
+            # Imported into a staging collection, so the new objects are known without scanning the scene
+            imported_objs = __class__.import_dae_staged(geometry_path)
+            result = imported_objs is not None
             if result != True:
                 misc_utils.SCOrg_tools_misc.error(f"Failed to import DAE for {guid}: {geometry_path}")
                 return None
 
-            # Get a set of all objects after import
-            after = set(bpy.data.objects)
-
-            # The difference is the set of newly imported objects
-            imported_objs = list(after - before)
-
             # Find root objects (those without a parent)
             root_objs = [obj for obj in imported_objs if obj.parent is None]
             root_object_name = None
@@ -323,8 +419,8 @@ class SCOrg_tools_import():
                 if globals_and_threading.debug: print("Deleting meshes for initial CDF base import")
                 # Usually used for smaller items like weapons, so change the POM/Decal displacement strength to 0.5mm
                 displacement_strength = bpy.context.preferences.addons["scorg_tools"].preferences.decal_displacement_non_ship
-                # Delete all meshes to avoid conflicts with CDF imports, the imported .dae objects will be selected
-                __class__.replace_selected_mesh_with_empties()
+                # Delete all meshes to avoid conflicts with CDF imports
+                __class__.replace_selected_mesh_with_empties(imported_objs)
                 
                 if globals_and_threading.debug: print(f"Converting bones to empties for {guid}: {geometry_path}")
                 # Ensure we're in object mode before converting armatures
@@ -336,7 +432,7 @@ class SCOrg_tools_import():
                     if globals_and_threading.debug: print(f"WARNING: No root object found for: {geometry_path}")
                 
                 for file in process_bones_file:
-                    if not file.is_file():
+                    if not __class__.geometry_file_exists(file):
                         if globals_and_threading.debug: print(f"⚠️ ERROR: Bones file missing: {file}")
                         try:
                             rel_path = str(file.relative_to(__class__.extract_dir)).replace("\\", "/")
@@ -391,6 +487,12 @@ class SCOrg_tools_import():
 
     @staticmethod
     def get_all_empties_blueprint():
+        # Object.children scans the whole file on every access, so map the parent links in one pass instead
+        children_of = {}
+        for obj in bpy.data.objects:
+            if obj.parent is not None:
+                children_of.setdefault(obj.parent.as_pointer(), []).append(obj)
+
         # First find the base container empty
         base_empty = __class__.get_base_empty()
         
@@ -399,67 +501,66 @@ class SCOrg_tools_import():
             # Fallback to original behavior if no base found
             return [
                 obj for obj in bpy.data.objects
-                if obj.type == 'EMPTY' and len(obj.children) == 0
+                if obj.type == 'EMPTY' and obj.as_pointer() not in children_of
             ]
         
         if globals_and_threading.debug: print(f"DEBUG: Found base container: {base_empty.name}")
         
-        def is_descendant_of(obj, ancestor):
-            """Check if obj is a descendant (child, grandchild, etc.) of ancestor"""
-            current = obj.parent
-            while current:
-                if current == ancestor:
-                    return True
-                current = current.parent
-            return False
-        
+        guid_prefix_pattern = re.compile(r"^[a-f0-9]{6}_(.+)$", re.IGNORECASE)
+        suffix_pattern = re.compile(r'\.\d+$')
+
         def normalize_hardpoint_name(name):
             """Strip GUID prefixes and .001 suffixes to get base name"""
             if not name:
                 return ""
             
             # Remove GUID prefix (6-char hex + underscore)
-            guid_pattern = r"^[a-f0-9]{6}_(.+)$"
-            match = re.match(guid_pattern, name, re.IGNORECASE)
+            match = guid_prefix_pattern.match(name)
             if match:
                 name = match.group(1)
             
             # Remove .001 suffixes
-            name = re.sub(r'\.\d+$', '', name)
+            name = suffix_pattern.sub('', name)
             return name.lower()  # Convert to lowercase for consistent comparison
         
-        def has_mesh_children(obj):
-            """Check if object has any mesh children (recursively)"""
-            for child in obj.children:
-                if child.type == 'MESH':
-                    return True
-                if has_mesh_children(child): # Check recursively
-                    return True
-            return False
-        
-        # Get all empties that are descendants of the base container
+        # One depth-first walk from the base container: which objects are under it, and for each of them
+        # whether anything below it is a mesh. Children are finished before their parent.
+        under_base = set()
+        has_mesh_below = {}
+        stack = [(base_empty, False)]
+        while stack:
+            obj, children_done = stack.pop()
+            pointer = obj.as_pointer()
+            children = children_of.get(pointer, ())
+            if not children_done:
+                under_base.add(pointer)
+                stack.append((obj, True))
+                stack.extend((child, False) for child in children)
+            else:
+                has_mesh_below[pointer] = any(child.type == 'MESH' or has_mesh_below[child.as_pointer()] for child in children)
+
+        # Get all empties that are descendants of the base container, in bpy.data.objects order
         base_descendants = [
             obj for obj in bpy.data.objects
-            if obj.type == 'EMPTY' and (obj == base_empty or is_descendant_of(obj, base_empty))
+            if obj.type == 'EMPTY' and obj.as_pointer() in under_base
         ]
         
         if globals_and_threading.debug: print(f"DEBUG: Found {len(base_descendants)} total empties under base container")
         
+        # Normalize each empty's name and orig_name once, for both passes below
+        normalized_names = {}
+        for obj in base_descendants:
+            names_to_check = [obj.name]
+            if 'orig_name' in obj:
+                names_to_check.append(obj['orig_name'])
+            normalized_names[obj.as_pointer()] = [normalized for normalized in map(normalize_hardpoint_name, names_to_check) if normalized]
+
         # Build a map of normalized names to empties with geometry
         filled_hardpoint_names = {}
         for obj in base_descendants:
-            if has_mesh_children(obj):
-                # This empty has geometry - check both name and orig_name
-                names_to_check = [obj.name]
-                if 'orig_name' in obj:
-                    names_to_check.append(obj['orig_name'])
-                
-                for name_to_check in names_to_check:
-                    normalized_name = normalize_hardpoint_name(name_to_check)
-                    if normalized_name:
-                        if normalized_name not in filled_hardpoint_names:
-                            filled_hardpoint_names[normalized_name] = []
-                        filled_hardpoint_names[normalized_name].append(obj)
+            if has_mesh_below[obj.as_pointer()]:
+                for normalized_name in normalized_names[obj.as_pointer()]:
+                    filled_hardpoint_names.setdefault(normalized_name, []).append(obj)
         
         if globals_and_threading.debug: 
             print(f"DEBUG: Found {len(filled_hardpoint_names)} hardpoint types already filled")
@@ -469,16 +570,10 @@ class SCOrg_tools_import():
         skipped_count = 0
         
         for obj in base_descendants:
-            if len(obj.children) == 0:  # Empty hardpoint
-                # Check both name and orig_name
-                names_to_check = [obj.name]
-                if 'orig_name' in obj:
-                    names_to_check.append(obj['orig_name'])
-                
+            if obj.as_pointer() not in children_of:  # Empty hardpoint
                 is_already_filled = False
-                for name in names_to_check:
-                    normalized = normalize_hardpoint_name(name)
-                    if normalized and normalized in filled_hardpoint_names:
+                for normalized in normalized_names[obj.as_pointer()]:
+                    if normalized in filled_hardpoint_names:
                         is_already_filled = True
                         if globals_and_threading.debug:
                             filled_examples = [filled_obj.name for filled_obj in filled_hardpoint_names[normalized][:2]]
@@ -606,9 +701,9 @@ class SCOrg_tools_import():
         return path
 
     @staticmethod
-    def convert_cgf_to_dae(cgf_path, dae_path=None, converter_path=None):
+    def convert_cgf_to_dae(cgf_path, dae_path=None, converter_path=None, output_format='dae'):
         """
-        Convert a CGF file to DAE using cgf-converter.
+        Convert a CGF file to DAE (or GLB, with output_format='glb') using cgf-converter.
         Returns True if successful, False otherwise.
         """
         if globals_and_threading.debug:
@@ -630,7 +725,7 @@ class SCOrg_tools_import():
             return False
         
         if dae_path is None:
-            dae_path = cgf_path.with_suffix('.dae')
+            dae_path = cgf_path.with_suffix('.' + output_format)
         
         obj_dir = dae_path.parent
         
@@ -645,9 +740,10 @@ class SCOrg_tools_import():
             str(cgf_path),
             '-objectdir', str(obj_dir)
         ]
+        if output_format == 'glb':
+            args.insert(1, '-glb')
         
         if globals_and_threading.debug:
-            import threading
             print(f"DEBUG [{time.time()*1000:.0f}ms]: Thread {threading.current_thread().name} starting cgf-converter for {cgf_path.name}")
             print(f"DEBUG [{time.time()*1000:.0f}ms]: Command: {' '.join(args)}")
         
@@ -660,7 +756,6 @@ class SCOrg_tools_import():
             )
             
             if globals_and_threading.debug:
-                import threading
                 print(f"DEBUG [{time.time()*1000:.0f}ms]: Thread {threading.current_thread().name} subprocess started, PID={process.pid}")
             
             # Poll process with timeout (non-blocking approach like StarFab)
@@ -676,7 +771,6 @@ class SCOrg_tools_import():
                 return False
             
             if globals_and_threading.debug:
-                import threading
                 elapsed = time.time() - start_time
                 print(f"DEBUG [{time.time()*1000:.0f}ms]: Thread {threading.current_thread().name} subprocess completed for {cgf_path.name} in {elapsed:.2f}s")
             
@@ -690,8 +784,8 @@ class SCOrg_tools_import():
                 return False
             
             if not dae_path.exists():
-                errmsg = result.stdout + result.stderr
-                print(f"DEBUG: cgf-converter returned success but DAE file missing: {dae_path}")
+                errmsg = process.stdout.read().decode('utf-8') if process.stdout else ""
+                print(f"DEBUG: cgf-converter returned success but {output_format.upper()} file missing: {dae_path}")
                 print(f"DEBUG: cgf-converter output: {errmsg}")
                 return False
 
@@ -734,7 +828,7 @@ class SCOrg_tools_import():
             return None
 
     @staticmethod
-    def duplicate_hierarchy_linked(original_obj, parent_empty):
+    def duplicate_hierarchy_linked(original_obj, parent_empty, collection=None):
         if original_obj is None:
             return None
         try:
@@ -744,13 +838,114 @@ class SCOrg_tools_import():
         new_obj = original_obj.copy()
         new_obj.data = original_obj.data  # share mesh data (linked duplicate)
         new_obj.animation_data_clear()
-        bpy.context.collection.objects.link(new_obj)
+        (collection or bpy.context.collection).objects.link(new_obj)
 
         new_obj.parent = parent_empty
         new_obj.matrix_parent_inverse.identity()
 
         for child in original_obj.children:
-            __class__.duplicate_hierarchy_linked(child, new_obj)
+            __class__.duplicate_hierarchy_linked(child, new_obj, collection)
+
+    @staticmethod
+    def should_instance_component(nested_loadout):
+        """
+        Repeats of a component are collection instances when the preference is on, unless something is
+        imported inside the component, which needs its own real copy of the hardpoints.
+        """
+        prefs = __class__.prefs or bpy.context.preferences.addons["scorg_tools"].preferences
+        if not getattr(prefs, 'instance_repeated_components', False):
+            return False
+        entries = nested_loadout.properties.get('entries', []) if hasattr(nested_loadout, 'properties') else []
+        return len(entries) == 0
+
+    @staticmethod
+    def get_instance_library():
+        """The collection holding one collection per instanced component, excluded from the view layer."""
+        library = bpy.data.collections.get(__class__.INSTANCE_LIBRARY_NAME)
+        if library is None:
+            library = bpy.data.collections.new(__class__.INSTANCE_LIBRARY_NAME)
+        scene_collection = bpy.context.scene.collection
+        if scene_collection.children.get(library.name) is None:
+            scene_collection.children.link(library)
+        layer_collection = bpy.context.view_layer.layer_collection.children.get(library.name)
+        if layer_collection is not None:
+            layer_collection.exclude = True
+        return library
+
+    @staticmethod
+    def is_instance_source(obj):
+        return any('scorg_guid' in collection for collection in obj.users_collection)
+
+    @staticmethod
+    def make_instance_source(guid, root_obj):
+        """
+        Move a freshly imported component into its own collection in the instance library, keeping its root's
+        offset from the hardpoint, so this and later uses of the GUID can instance it.
+        """
+        collection = bpy.data.collections.new(root_obj.name)
+        collection['scorg_guid'] = guid
+        __class__.get_instance_library().children.link(collection)
+        for obj in [root_obj] + list(root_obj.children_recursive):
+            for user_collection in list(obj.users_collection):
+                user_collection.objects.unlink(obj)
+            collection.objects.link(obj)
+        root_obj.parent = None
+        # Clearing the parent keeps matrix_basis, the root's offset from its hardpoint, so an instance parented
+        # to a hardpoint with an identity offset places the component exactly where a real copy would be
+        __class__.instance_collections[guid] = collection
+        return collection
+
+    @staticmethod
+    def add_component_instance(collection, parent_empty):
+        """A single empty at the hardpoint instancing the component's collection."""
+        instance = bpy.data.objects.new(collection.name, None)
+        instance.instance_type = 'COLLECTION'
+        instance.instance_collection = collection
+        instance['scorg_instance_guid'] = collection.get('scorg_guid', '')
+        # Same collection as the hardpoint, the active collection may be anywhere in the scene
+        target = parent_empty.users_collection[0] if parent_empty.users_collection else bpy.context.collection
+        target.objects.link(instance)
+        instance.parent = parent_empty
+        instance.matrix_parent_inverse.identity()
+        return instance
+
+    @staticmethod
+    def make_component_instances_real():
+        """
+        Replace the component instances created by the import with linked duplicates of their source,
+        then remove the sources that nothing instances any more.
+        """
+        instances = [
+            obj for obj in bpy.data.objects
+            if obj.instance_type == 'COLLECTION' and obj.instance_collection is not None and 'scorg_instance_guid' in obj
+        ]
+        for i, instance in enumerate(instances):
+            ui_tools.progress_bar_popup("make_components_real", i, len(instances), "Making component instances real")
+            collection = instance.instance_collection
+            target_collection = instance.users_collection[0] if instance.users_collection else bpy.context.collection
+            for root in [obj for obj in collection.objects if obj.parent is None]:
+                __class__.duplicate_hierarchy_linked(root, instance, target_collection)
+            instance.instance_type = 'NONE'
+            instance.instance_collection = None
+        ui_tools.close_progress_bar_popup("make_components_real")
+
+        library = bpy.data.collections.get(__class__.INSTANCE_LIBRARY_NAME)
+        if library is not None:
+            still_instanced = {obj.instance_collection.name for obj in bpy.data.objects if obj.instance_collection is not None}
+            for collection in list(library.children):
+                if collection.name in still_instanced:
+                    continue
+                for obj in list(collection.objects):
+                    bpy.data.objects.remove(obj, do_unlink=True)
+                bpy.data.collections.remove(collection)
+            if len(library.children) == 0:
+                bpy.data.collections.remove(library)
+        # The sources are gone, later repeats duplicate the real copies instead
+        for guid in __class__.instance_collections:
+            __class__.imported_guid_objects.pop(guid, None)
+        __class__.instance_collections = {}
+        if globals_and_threading.debug: print(f"Made {len(instances)} component instances real")
+        return len(instances)
     
     @staticmethod
     def collect_import_tasks(loadout, empties_to_fill, is_top_level=True, parent_guid=None, hardpoint_mapping=None):
@@ -805,10 +1000,21 @@ class SCOrg_tools_import():
         return tasks        
 
     @staticmethod
-    def process_single_entry(entry, empties_to_fill, is_top_level=True, parent_guid=None, hardpoint_mapping=None, skip_import_geometry=False):
+    def process_single_entry(entry, empties_to_fill, is_top_level=True, parent_guid=None, hardpoint_mapping=None, skip_import_geometry=False, empties_index=None):
         """
         Process a single entry from the loadout, including its nested loadout.
         This is extracted from the loop in import_hardpoint_hierarchy.
+        Callers processing many entries of the same level should pass a HardpointIndex of empties_to_fill
+        as empties_index, rather than have it rebuilt for every entry.
+        """
+        for _ in __class__.iter_process_single_entry(entry, empties_to_fill, is_top_level, parent_guid, hardpoint_mapping, skip_import_geometry, empties_index):
+            pass
+
+    @staticmethod
+    def iter_process_single_entry(entry, empties_to_fill, is_top_level=True, parent_guid=None, hardpoint_mapping=None, skip_import_geometry=False, empties_index=None):
+        """
+        process_single_entry as a generator that yields between units of work (the entry itself, then
+        each entry of its nested loadouts), so a modal operator can spread it over several timer ticks.
         """
         if hardpoint_mapping is None:
             hardpoint_mapping = {}
@@ -835,28 +1041,10 @@ class SCOrg_tools_import():
                 break
         if globals_and_threading.debug: print(f"DEBUG: Looking for matching empty for item_port_name='{item_port_name}', mapped_name='{mapped_name}'")
         
-        # Try to find matching empty in empties_to_fill (empty hardpoints)
-        matching_empty = None
-        for empty in empties_to_fill:
-            orig_name = empty.get('orig_name', '') if hasattr(empty, 'get') else ''
-            
-            if __class__.matches_blender_name(orig_name, mapped_name) or __class__.matches_blender_name(empty.name, mapped_name):
-                matching_empty = empty
-                break
-        
-        # If no empty hardpoint found, check if there's a filled hardpoint that we should process for nested loadout
-        filled_hardpoint = None
-        if not matching_empty:
-            # Search all empties (not just empty ones) for a match to handle filled hardpoints with nested loadouts
-            for obj in bpy.data.objects:
-                if obj.type == 'EMPTY':
-                    orig_name = obj.get('orig_name', '') if hasattr(obj, 'get') else ''
-                    if __class__.matches_blender_name(orig_name, mapped_name) or __class__.matches_blender_name(obj.name, mapped_name):
-                        # Check if this hardpoint has children (is filled)
-                        if len(obj.children) > 0:
-                            filled_hardpoint = obj
-                            if globals_and_threading.debug: print(f"DEBUG: Found filled hardpoint: {filled_hardpoint.name} for '{mapped_name}'")
-                            break
+        # Find the matching empty hardpoint in empties_to_fill, or a filled hardpoint that we should process for nested loadout
+        if empties_index is None:
+            empties_index = HardpointIndex(empties_to_fill)
+        matching_empty, filled_hardpoint = __class__.find_hardpoint(mapped_name, empties_index)
         
         # Determine if we should process nested loadout and whether to import geometry
         should_import_geometry = matching_empty is not None
@@ -889,9 +1077,9 @@ class SCOrg_tools_import():
                             for child in obj.children:
                                 collect_empties(child)
                         collect_empties(filled_hardpoint)
-                        __class__.import_hardpoint_hierarchy(nested_loadout, nested_empties, is_top_level=False, parent_guid=guid_str)
+                        yield from __class__.iter_import_hardpoint_hierarchy(nested_loadout, nested_empties, is_top_level=False, parent_guid=guid_str)
                     else:
-                        __class__.import_hardpoint_hierarchy(nested_loadout, empties_to_fill, is_top_level=False, parent_guid=guid_str)
+                        yield from __class__.iter_import_hardpoint_hierarchy(nested_loadout, empties_to_fill, is_top_level=False, parent_guid=guid_str)
                 else:
                     if globals_and_threading.debug: print("DEBUG: No nested loadout found, recursion ends here")
                 return
@@ -934,10 +1122,15 @@ class SCOrg_tools_import():
             if len(matching_empty.children) > 0:
                 if globals_and_threading.debug: print(f"DEBUG: Hardpoint '{matching_empty.name}' already has children, skipping geometry import to avoid duplication")
                 # Still allow nested loadout processing to continue - don't skip the entire section
+            elif guid_str in __class__.instance_collections and __class__.should_instance_component(nested_loadout):
+                __class__.add_component_instance(__class__.instance_collections[guid_str], matching_empty)
+                __class__.index_hardpoint_subtree(matching_empty)
+                if globals_and_threading.debug: print(f"Instanced '{item_port_name}' from GUID {guid_str}")
             elif guid_str in __class__.imported_guid_objects:
                 # If the GUID is already imported, duplicate the hierarchy linked
                 original_root = __class__.imported_guid_objects[guid_str]
                 __class__.duplicate_hierarchy_linked(original_root, matching_empty)
+                __class__.index_hardpoint_subtree(matching_empty)
                 if globals_and_threading.debug: print(f"Duplicated hierarchy for '{item_port_name}' from GUID {guid_str}")
             else:
                 # The item was not imported yet, so we need to import it
@@ -953,7 +1146,7 @@ class SCOrg_tools_import():
                     process_bones_file = geometry_path
                     geometry_path = process_bones_file.pop(0)  # Get the first file in the array, which is the base armature DAE file
 
-                if not geometry_path.exists():
+                if not __class__.geometry_file_exists(geometry_path):
                     print(f".DAE file not found at: {geometry_path}")
                     if globals_and_threading.debug: print(f"DEBUG: Attempted DAE import path: {geometry_path}, but file was missing")
                     if str(geometry_path) not in globals_and_threading.missing_files:
@@ -968,20 +1161,13 @@ class SCOrg_tools_import():
                             print(f"Added to missing_files (loc 2): {rel_path}")
                     return
 
-                # Get a set of all objects before import
-                before = set(bpy.data.objects)
-
-                bpy.ops.object.select_all(action='DESELECT')
-                result = __class__.import_dae(geometry_path)
+                # Imported into a staging collection, so the new objects are known without scanning the scene
+                imported_objs = __class__.import_dae_staged(geometry_path)
+                result = imported_objs is not None
                 if result != True:
                     if globals_and_threading.debug: print(f"ERROR: Failed to import DAE for {guid_str}: {geometry_path}")
                     return
 
-                # Get a set of all objects after import
-                after = set(bpy.data.objects)
-                # The difference is the set of newly imported objects
-                imported_objs = list(after - before)
-
                 root_objs = [obj for obj in imported_objs if obj.parent is None]
                 if not root_objs:
                     if globals_and_threading.debug: print(f"WARNING: No root object found for: {geometry_path}")
@@ -996,8 +1182,8 @@ class SCOrg_tools_import():
                     if globals_and_threading.debug: print("Deleting meshes for CDF import")
                     # Store the root object name before deletion
                     root_obj_name = root_obj.name
-                    # Delete all meshes to avoid conflicts with CDF imports, the imported .dae objects will be selected
-                    __class__.replace_selected_mesh_with_empties()
+                    # Delete all meshes to avoid conflicts with CDF imports
+                    __class__.replace_selected_mesh_with_empties(imported_objs)
                     
                     if globals_and_threading.debug: print(f"Converting bones to empties for {guid_str}: {geometry_path}")
                     # Ensure we're in object mode before converting armatures
@@ -1006,7 +1192,7 @@ class SCOrg_tools_import():
                     blender_utils.SCOrg_tools_blender.convert_armatures_to_empties()
                     
                     for file in process_bones_file:
-                        if not file.is_file():
+                        if not __class__.geometry_file_exists(file):
                             if globals_and_threading.debug: print(f"⚠️ ERROR: Bones file missing: {file}")
                             if str(file) not in globals_and_threading.missing_files:
                                 try:
@@ -1022,6 +1208,11 @@ class SCOrg_tools_import():
                         __class__.import_file(file, root_obj_name)
                     if globals_and_threading.debug: print("DEBUG: Finished processing bones files")
 
+                if __class__.should_instance_component(nested_loadout):
+                    # Keep this first copy as the source for every use of the GUID, and instance it here too
+                    collection = __class__.make_instance_source(guid_str, root_obj)
+                    __class__.add_component_instance(collection, matching_empty)
+                __class__.index_hardpoint_subtree(matching_empty)
                 if globals_and_threading.debug: print(f"Imported object for '{item_port_name}' GUID {guid_str} → {geometry_path}")
 
         # Process nested loadout regardless of whether we imported geometry
@@ -1055,13 +1246,20 @@ class SCOrg_tools_import():
                         break
                 else:
                     empty['orig_name'] = re.sub(r'\.\d+$', '', empty.name)
+                __class__.reindex_hardpoint(empty)
 
-            __class__.import_hardpoint_hierarchy(nested_loadout, nested_empties, is_top_level=False, parent_guid=guid_str, skip_import_geometry=skip_import_geometry or skip_geometry_for_nested)
+            yield from __class__.iter_import_hardpoint_hierarchy(nested_loadout, nested_empties, is_top_level=False, parent_guid=guid_str, skip_import_geometry=skip_import_geometry or skip_geometry_for_nested)
         else:
             if globals_and_threading.debug: print("DEBUG: No nested loadout to process")
 
     @staticmethod
     def import_hardpoint_hierarchy(loadout, empties_to_fill, is_top_level=True, parent_guid=None, skip_import_geometry=False):
+        for _ in __class__.iter_import_hardpoint_hierarchy(loadout, empties_to_fill, is_top_level, parent_guid, skip_import_geometry):
+            pass
+
+    @staticmethod
+    def iter_import_hardpoint_hierarchy(loadout, empties_to_fill, is_top_level=True, parent_guid=None, skip_import_geometry=False):
+        """import_hardpoint_hierarchy as a generator, yielding before each entry of every level it imports."""
         # Check if loadout is None to prevent AttributeError
         if loadout is None:
             if globals_and_threading.debug: print("DEBUG: Loadout is None, skipping hierarchy import")
@@ -1081,260 +1279,252 @@ class SCOrg_tools_import():
         # Only show progress at the top level
         if is_top_level:
             ui_tools.progress_bar_popup("import_hardpoints", 0, len(entries), "Starting hardpoint import...")
-        
-        for i, entry in enumerate(entries):
-            skip_geometry_for_nested = False
-            blender_utils.SCOrg_tools_blender.update_viewport_with_timer(interval_seconds=0.1)
 
-            props = getattr(entry, 'properties', entry)
-            item_port_name = props.get('itemPortName')
-            guid = props.get('entityClassReference')
-            nested_loadout = props.get('loadout')
+        # Indexed once per level, nested levels update it through reindex_hardpoint while it's on the stack
+        empties_index = HardpointIndex(empties_to_fill)
+        __class__.hardpoint_index_stack.append(empties_index)
+        # Popped however the level ends, including the generator being closed or an entry raising
+        try:
+            for i, entry in enumerate(entries):
+                yield  # Each entry is a unit of work: at most one DAE import, nested levels yield again for their own entries
+                skip_geometry_for_nested = False
+                blender_utils.SCOrg_tools_blender.update_viewport_with_timer(interval_seconds=0.1)
 
-            entity_class_name = getattr(props, 'entityClassName', None)
+                props = getattr(entry, 'properties', entry)
+                item_port_name = props.get('itemPortName')
+                guid = props.get('entityClassReference')
+                nested_loadout = props.get('loadout')
+
+                entity_class_name = getattr(props, 'entityClassName', None)
             
-            # Only update progress at the top level
-            if is_top_level:
-                ui_tools.progress_bar_popup("import_hardpoints", i+1, len(entries), f"Importing {item_port_name}...")
+                # Only update progress at the top level
+                if is_top_level:
+                    ui_tools.progress_bar_popup("import_hardpoints", i+1, len(entries), f"Importing {item_port_name}...")
             
-            if globals_and_threading.debug: print(f"DEBUG: Entry {i}: item_port_name='{item_port_name}', guid={guid}, entityClassName={entity_class_name}, has_nested_loadout={nested_loadout is not None}")
+                if globals_and_threading.debug: print(f"DEBUG: Entry {i}: item_port_name='{item_port_name}', guid={guid}, entityClassName={entity_class_name}, has_nested_loadout={nested_loadout is not None}")
 
-            if not item_port_name or (not guid and not entity_class_name):
-                if globals_and_threading.debug: print("DEBUG: Missing item_port_name or guid and name, skipping")
-                continue
+                if not item_port_name or (not guid and not entity_class_name):
+                    if globals_and_threading.debug: print("DEBUG: Missing item_port_name or guid and name, skipping")
+                    continue
 
-            # Apply filter ONLY at top level
-            if is_top_level and __class__.INCLUDE_HARDPOINTS and item_port_name not in __class__.INCLUDE_HARDPOINTS:
-                if globals_and_threading.debug: print(f"DEBUG: Skipping '{item_port_name}' due to top-level filter")
-                continue
+                # Apply filter ONLY at top level
+                if is_top_level and __class__.INCLUDE_HARDPOINTS and item_port_name not in __class__.INCLUDE_HARDPOINTS:
+                    if globals_and_threading.debug: print(f"DEBUG: Skipping '{item_port_name}' due to top-level filter")
+                    continue
 
-            mapped_name = item_port_name
-            for hardpoint_name, item_port_names in hardpoint_mapping.items():
-                if globals_and_threading.debug: print(f"DEBUG: Checking hardpoint mapping: {hardpoint_name} -> {item_port_names}")
-                if item_port_name in item_port_names:
-                    mapped_name = hardpoint_name
-                    break
-            if globals_and_threading.debug: print(f"DEBUG: Looking for matching empty for item_port_name='{item_port_name}', mapped_name='{mapped_name}'")
-            
-            # Try to find matching empty in empties_to_fill (empty hardpoints)
-            matching_empty = None
-            for empty in empties_to_fill:
-                orig_name = empty.get('orig_name', '') if hasattr(empty, 'get') else ''
-                
-                if __class__.matches_blender_name(orig_name, mapped_name) or __class__.matches_blender_name(empty.name, mapped_name):
-                    matching_empty = empty
-                    break
+                mapped_name = item_port_name
+                for hardpoint_name, item_port_names in hardpoint_mapping.items():
+                    if globals_and_threading.debug: print(f"DEBUG: Checking hardpoint mapping: {hardpoint_name} -> {item_port_names}")
+                    if item_port_name in item_port_names:
+                        mapped_name = hardpoint_name
+                        break
+                if globals_and_threading.debug: print(f"DEBUG: Looking for matching empty for item_port_name='{item_port_name}', mapped_name='{mapped_name}'")
             
-            # If no empty hardpoint found, check if there's a filled hardpoint that we should process for nested loadout
-            filled_hardpoint = None
-            if not matching_empty:
-                # Search all empties (not just empty ones) for a match to handle filled hardpoints with nested loadouts
-                for obj in bpy.data.objects:
-                    if obj.type == 'EMPTY':
-                        orig_name = obj.get('orig_name', '') if hasattr(obj, 'get') else ''
-                        if __class__.matches_blender_name(orig_name, mapped_name) or __class__.matches_blender_name(obj.name, mapped_name):
-                            # Check if this hardpoint has children (is filled)
-                            if len(obj.children) > 0:
-                                filled_hardpoint = obj
-                                if globals_and_threading.debug: print(f"DEBUG: Found filled hardpoint: {filled_hardpoint.name} for '{mapped_name}'")
-                                break
+                # Find the matching empty hardpoint in empties_to_fill, or a filled hardpoint that we should process for nested loadout
+                matching_empty, filled_hardpoint = __class__.find_hardpoint(mapped_name, empties_index)
             
-            # Determine if we should process nested loadout and whether to import geometry
-            should_import_geometry = matching_empty is not None
-            should_process_nested = nested_loadout is not None or filled_hardpoint is not None
-            target_empty = matching_empty or filled_hardpoint
+                # Determine if we should process nested loadout and whether to import geometry
+                should_import_geometry = matching_empty is not None
+                should_process_nested = nested_loadout is not None or filled_hardpoint is not None
+                target_empty = matching_empty or filled_hardpoint
             
-            if not target_empty:
-                if globals_and_threading.debug: print(f"WARNING: No matching empty or filled hardpoint found for '{mapped_name}' (original item_port_name: '{item_port_name}'), skipping this entry")
-                continue
+                if not target_empty:
+                    if globals_and_threading.debug: print(f"WARNING: No matching empty or filled hardpoint found for '{mapped_name}' (original item_port_name: '{item_port_name}'), skipping this entry")
+                    continue
 
-            if globals_and_threading.debug: 
-                status = "empty" if should_import_geometry else "filled"
-                print(f"DEBUG: Found {status} hardpoint: {target_empty.name} for '{mapped_name}', will_import_geometry={should_import_geometry}, will_process_nested={should_process_nested}")
-
-            # Handle GUID resolution
-            guid_str = str(guid)
-            if not __class__.is_guid(guid_str): # must be 00000000-0000-0000-0000-000000000000 or blank
-                if not entity_class_name:
-                    if globals_and_threading.debug: print("DEBUG: GUID is all zeros, but no entityClassName found, skipping geometry import")
-                    skip_geometry_for_nested = True
-                    # Still recurse into nested loadout if present
-                    if should_process_nested and nested_loadout:
-                        entries_count = len(nested_loadout.properties.get('entries', [])) if nested_loadout else 0
-                        if globals_and_threading.debug: print(f"DEBUG: Nested loadout detected with {entries_count} entries, recursing into GUID {guid_str} (all zeros)...")
-                        # For filled hardpoints, we need to get empties from within that hardpoint
-                        if filled_hardpoint:
-                            nested_empties = []
-                            def collect_empties(obj):
-                                if obj.type == 'EMPTY' and len(obj.children) == 0:
-                                    nested_empties.append(obj)
-                                for child in obj.children:
-                                    collect_empties(child)
-                            collect_empties(filled_hardpoint)
-                            __class__.import_hardpoint_hierarchy(nested_loadout, nested_empties, is_top_level=False, parent_guid=guid_str, skip_import_geometry=skip_import_geometry or skip_geometry_for_nested)
+                if globals_and_threading.debug: 
+                    status = "empty" if should_import_geometry else "filled"
+                    print(f"DEBUG: Found {status} hardpoint: {target_empty.name} for '{mapped_name}', will_import_geometry={should_import_geometry}, will_process_nested={should_process_nested}")
+
+                # Handle GUID resolution
+                guid_str = str(guid)
+                if not __class__.is_guid(guid_str): # must be 00000000-0000-0000-0000-000000000000 or blank
+                    if not entity_class_name:
+                        if globals_and_threading.debug: print("DEBUG: GUID is all zeros, but no entityClassName found, skipping geometry import")
+                        skip_geometry_for_nested = True
+                        # Still recurse into nested loadout if present
+                        if should_process_nested and nested_loadout:
+                            entries_count = len(nested_loadout.properties.get('entries', [])) if nested_loadout else 0
+                            if globals_and_threading.debug: print(f"DEBUG: Nested loadout detected with {entries_count} entries, recursing into GUID {guid_str} (all zeros)...")
+                            # For filled hardpoints, we need to get empties from within that hardpoint
+                            if filled_hardpoint:
+                                nested_empties = []
+                                def collect_empties(obj):
+                                    if obj.type == 'EMPTY' and len(obj.children) == 0:
+                                        nested_empties.append(obj)
+                                    for child in obj.children:
+                                        collect_empties(child)
+                                collect_empties(filled_hardpoint)
+                                yield from __class__.iter_import_hardpoint_hierarchy(nested_loadout, nested_empties, is_top_level=False, parent_guid=guid_str, skip_import_geometry=skip_import_geometry or skip_geometry_for_nested)
+                            else:
+                                yield from __class__.iter_import_hardpoint_hierarchy(nested_loadout, empties_to_fill, is_top_level=False, parent_guid=guid_str, skip_import_geometry=skip_import_geometry or skip_geometry_for_nested)
                         else:
-                            __class__.import_hardpoint_hierarchy(nested_loadout, empties_to_fill, is_top_level=False, parent_guid=guid_str, skip_import_geometry=skip_import_geometry or skip_geometry_for_nested)
-                    else:
-                        if globals_and_threading.debug: print("DEBUG: No nested loadout found, recursion ends here")
-                    continue
-                else:
-                    # Get the GUID from the entity_class_name
-                    guid_str = __class__.get_guid_by_name(entity_class_name)
-                    if not guid_str or not __class__.is_guid(guid_str):
-                        if globals_and_threading.debug: print(f"DEBUG: Could not resolve GUID for entityClassName '{entity_class_name}', skipping import")
+                            if globals_and_threading.debug: print("DEBUG: No nested loadout found, recursion ends here")
                         continue
-
-            if not nested_loadout:
-                # If no nested loadout, load the record for the GUID and check for a default loadout
-                if globals_and_threading.debug: print (f"DEBUG: No nested loadout found, loading record for GUID: {guid_str}")
-                child_record = __class__.get_record(guid_str)
-                if child_record:
-                    nested_loadout = __class__.get_loadout_from_record(child_record)
-                    should_process_nested = nested_loadout is not None
-                    if not nested_loadout:
-                       if globals_and_threading.debug: print(f"DEBUG: Could not find a nested loadout for GUID {guid_str}: {nested_loadout}")
                     else:
-                        if globals_and_threading.debug: print(f"DEBUG: Found nested loadout for GUID {guid_str}")
+                        # Get the GUID from the entity_class_name
+                        guid_str = __class__.get_guid_by_name(entity_class_name)
+                        if not guid_str or not __class__.is_guid(guid_str):
+                            if globals_and_threading.debug: print(f"DEBUG: Could not resolve GUID for entityClassName '{entity_class_name}', skipping import")
+                            continue
 
-            # Only import geometry if we have an empty hardpoint
-            if should_import_geometry:
-                skip_geometry_for_nested = False
-                # Check if this specific hardpoint already has children (is already filled)
-                if len(matching_empty.children) > 0:
-                    if globals_and_threading.debug: print(f"DEBUG: Hardpoint '{matching_empty.name}' already has children, skipping geometry import to avoid duplication")
-                    skip_geometry_for_nested = True
-                    # Still allow nested loadout processing to continue - don't skip the entire section
-                elif guid_str in __class__.imported_guid_objects:
-                    # If the GUID is already imported, duplicate the hierarchy linked
-                    original_root = __class__.imported_guid_objects[guid_str]
-                    __class__.duplicate_hierarchy_linked(original_root, matching_empty)
-                    if globals_and_threading.debug: print(f"Duplicated hierarchy for '{item_port_name}' from GUID {guid_str}")
-                else:
-                    # The item was not imported yet, so we need to import it
-                    geometry_path = __class__.get_geometry_path(guid = guid_str)
-                    if geometry_path is None:
-                        if globals_and_threading.debug: print(f"ERROR: No geometry for GUID {guid_str}: {geometry_path}")
+                if not nested_loadout:
+                    # If no nested loadout, load the record for the GUID and check for a default loadout
+                    if globals_and_threading.debug: print (f"DEBUG: No nested loadout found, loading record for GUID: {guid_str}")
+                    child_record = __class__.get_record(guid_str)
+                    if child_record:
+                        nested_loadout = __class__.get_loadout_from_record(child_record)
+                        should_process_nested = nested_loadout is not None
+                        if not nested_loadout:
+                           if globals_and_threading.debug: print(f"DEBUG: Could not find a nested loadout for GUID {guid_str}: {nested_loadout}")
+                        else:
+                            if globals_and_threading.debug: print(f"DEBUG: Found nested loadout for GUID {guid_str}")
+
+                # Only import geometry if we have an empty hardpoint
+                if should_import_geometry:
+                    skip_geometry_for_nested = False
+                    # Check if this specific hardpoint already has children (is already filled)
+                    if len(matching_empty.children) > 0:
+                        if globals_and_threading.debug: print(f"DEBUG: Hardpoint '{matching_empty.name}' already has children, skipping geometry import to avoid duplication")
                         skip_geometry_for_nested = True
-
+                        # Still allow nested loadout processing to continue - don't skip the entire section
+                    elif guid_str in __class__.instance_collections and __class__.should_instance_component(nested_loadout):
+                        __class__.add_component_instance(__class__.instance_collections[guid_str], matching_empty)
+                        __class__.index_hardpoint_subtree(matching_empty)
+                        if globals_and_threading.debug: print(f"Instanced '{item_port_name}' from GUID {guid_str}")
+                    elif guid_str in __class__.imported_guid_objects:
+                        # If the GUID is already imported, duplicate the hierarchy linked
+                        original_root = __class__.imported_guid_objects[guid_str]
+                        __class__.duplicate_hierarchy_linked(original_root, matching_empty)
+                        __class__.index_hardpoint_subtree(matching_empty)
+                        if globals_and_threading.debug: print(f"Duplicated hierarchy for '{item_port_name}' from GUID {guid_str}")
                     else:
-                        process_bones_file = False
-                        # if the geometry path is an array, it means we have a CDF XML file that points to the real geometry
-                        if isinstance(geometry_path, list):
-                            if globals_and_threading.debug: print(f"DEBUG: CDF XML file found with references to: {geometry_path}")
-                            process_bones_file = geometry_path
-                            geometry_path = process_bones_file.pop(0)  # Get the first file in the array, which is the base armature DAE file
-
-                        if not geometry_path.exists():
-                            print(f".DAE file not found at: {geometry_path}")
-                            if globals_and_threading.debug: print(f"DEBUG: Attempted DAE import path: {geometry_path}, but file was missing")
-                            if str(geometry_path) not in globals_and_threading.missing_files:
-                                try:
-                                    rel_path = str(geometry_path.relative_to(__class__.extract_dir)).replace("\\", "/")
-                                except ValueError:
-                                    rel_path = str(geometry_path).replace("\\", "/")
-                                if not rel_path.startswith('$'):
-                                    if not rel_path.lower().startswith("data/"):
-                                        rel_path = "Data/" + rel_path
-                                    globals_and_threading.missing_files.add(rel_path);
-                                    print(f"Added to missing_files (loc 2): {rel_path}")
+                        # The item was not imported yet, so we need to import it
+                        geometry_path = __class__.get_geometry_path(guid = guid_str)
+                        if geometry_path is None:
+                            if globals_and_threading.debug: print(f"ERROR: No geometry for GUID {guid_str}: {geometry_path}")
                             skip_geometry_for_nested = True
 
                         else:
-                            skip_geometry_for_nested = True
-                            if not skip_import_geometry:
-                                # Get a set of all objects before import
-                                before = set(bpy.data.objects)
-
-                                bpy.ops.object.select_all(action='DESELECT')
-                                result = __class__.import_dae(geometry_path)
-                                if result != True:
-                                    if globals_and_threading.debug: print(f"ERROR: Failed to import DAE for {guid_str}: {geometry_path}")
-                                    # skip_geometry_for_nested already True
+                            process_bones_file = False
+                            # if the geometry path is an array, it means we have a CDF XML file that points to the real geometry
+                            if isinstance(geometry_path, list):
+                                if globals_and_threading.debug: print(f"DEBUG: CDF XML file found with references to: {geometry_path}")
+                                process_bones_file = geometry_path
+                                geometry_path = process_bones_file.pop(0)  # Get the first file in the array, which is the base armature DAE file
+
+                            if not __class__.geometry_file_exists(geometry_path):
+                                print(f".DAE file not found at: {geometry_path}")
+                                if globals_and_threading.debug: print(f"DEBUG: Attempted DAE import path: {geometry_path}, but file was missing")
+                                if str(geometry_path) not in globals_and_threading.missing_files:
+                                    try:
+                                        rel_path = str(geometry_path.relative_to(__class__.extract_dir)).replace("\\", "/")
+                                    except ValueError:
+                                        rel_path = str(geometry_path).replace("\\", "/")
+                                    if not rel_path.startswith('$'):
+                                        if not rel_path.lower().startswith("data/"):
+                                            rel_path = "Data/" + rel_path
+                                        globals_and_threading.missing_files.add(rel_path);
+                                        print(f"Added to missing_files (loc 2): {rel_path}")
+                                skip_geometry_for_nested = True
 
-                                else:
-                                    # Get a set of all objects after import
-                                    after = set(bpy.data.objects)
-                                    # The difference is the set of newly imported objects
-                                    imported_objs = list(after - before)
-
-                                    root_objs = [obj for obj in imported_objs if obj.parent is None]
-                                    if not root_objs:
-                                        if globals_and_threading.debug: print(f"WARNING: No root object found for: {geometry_path}")
+                            else:
+                                skip_geometry_for_nested = True
+                                if not skip_import_geometry:
+                                    # Imported into a staging collection, so the new objects are known without scanning the scene
+                                    imported_objs = __class__.import_dae_staged(geometry_path)
+                                    result = imported_objs is not None
+                                    if result != True:
+                                        if globals_and_threading.debug: print(f"ERROR: Failed to import DAE for {guid_str}: {geometry_path}")
                                         # skip_geometry_for_nested already True
+
                                     else:
-                                        root_obj = root_objs[0]
-                                        root_obj.parent = matching_empty
-                                        root_obj.matrix_parent_inverse.identity()
-                                        __class__.imported_guid_objects[guid_str] = root_obj
-                                        skip_geometry_for_nested = False
-
-                                        if process_bones_file:
-                                            if globals_and_threading.debug: print("Deleting meshes for CDF import")
-                                            # Store the root object name before deletion
-                                            root_obj_name = root_obj.name
-                                            # Delete all meshes to avoid conflicts with CDF imports, the imported .dae objects will be selected
-                                            __class__.replace_selected_mesh_with_empties()
+                                        root_objs = [obj for obj in imported_objs if obj.parent is None]
+                                        if not root_objs:
+                                            if globals_and_threading.debug: print(f"WARNING: No root object found for: {geometry_path}")
+                                            # skip_geometry_for_nested already True
+                                        else:
+                                            root_obj = root_objs[0]
+                                            root_obj.parent = matching_empty
+                                            root_obj.matrix_parent_inverse.identity()
+                                            __class__.imported_guid_objects[guid_str] = root_obj
+                                            skip_geometry_for_nested = False
+
+                                            if process_bones_file:
+                                                if globals_and_threading.debug: print("Deleting meshes for CDF import")
+                                                # Store the root object name before deletion
+                                                root_obj_name = root_obj.name
+                                                # Delete all meshes to avoid conflicts with CDF imports
+                                                __class__.replace_selected_mesh_with_empties(imported_objs)
                                             
-                                            if globals_and_threading.debug: print(f"Converting bones to empties for {guid_str}: {geometry_path}")
-                                            # Ensure we're in object mode before converting armatures
-                                            if bpy.context.mode != 'OBJECT':
-                                                bpy.ops.object.mode_set(mode='OBJECT')
-                                            blender_utils.SCOrg_tools_blender.convert_armatures_to_empties()
+                                                if globals_and_threading.debug: print(f"Converting bones to empties for {guid_str}: {geometry_path}")
+                                                # Ensure we're in object mode before converting armatures
+                                                if bpy.context.mode != 'OBJECT':
+                                                    bpy.ops.object.mode_set(mode='OBJECT')
+                                                blender_utils.SCOrg_tools_blender.convert_armatures_to_empties()
                                             
-                                            for file in process_bones_file:
-                                                if not file.is_file():
-                                                    if globals_and_threading.debug: print(f"⚠️ ERROR: Bones file missing: {file}")
-                                                    if str(file) not in globals_and_threading.missing_files:
-                                                        try:
-                                                            rel_path = str(file.relative_to(__class__.extract_dir))
-                                                        except ValueError:
-                                                            rel_path = str(file)
-                                                        if not rel_path.startswith('$') and 'ddna.glossmap' not in rel_path.lower():
-                                                            if not rel_path.lower().startswith("data/"):
-                                                                rel_path = "Data/" + rel_path
-                                                            globals_and_threading.missing_files.add(rel_path)
-                                                    continue
-                                                if globals_and_threading.debug: print(f"Processing bones file: {file}")
-                                                __class__.import_file(file, root_obj_name)
-                                            if globals_and_threading.debug: print("DEBUG: Finished processing bones files")
-
-                                        if globals_and_threading.debug: print(f"Imported object for '{item_port_name}' GUID {guid_str} → {geometry_path}")
-
-            # Process nested loadout regardless of whether we imported geometry
-            if should_process_nested and nested_loadout:
-                entries_count = len(nested_loadout.properties.get('entries', []))
-                if globals_and_threading.debug: print(f"DEBUG: Processing nested loadout with {entries_count} entries for GUID {guid_str}...")
+                                                for file in process_bones_file:
+                                                    if not __class__.geometry_file_exists(file):
+                                                        if globals_and_threading.debug: print(f"⚠️ ERROR: Bones file missing: {file}")
+                                                        if str(file) not in globals_and_threading.missing_files:
+                                                            try:
+                                                                rel_path = str(file.relative_to(__class__.extract_dir))
+                                                            except ValueError:
+                                                                rel_path = str(file)
+                                                            if not rel_path.startswith('$') and 'ddna.glossmap' not in rel_path.lower():
+                                                                if not rel_path.lower().startswith("data/"):
+                                                                    rel_path = "Data/" + rel_path
+                                                                globals_and_threading.missing_files.add(rel_path)
+                                                        continue
+                                                    if globals_and_threading.debug: print(f"Processing bones file: {file}")
+                                                    __class__.import_file(file, root_obj_name)
+                                                if globals_and_threading.debug: print("DEBUG: Finished processing bones files")
+
+                                            if __class__.should_instance_component(nested_loadout):
+                                                # Keep this first copy as the source for every use of the GUID, and instance it here too
+                                                collection = __class__.make_instance_source(guid_str, root_obj)
+                                                __class__.add_component_instance(collection, matching_empty)
+                                            __class__.index_hardpoint_subtree(matching_empty)
+                                            if globals_and_threading.debug: print(f"Imported object for '{item_port_name}' GUID {guid_str} → {geometry_path}")
+
+                # Process nested loadout regardless of whether we imported geometry
+                if should_process_nested and nested_loadout:
+                    entries_count = len(nested_loadout.properties.get('entries', []))
+                    if globals_and_threading.debug: print(f"DEBUG: Processing nested loadout with {entries_count} entries for GUID {guid_str}...")
                 
-                # Get empties from the target hardpoint (whether newly imported or existing)
-                nested_empties = []
-                def collect_empties(obj):
-                    if obj.type == 'EMPTY':
-                        nested_empties.append(obj)
-                    for child in obj.children:
-                        collect_empties(child)
+                    # Get empties from the target hardpoint (whether newly imported or existing)
+                    nested_empties = []
+                    def collect_empties(obj):
+                        if obj.type == 'EMPTY':
+                            nested_empties.append(obj)
+                        for child in obj.children:
+                            collect_empties(child)
                 
-                collect_empties(target_empty)
+                    collect_empties(target_empty)
 
-                mapping = __class__.get_hardpoint_mapping_from_guid(guid_str) or {}
-                if globals_and_threading.debug: print(f"DEBUG: Found empties in target hardpoint: {[e.name for e in nested_empties]}")
-                if globals_and_threading.debug: print(f"DEBUG: Mapping for GUID {guid_str}: {mapping}")
+                    mapping = __class__.get_hardpoint_mapping_from_guid(guid_str) or {}
+                    if globals_and_threading.debug: print(f"DEBUG: Found empties in target hardpoint: {[e.name for e in nested_empties]}")
+                    if globals_and_threading.debug: print(f"DEBUG: Mapping for GUID {guid_str}: {mapping}")
                 
-                for empty in nested_empties:
-                    # Set orig_name to the mapping key if the name matches, otherwise to the base name without suffix
-                    for key in mapping:
-                        if __class__.matches_blender_name(empty.name, key):
-                            value = mapping[key]
-                            if isinstance(value, list) and value:
-                                empty['orig_name'] = value[0]
-                            else:
-                                empty['orig_name'] = value
-                            break
-                    else:
-                        empty['orig_name'] = re.sub(r'\.\d+$', '', empty.name)
+                    for empty in nested_empties:
+                        # Set orig_name to the mapping key if the name matches, otherwise to the base name without suffix
+                        for key in mapping:
+                            if __class__.matches_blender_name(empty.name, key):
+                                value = mapping[key]
+                                if isinstance(value, list) and value:
+                                    empty['orig_name'] = value[0]
+                                else:
+                                    empty['orig_name'] = value
+                                break
+                        else:
+                            empty['orig_name'] = re.sub(r'\.\d+$', '', empty.name)
+                        __class__.reindex_hardpoint(empty)
 
-                __class__.import_hardpoint_hierarchy(nested_loadout, nested_empties, is_top_level=False, parent_guid=guid_str, skip_import_geometry=skip_import_geometry or skip_geometry_for_nested)
-            else:
-                if globals_and_threading.debug: print("DEBUG: No nested loadout to process")
+                    yield from __class__.iter_import_hardpoint_hierarchy(nested_loadout, nested_empties, is_top_level=False, parent_guid=guid_str, skip_import_geometry=skip_import_geometry or skip_geometry_for_nested)
+                else:
+                    if globals_and_threading.debug: print("DEBUG: No nested loadout to process")
+        finally:
+            __class__.hardpoint_index_stack.pop()
 
         # Clear progress when done with this level
         if is_top_level:
@@ -1356,7 +1546,7 @@ class SCOrg_tools_import():
             if globals_and_threading.debug: print(f"❌ ERROR: import_file called with no geometry_path")
             return
 
-        if not geometry_path.exists():
+        if not __class__.geometry_file_exists(geometry_path):
             print(f".DAE file not found at: {geometry_path}")
             if globals_and_threading.debug: print(f"DEBUG: Attempted DAE import path: {geometry_path}, but file was missing")
             rel_path = __class__.get_relative_path_for_missing_files(geometry_path)
@@ -1364,21 +1554,13 @@ class SCOrg_tools_import():
             print(f"Added to missing_files (loc 3): {rel_path}")
             return
 
-        # Get a set of all objects before import
-        before = set(bpy.data.objects)
-
-        bpy.ops.object.select_all(action='DESELECT')
-        result = __class__.import_dae(geometry_path)
+        # Imported into a staging collection, so the new objects are known without scanning the scene
+        imported_objs = __class__.import_dae_staged(geometry_path)
+        result = imported_objs is not None
         if result != True:
             if globals_and_threading.debug: print(f"❌ ERROR: Failed to import DAE for: {geometry_path}")
             return
         
-        # Get a set of all objects after import
-        after = set(bpy.data.objects)
-
-        # The difference is the set of newly imported objects
-        imported_objs = list(after - before)
-
         # Find root objects (those without a parent)
         root_objs = [obj for obj in imported_objs if obj.parent is None]
 
@@ -1397,6 +1579,9 @@ class SCOrg_tools_import():
     def run_import():
         os.system('cls')
         __class__.imported_guid_objects = {}
+        __class__.scene_hardpoint_index = None
+        __class__.hardpoint_index_stack = []
+        __class__.instance_collections = {}
         __class__.INCLUDE_HARDPOINTS = [] # all
         globals_and_threading.missing_files = set()
         __class__.set_translation_new_data_preference()
@@ -1422,11 +1607,21 @@ class SCOrg_tools_import():
             misc_utils.SCOrg_tools_misc.error("Could not find top-level loadout in ship record. Check the structure of the record.")
             return
 
+        # Extract everything the ship's loadout needs up front, the import carries on once that's done
+        __class__.pre_extract_dependencies(record=record, on_ready=lambda: __class__.run_import_hardpoints(top_level_loadout, displacement_strength))
+
+    @staticmethod
+    def run_import_hardpoints(top_level_loadout, displacement_strength):
+        """Second half of run_import: fill the ship's hardpoints once its dependencies are extracted."""
         empties_to_fill = __class__.get_all_empties_blueprint()
 
         if globals_and_threading.debug: print(f"Total hardpoints to import: {len(empties_to_fill)}")
 
-        __class__.import_hardpoint_hierarchy(top_level_loadout, empties_to_fill)
+        __class__.start_dae_preparse(top_level_loadout)
+        try:
+            __class__.import_hardpoint_hierarchy(top_level_loadout, empties_to_fill)
+        finally:
+            __class__.stop_dae_preparse()
         
         blender_utils.SCOrg_tools_blender.fix_modifiers(displacement_strength)
         
@@ -1451,6 +1646,46 @@ class SCOrg_tools_import():
         if globals_and_threading.debug: print("DEBUG: Record has no loadout")
         return None
     
+    @staticmethod
+    def get_scene_hardpoint_index():
+        if __class__.scene_hardpoint_index is None:
+            __class__.scene_hardpoint_index = HardpointIndex(obj for obj in bpy.data.objects if obj.type == 'EMPTY')
+        return __class__.scene_hardpoint_index
+
+    @staticmethod
+    def index_hardpoint_subtree(obj):
+        """Add the empties of a freshly imported or duplicated subtree to the scene index."""
+        index = __class__.get_scene_hardpoint_index()
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            if current.type == 'EMPTY':
+                index.add(current)
+            stack.extend(current.children)
+
+    @staticmethod
+    def reindex_hardpoint(obj):
+        """Pick up a changed name or orig_name in every index that lists the object."""
+        for index in [__class__.get_scene_hardpoint_index()] + __class__.hardpoint_index_stack:
+            if obj in index:
+                index.add(obj)
+
+    @staticmethod
+    def find_hardpoint(mapped_name, empties_index):
+        """
+        Return (matching_empty, filled_hardpoint): the first empty hardpoint of this level named
+        mapped_name, or if there is none, a hardpoint anywhere in the file that already has children.
+        """
+        matching_empty = empties_index.find(mapped_name)
+        filled_hardpoint = None
+        if not matching_empty:
+            # Search all empties (not just empty ones) for a match to handle filled hardpoints with nested loadouts.
+            # bpy.data.objects is sorted by name, so take the first name as a scan of it would
+            filled_hardpoint = __class__.get_scene_hardpoint_index().find(
+                mapped_name, predicate=lambda obj: len(obj.children) > 0 and not __class__.is_instance_source(obj), sort_key=lambda obj: obj.name)
+            if filled_hardpoint and globals_and_threading.debug: print(f"DEBUG: Found filled hardpoint: {filled_hardpoint.name} for '{mapped_name}'")
+        return matching_empty, filled_hardpoint
+
     @staticmethod
     def matches_blender_name(name, target):
         #print(f"DEBUG: matches_blender_name called with name='{name}', target='{target}'")
@@ -1646,6 +1881,11 @@ class SCOrg_tools_import():
 
     @staticmethod
     def import_missing_materials(tint_number = 0):
+        for _ in __class__.iter_import_missing_materials(tint_number):
+            pass
+
+    @staticmethod
+    def iter_import_missing_materials(tint_number = 0):
         if __class__.extract_dir is None:
             # Only initialize extract_dir, don't call init() which would clear missing_files!
             prefs = bpy.context.preferences.addons["scorg_tools"].preferences
@@ -1675,6 +1915,7 @@ class SCOrg_tools_import():
         material_names = list(bpy.data.materials.keys())
         from pprint import pprint
         for i, mat_name in enumerate(material_names):
+            yield
             ui_tools.progress_bar_popup("import_materials", i, len(material_names), f"Importing {mat_name}...")
             
             # Get fresh reference to the material
@@ -1796,7 +2037,8 @@ class SCOrg_tools_import():
                 # Material was removed during iteration, skip it
                 if globals_and_threading.debug: print(f"DEBUG: Material {mat_name} was removed during processing, skipping")
                 continue
-            
+
+        yield  # Loading the found .mtl files below is one call into scdatatools and can't be split up
         # Make sure the tint group is initialised, pass the item_name
         record = misc_utils.SCOrg_tools_misc.get_ship_record(skip_error=True)
         if not record and __class__.item_guid:
@@ -2124,22 +2366,63 @@ class SCOrg_tools_import():
                     bpy.context.preferences.view.use_translate_new_dataname = __class__.translation_new_data_preference
                     if globals_and_threading.debug: print("DEBUG: Reset translation for New data preference to original value")
     
+    @staticmethod
+    def get_geometry_suffix(prefs=None):
+        """Extension cgf-converter output is written with, from the Geometry Format preference."""
+        if prefs is None:
+            prefs = __class__.prefs or bpy.context.preferences.addons["scorg_tools"].preferences
+        return '.glb' if getattr(prefs, 'geometry_format', 'DAE') == 'GLB' else '.dae'
+
+    @staticmethod
+    def find_geometry_file(geometry_path, preferred_suffix=None):
+        """
+        Geometry is referred to by its .dae path throughout, but may have been converted to .glb.
+        Return the converted file that exists, the preferred format first, or None if neither does.
+        Paths that aren't .dae are returned as they are if they exist.
+        """
+        geometry_path = Path(geometry_path)
+        if geometry_path.suffix.lower() != '.dae':
+            return geometry_path if geometry_path.is_file() else None
+        preferred_suffix = preferred_suffix or __class__.get_geometry_suffix()
+        for suffix in (preferred_suffix, '.glb' if preferred_suffix == '.dae' else '.dae'):
+            candidate = geometry_path.with_suffix(suffix)
+            if candidate.is_file():
+                return candidate
+        return None
+
+    @staticmethod
+    def geometry_file_exists(geometry_path, preferred_suffix=None):
+        return __class__.find_geometry_file(geometry_path, preferred_suffix) is not None
+
+    @staticmethod
+    def import_glb(file):
+        """Import a .glb written by cgf-converter with Blender's glTF importer. Returns True on success."""
+        try:
+            result = bpy.ops.import_scene.gltf(filepath=str(file))
+        except RuntimeError as e:
+            if globals_and_threading.debug: print(f"ERROR: glTF import failed for {file}: {e}")
+            return False
+        return 'FINISHED' in result
+
     @staticmethod
     def import_dae(geometry_path: typing.Union[str, Path]):
-        """Import a .dae file using Blender's built-in Collada importer."""
+        """Import a .dae file with the native importer (dae_utils), or Blender's built-in Collada importer."""
         geometry_path = Path(geometry_path)
         if __class__.extract_dir is None:
             prefs = bpy.context.preferences.addons["scorg_tools"].preferences
             extract_dir = getattr(prefs, 'extract_dir', None)
             __class__.extract_dir = Path(extract_dir) if extract_dir else None
         
-        file = geometry_path.with_suffix(".dae")
+        # Another session may be converting it right now, wait for that rather than reading a partial file
+        lock_utils.SCOrg_tools_lock.wait_for_unlock(geometry_path.with_suffix(".dae"), timeout=CGF_CONVERTER_TIMEOUT)
+        geometry_suffix = __class__.get_geometry_suffix()
+        file = __class__.find_geometry_file(geometry_path.with_suffix(".dae"), geometry_suffix) or geometry_path.with_suffix(geometry_suffix)
         if not file.is_file():
             # Try to convert from CGF if it exists
             cgf_file = geometry_path.with_suffix(".cgf")
             if cgf_file.is_file():
-                if globals_and_threading.debug: print(f"DAE not found, attempting to convert from CGF: {cgf_file}")
-                if __class__.convert_cgf_to_dae(cgf_file, file):
+                if globals_and_threading.debug: print(f"{geometry_suffix[1:].upper()} not found, attempting to convert from CGF: {cgf_file}")
+                if __class__.convert_cgf_to_dae(cgf_file, file, output_format=geometry_suffix[1:]):
                     if globals_and_threading.debug: print(f"Successfully converted {cgf_file} to {file}")
                 else:
                     if globals_and_threading.debug: print(f"Failed to convert {cgf_file}")
@@ -2154,8 +2437,20 @@ class SCOrg_tools_import():
                 globals_and_threading.missing_files.add(rel_path)
                 return False
 
+        if file.suffix.lower() == '.glb':
+            if __class__.import_glb(file):
+                return True
+            if globals_and_threading.debug: print(f"❌ ERROR: Failed to import GLB for: {file}")
+            rel_path = __class__.get_relative_path_for_missing_files(geometry_path)
+            globals_and_threading.missing_files.add(rel_path)
+            return False
+
+        native_result = __class__.import_dae_native(file)
+        if native_result is not None:
+            return native_result
+
         try:
-            result = bpy.ops.wm.collada_import(filepath=str(geometry_path), auto_connect=False)
+            result = bpy.ops.wm.collada_import(filepath=str(file), auto_connect=False)
         except RuntimeError as e:
             if globals_and_threading.debug: print(f"ERROR: Collada import failed for {geometry_path}: {e}")
             # Add to missing files, assuming the file might be corrupted or incomplete
@@ -2171,6 +2466,285 @@ class SCOrg_tools_import():
             return False
         return True
 
+    @staticmethod
+    def is_collada_operator_available():
+        """The Collada operator is gone from recent Blender releases."""
+        return 'collada_import' in dir(bpy.ops.wm)
+
+    @staticmethod
+    def import_dae_native(dae_path):
+        """
+        Import a .dae with the native importer, if it is selected (or the Collada operator is missing) and can handle the file.
+        Returns True/False for success, or None to fall back to the Collada operator.
+        """
+        prefs = __class__.prefs or bpy.context.preferences.addons["scorg_tools"].preferences
+        collada_available = __class__.is_collada_operator_available()
+        if getattr(prefs, 'geometry_importer', 'NATIVE') != 'NATIVE' and collada_available:
+            return None
+        if not dae_utils.SCOrg_tools_dae.is_available():
+            return None if collada_available else False
+
+        start = time.perf_counter()
+        parsed = __class__.dae_preparser.take(dae_path) if __class__.dae_preparser else None
+        if parsed is None:
+            try:
+                parsed = dae_utils.SCOrg_tools_dae.parse(dae_path)
+            except Exception as e:
+                print(f"ERROR: Could not parse {dae_path}: {e}")
+                return None if collada_available else False
+        if parsed['unsupported'] and collada_available:
+            if globals_and_threading.debug: print(f"DEBUG: {dae_path.name} uses {parsed['unsupported']}, using the Collada importer")
+            return None
+        parse_time = time.perf_counter() - start
+
+        __class__.build_dae_objects(parsed)
+        if globals_and_threading.debug:
+            nodes, geometries, polygons = dae_utils.SCOrg_tools_dae.count(parsed)
+            print(f"DEBUG: Native import of {dae_path.name}: {nodes} nodes, {geometries} meshes, {polygons} polygons, "
+                  f"parsed in {parse_time * 1000:.0f} ms, built in {(time.perf_counter() - start - parse_time) * 1000:.0f} ms")
+        return True
+
+    @staticmethod
+    def collect_geometry_plan(loadout, plan=None, seen_guids=None):
+        """
+        The .dae files importing `loadout` will parse, in the order the import reaches them. Each GUID is
+        listed once (repeats are duplicated, not parsed again), CDF attachments are left out.
+        """
+        if plan is None:
+            plan, seen_guids = [], set()
+        dcb = globals_and_threading.dcb
+        if loadout is None or not dcb or not hasattr(loadout, 'properties'):
+            return plan
+        for entry in loadout.properties.get('entries', []):
+            props = getattr(entry, 'properties', entry)
+            guid = str(props.get('entityClassReference'))
+            if not __class__.is_guid(guid):
+                entity_class_name = getattr(props, 'entityClassName', None)
+                guid = __class__.get_guid_by_name(entity_class_name) if entity_class_name else None
+            record = dcb.records_by_guid.get(guid) if guid else None
+            if record is None or guid in seen_guids:
+                continue
+            seen_guids.add(guid)
+            path = __class__.get_geometry_path(record=record, original_path=True)
+            if path and Path(path).suffix.lower() != '.cdf':
+                plan.append(__class__.extract_dir / Path(path).with_suffix('.dae'))
+            nested_loadout = props.get('loadout')
+            if not (hasattr(nested_loadout, 'properties') and nested_loadout.properties.get('entries', [])):
+                nested_loadout = __class__.get_loadout_from_record(record)
+            __class__.collect_geometry_plan(nested_loadout, plan, seen_guids)
+        return plan
+
+    @staticmethod
+    def start_dae_preparse(loadout):
+        """
+        Start parsing the .dae files of an import in worker processes, when the native importer will read them
+        and the Geometry Parse Processes preference is set. Files that the geometry cache will serve are skipped.
+        """
+        __class__.stop_dae_preparse()
+        prefs = __class__.prefs or bpy.context.preferences.addons["scorg_tools"].preferences
+        processes = getattr(prefs, 'dae_preparse_processes', 0)
+        if processes <= 0 or not dae_utils.SCOrg_tools_dae.is_available():
+            return
+        if getattr(prefs, 'geometry_format', 'DAE') != 'DAE':
+            return
+        if getattr(prefs, 'geometry_importer', 'NATIVE') != 'NATIVE' and __class__.is_collada_operator_available():
+            return
+        if __class__.extract_dir is None:
+            __class__.init()
+
+        paths = []
+        for path in __class__.collect_geometry_plan(loadout):
+            if not path.is_file():
+                continue
+            cache_path = __class__.get_geometry_cache_path(path)
+            if cache_path is not None and cache_path.is_file():
+                continue
+            paths.append(path)
+        if not paths:
+            return
+        if globals_and_threading.debug: print(f"DEBUG: Pre-parsing {len(paths)} DAE files in {processes} processes")
+        __class__.dae_preparser = dae_utils.DaePreparser(processes)
+        __class__.dae_preparser.add(paths)
+
+    @staticmethod
+    def stop_dae_preparse():
+        if __class__.dae_preparser is None:
+            return
+        preparser, __class__.dae_preparser = __class__.dae_preparser, None
+        preparser.close()
+        if globals_and_threading.debug: print(f"DEBUG: {preparser.describe()}")
+
+    @staticmethod
+    def build_dae_objects(parsed, collection=None):
+        """
+        Create the objects of a parsed .dae (see dae_utils) the way the Collada operator does: one object per node,
+        named after the node, parented as in the file, with meshes named after their geometry and materials on the mesh data.
+        Objects are linked to the active collection and left selected. Returns the list of created objects.
+        """
+        import numpy as np
+        collection = collection or bpy.context.collection
+        materials = {}  # material id -> material, created once per file like the Collada operator does
+        meshes = {}  # (geometry id, material bindings) -> mesh, nodes instancing the same geometry share it
+        created = []
+
+        def get_material(material_id, symbol):
+            if material_id not in materials:
+                material = bpy.data.materials.new(parsed['materials'].get(material_id) or symbol)
+                material.use_nodes = True
+                materials[material_id] = material
+            return materials[material_id]
+
+        def get_mesh(geometry_id, bindings):
+            key = (geometry_id, tuple(sorted(bindings.items())))
+            if key in meshes:
+                return meshes[key]
+            geometry = parsed['geometries'][geometry_id]
+            positions = geometry['positions']
+            loop_starts = geometry['loop_starts']
+            mesh = bpy.data.meshes.new(geometry['name'])
+            mesh.vertices.add(len(positions))
+            mesh.vertices.foreach_set('co', positions.ravel())
+            mesh.loops.add(len(geometry['vertex_indices']))
+            mesh.loops.foreach_set('vertex_index', geometry['vertex_indices'])
+            mesh.polygons.add(len(loop_starts))
+            mesh.polygons.foreach_set('loop_start', loop_starts)
+            if bpy.app.version < (4, 0, 0):
+                mesh.polygons.foreach_set('loop_total', geometry['loop_totals'])
+            mesh.polygons.foreach_set('material_index', geometry['material_indices'])
+            if geometry['uvs'] is not None:
+                uv_layer = mesh.uv_layers.new(name="UVMap")
+                uv_layer.data.foreach_set('uv', geometry['uvs'].ravel())
+            for symbol in geometry['material_symbols']:
+                mesh.materials.append(get_material(bindings.get(symbol, symbol), symbol))
+            mesh.update(calc_edges=True)
+            mesh.validate(clean_customdata=False)
+            normals = geometry['normals']
+            if normals is not None and len(normals) == len(mesh.loops):
+                mesh.polygons.foreach_set('use_smooth', np.ones(len(mesh.polygons), dtype=bool))
+                if hasattr(mesh, 'use_auto_smooth'):
+                    mesh.use_auto_smooth = True  # Needed for custom normals before Blender 4.1
+                mesh.normals_split_custom_set(normals)
+            meshes[key] = mesh
+            return mesh
+
+        def create(node, parent, matrix):
+            data = get_mesh(node['geometry'], node['materials']) if node['geometry'] in parsed['geometries'] else None
+            obj = bpy.data.objects.new(node['name'], data)
+            collection.objects.link(obj)
+            obj.parent = parent
+            obj.matrix_basis = matrix.tolist()
+            obj.select_set(True)
+            created.append(obj)
+            for child in node['children']:
+                create(child, obj, child['matrix'])
+
+        up_axis_matrix = dae_utils.SCOrg_tools_dae.get_up_axis_matrix(parsed['up_axis'])
+        for node in parsed['nodes']:
+            create(node, None, up_axis_matrix @ node['matrix'])
+        return created
+
+    @staticmethod
+    def import_dae_staged(geometry_path: typing.Union[str, Path]):
+        """
+        Import a .dae file into an empty staging collection, then move what it created into the active collection.
+        The staging collection holds exactly the new objects, so the cost doesn't grow with the size of the scene.
+        Returns the list of imported objects, or None if the import failed.
+        """
+        # The new objects are left selected, so deselect what the previous import left selected rather than
+        # running select_all, which walks every object in the scene
+        for obj in __class__.staged_selection:
+            try:
+                obj.select_set(False)
+            except (ReferenceError, RuntimeError):
+                pass  # removed since, or no longer in the view layer
+        __class__.staged_selection = []
+
+        view_layer = bpy.context.view_layer
+        target_layer = view_layer.active_layer_collection
+        target = target_layer.collection
+        staging = bpy.data.collections.new("SCOrg_import_staging")
+        target.children.link(staging)
+        view_layer.active_layer_collection = target_layer.children[staging.name]
+        cache_path = __class__.get_geometry_cache_path(geometry_path)
+        try:
+            if cache_path and cache_path.is_file() and __class__.load_geometry_cache(cache_path, staging):
+                result = True
+            else:
+                result = __class__.import_dae(geometry_path)
+                if result == True and cache_path and staging.objects:
+                    __class__.save_geometry_cache(cache_path, staging.objects)
+        finally:
+            view_layer.active_layer_collection = target_layer
+            imported_objs = list(staging.objects)
+            for obj in imported_objs:
+                target.objects.link(obj)
+                staging.objects.unlink(obj)
+            bpy.data.collections.remove(staging)
+        __class__.staged_selection = imported_objs
+        return imported_objs if result == True else None
+
+    @staticmethod
+    def get_geometry_cache_path(geometry_path):
+        """
+        Return the cache .blend for a DAE (or the GLB converted in its place), or None if caching is off
+        or the file doesn't exist yet. The name includes its modification time, so a re-converted file
+        misses the old entry.
+        """
+        import hashlib
+        prefs = __class__.prefs or bpy.context.preferences.addons["scorg_tools"].preferences
+        if not getattr(prefs, 'use_geometry_cache', False) or __class__.extract_dir is None:
+            return None
+        dae_path = __class__.find_geometry_file(Path(geometry_path).with_suffix(".dae"), __class__.get_geometry_suffix(prefs))
+        if dae_path is None:
+            return None
+        try:
+            mtime = dae_path.stat().st_mtime_ns
+        except OSError:
+            return None
+        try:
+            key = dae_path.relative_to(__class__.extract_dir).as_posix().lower()
+        except ValueError:
+            key = dae_path.as_posix().lower()
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return __class__.extract_dir / __class__.GEOMETRY_CACHE_DIR_NAME / f"{dae_path.stem}_{digest}_{mtime}.blend"
+
+    @staticmethod
+    def save_geometry_cache(cache_path, objects):
+        """Write freshly imported objects (with their meshes and materials) to the cache .blend."""
+        cache_path = Path(cache_path)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Drop entries for older versions of the same DAE
+            prefix = cache_path.stem.rsplit('_', 1)[0]
+            for old_path in cache_path.parent.glob(f"{glob.escape(prefix)}_*.blend"):
+                if old_path != cache_path:
+                    old_path.unlink(missing_ok=True)
+            temp_path = lock_utils.SCOrg_tools_lock.get_temp_path(cache_path)
+            bpy.data.libraries.write(str(temp_path), set(objects), fake_user=False, compress=False)
+            lock_utils.SCOrg_tools_lock.replace(temp_path, cache_path)
+            if globals_and_threading.debug: print(f"DEBUG: Cached {len(objects)} objects to {cache_path.name}")
+        except Exception as e:
+            print(f"Warning: Could not write geometry cache {cache_path}: {e}")
+
+    @staticmethod
+    def load_geometry_cache(cache_path, collection):
+        """
+        Append every object from a cache .blend into the collection.
+        Returns True on success, False if the cache could not be read (the caller falls back to Collada).
+        """
+        try:
+            with bpy.data.libraries.load(str(cache_path), link=False) as (data_from, data_to):
+                data_to.objects = data_from.objects
+        except Exception as e:
+            print(f"Warning: Could not read geometry cache {cache_path}: {e}")
+            return False
+        for obj in data_to.objects:
+            if obj is not None:
+                collection.objects.link(obj)
+                obj.select_set(True)  # the Collada importer leaves what it created selected, later steps rely on it
+        if globals_and_threading.debug: print(f"DEBUG: Appended {len(data_to.objects)} objects from {Path(cache_path).name}")
+        return True
+
     @staticmethod
     def get_main_material_file():
         """
@@ -2528,13 +3102,493 @@ class SCOrg_tools_import():
         return mtl_lookup
 
     @staticmethod
-    def extract_missing_files(file_list_text, prefs):
+    def build_p4k_lookup():
+        """
+        Build (and cache) a case-insensitive lookup of the archive entries the dependency
+        resolver cares about. Record, CDF and MTL paths rarely match the archive casing.
+        Returns a dictionary: lowercase path without "Data/" -> P4K info object
+        """
+        p4k = globals_and_threading.p4k
+        if not p4k:
+            return {}
+
+        if __class__._cached_p4k_lookup is not None and __class__._cached_p4k_lookup[0] is p4k:
+            return __class__._cached_p4k_lookup[1]
+
+        wanted_exts = ('.cdf', '.mtl', '.cga', '.cgf', '.chr', '.skin', '.dds')
+        lookup = {}
+        for info in p4k.filelist:
+            name = info.filename.replace("\\", "/")
+            lower_name = name.lower()
+            if not lower_name.endswith(wanted_exts):
+                continue
+            if lower_name.startswith("data/"):
+                lower_name = lower_name[5:]
+            lookup[lower_name] = info
+
+        __class__._cached_p4k_lookup = (p4k, lookup)
+        if globals_and_threading.debug: print(f"DEBUG: Built P4K lookup for {len(lookup)} entries")
+        return lookup
+
+    @staticmethod
+    def get_reduced_texture_manifest_path(extract_dir):
+        """Path of the manifest listing textures that were extracted with a mip cap."""
+        return Path(extract_dir) / "scorg_reduced_textures.json"
+
+    @staticmethod
+    def load_reduced_texture_manifest(extract_dir):
+        """
+        Load the reduced texture manifest.
+        Returns a dictionary: requested texture path -> number of mip levels left out
+        """
+        import json
+        manifest_path = __class__.get_reduced_texture_manifest_path(extract_dir)
+        if not manifest_path.is_file():
+            return {}
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read {manifest_path}: {e}")
+            return {}
+
+    @staticmethod
+    def update_reduced_texture_manifest(extract_dir, texture_mip_skips):
+        """
+        Record which textures were written at reduced resolution, and forget any that
+        have since been extracted at full resolution.
+        """
+        import json
+        manifest = __class__.load_reduced_texture_manifest(extract_dir)
+        for texture_path, skipped in texture_mip_skips.items():
+            if skipped > 0:
+                manifest[texture_path] = skipped
+            else:
+                manifest.pop(texture_path, None)
+        manifest_path = __class__.get_reduced_texture_manifest_path(extract_dir)
+        try:
+            if not manifest:
+                manifest_path.unlink(missing_ok=True)
+                return
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+        except OSError as e:
+            print(f"Warning: Could not write {manifest_path}: {e}")
+
+    @staticmethod
+    def upgrade_reduced_textures(prefs):
+        """
+        Re-extract every texture in the reduced texture manifest at full resolution
+        and reload the matching images in Blender.
+
+        Returns:
+            tuple: (success_count, fail_count, report_lines)
+        """
+        extract_dir = Path(prefs.extract_dir)
+        manifest = __class__.load_reduced_texture_manifest(extract_dir)
+        if not manifest:
+            return 0, 0, []
+
+        result = __class__.extract_missing_files("\n".join(sorted(manifest)), prefs, mip_cap=0)
+        __class__.reload_extracted_images(extract_dir, manifest)
+        return result
+
+    @staticmethod
+    def reload_extracted_images(extract_dir, texture_paths):
+        """Reload every Blender image that uses one of the given "Data/..." texture paths."""
+        extract_dir = Path(extract_dir)
+        upgraded = set()
+        for texture_path in texture_paths:
+            relative_path = texture_path[5:] if texture_path.lower().startswith("data/") else texture_path
+            upgraded.add(os.path.normcase(os.path.normpath(str(extract_dir / relative_path))).lower())
+        reloaded = 0
+        for image in bpy.data.images:
+            if not image.filepath:
+                continue
+            image_path = os.path.normcase(os.path.normpath(bpy.path.abspath(image.filepath))).lower()
+            if image_path in upgraded:
+                image.reload()
+                reloaded += 1
+        print(f"Reloaded {reloaded} images at full resolution")
+        return reloaded
+
+    @staticmethod
+    def strip_data_prefix(path):
+        """Return an archive path relative to Data/, files are extracted without the Data/ prefix."""
+        if path.lower().startswith("data/") or path.lower().startswith("data\\"):
+            return path[5:]
+        return path
+
+    @staticmethod
+    def get_extraction_key(file_path, extract_dir=None):
+        """
+        Canonical key for an extraction request: lowercase and relative to Data/. Geometry requests
+        have the extension replaced by the source file they resolve to in the archive, e.g.
+        "Data\\Objects\\Ship.CGA", "objects/ship.dae" -> "objects/ship.<geometry>". Textures keep their
+        extension, the requested suffix decides the output format so .tif and .png are different files.
+        """
+        path = file_path.strip().replace("\\", "/")
+        lower_path = path.lower()
+        if extract_dir:
+            extract_str = str(extract_dir).replace("\\", "/").rstrip('/').lower() + '/'
+            # Absolute paths inside the extract dir, optionally with a "Data/" prefix in front
+            for prefix in ("", "data/"):
+                if lower_path.startswith(prefix + extract_str):
+                    lower_path = lower_path[len(prefix + extract_str):]
+                    break
+        if lower_path.startswith("data/"):
+            lower_path = lower_path[5:]
+
+        stem, suffix = os.path.splitext(lower_path)
+        if suffix in ('.dae', '.cga', '.cgf', '.chr', '.skin'):
+            for variant_suffix in ('_chr', '_skin'):
+                if suffix in ('.chr', '.skin') and stem.endswith(variant_suffix):
+                    stem = stem[:-len(variant_suffix)]
+            return stem + '.<geometry>'
+        return lower_path
+
+    @staticmethod
+    def get_extraction_priority(task, dds_part_index):
+        """
+        Work out where a planned extraction task goes in the queue.
+
+        Returns:
+            tuple: (priority, estimated_size), lower sorts first
+        """
+        suffix = Path(task['actual_path']).suffix.lower()
+        estimated_size = task['p4k_info'].file_size
+        if suffix == '.cdf' or suffix in task['conversion_exts']:
+            return __class__.EXTRACTION_PRIORITY_GEOMETRY, estimated_size
+        if suffix == '.mtl':
+            return __class__.EXTRACTION_PRIORITY_MATERIAL, estimated_size
+        if suffix == '.dds':
+            split_parts = dds_part_index.get(task['actual_path'].replace("\\", "/").lower(), [])
+            estimated_size += sum(getattr(part, 'file_size', 0) for part in split_parts)
+            return __class__.EXTRACTION_PRIORITY_TEXTURE, estimated_size
+        return __class__.EXTRACTION_PRIORITY_OTHER, estimated_size
+
+    @staticmethod
+    def get_dds_part_index():
+        """
+        Build (and cache) the index of split DDS mip parts in the loaded Data.p4k.
+        Returns a dictionary: lowercase base .dds path -> part info objects, largest mip first
+        """
+        p4k = globals_and_threading.p4k
+        if not p4k:
+            return {}
+
+        if __class__._cached_dds_part_index is not None and __class__._cached_dds_part_index[0] is p4k:
+            return __class__._cached_dds_part_index[1]
+
+        index = dds_utils.SCOrg_tools_dds.build_split_part_index(p4k.filelist)
+        __class__._cached_dds_part_index = (p4k, index)
+        if globals_and_threading.debug: print(f"DEBUG: Indexed split parts for {len(index)} DDS files")
+        return index
+
+    @staticmethod
+    def resolve_dependency_closure(guid=None, record=None, progress_callback=None):
+        """
+        Walk a record (ship or item) and everything its loadout references, and collect the
+        full set of files needed to import it: geometry, CDF attachments, MTLs (including
+        layer/sub-material references) and the textures those MTLs use.
+
+        Geometry companion files (.cgam, .chrparams, .meshsetup, .skinm) are not listed,
+        extract_missing_files pulls them in alongside the geometry they belong to.
+
+        MTLs and CDFs that are already in the extract directory are read from there rather than the archive.
+
+        Args:
+            guid: GUID of the record to resolve (ignored if record is given)
+            record: Datacore record to resolve
+            progress_callback (callable, optional): Called as progress_callback(current, total, message) instead
+                of updating the progress popup, use this when running off the main thread
+
+        Returns:
+            set: "Data/..." paths in the same form as missing_files, or an empty set
+        """
+        dcb = globals_and_threading.dcb
+        if not dcb or not globals_and_threading.p4k:
+            misc_utils.SCOrg_tools_misc.error("Please load Data.p4k first")
+            return set()
+        if record is None:
+            record = dcb.records_by_guid.get(str(guid))
+        if record is None:
+            if globals_and_threading.debug: print(f"DEBUG: resolve_dependency_closure could not find record for {guid}")
+            return set()
+
+        import xml.etree.ElementTree as ET
+
+        show_progress_popup = progress_callback is None
+        if show_progress_popup:
+            def progress_callback(current, total, message):
+                ui_tools.progress_bar_popup("resolve_dependencies", current, total, message)
+
+        p4k_lookup = __class__.build_p4k_lookup()
+        conversion_exts = ('.cga', '.cgf', '.chr', '.skin')
+        texture_exts = ('.tif', '.png', '.tga', '.dds')
+        records_by_name = None
+
+        closure = set()
+        visited_records = set()
+        visited_files = set()
+        pending_records = [record]
+
+        def clean(path):
+            """Normalise a datacore/CDF/MTL path to a lowercase archive path without "Data/"."""
+            if not path:
+                return None
+            path = str(path).strip().replace("\\", "/")
+            if path.startswith('$') or 'ddna.glossmap' in path.lower():
+                return None
+            if path.lower().startswith("data/"):
+                path = path[5:]
+            return path.lower()
+
+        def add_geometry(path):
+            path = clean(path)
+            if not path:
+                return
+            path_obj = Path(path)
+            # Same filtering as get_preferred_geometry_path, but checked against the archive
+            if path_obj.name.endswith('m'):
+                return
+            if path_obj.suffix == '.cgf' and path_obj.with_suffix('.cga').as_posix() in p4k_lookup:
+                path_obj = path_obj.with_suffix('.cga')
+            if path_obj.suffix == '.cdf':
+                add_cdf(path_obj.as_posix())
+                return
+            if path_obj.suffix not in conversion_exts and path_obj.suffix != '.dae':
+                return
+            closure.add("Data/" + path_obj.with_suffix('.dae').as_posix())
+            # Geometry usually has a material with the same name next to it
+            add_material(path_obj.with_suffix('.mtl').as_posix())
+
+        def add_cdf(path):
+            if path in visited_files:
+                return
+            visited_files.add(path)
+            if path not in p4k_lookup:
+                return
+            closure.add("Data/" + path)
+            # The CDF's own armature is imported from the matching .dae
+            closure.add("Data/" + Path(path).with_suffix('.dae').as_posix())
+            add_material(Path(path).with_suffix('.mtl').as_posix())
+            root = read_xml(p4k_lookup[path].filename)
+            if root is None:
+                return
+            for attachment in root.iter("Attachment"):
+                add_geometry(attachment.attrib.get("Binding"))
+                add_material(attachment.attrib.get("Material"))
+
+        def add_material(path):
+            path = clean(path)
+            if not path:
+                return
+            if not path.endswith('.mtl'):
+                path += '.mtl'
+            if path in visited_files:
+                return
+            visited_files.add(path)
+            if path not in p4k_lookup:
+                return
+            closure.add("Data/" + path)
+            root = read_xml(p4k_lookup[path].filename)
+            if root is None:
+                return
+            # Any attribute that points at another material or a texture is a dependency
+            for element in root.iter():
+                for value in element.attrib.values():
+                    lower_value = value.lower()
+                    if lower_value.endswith('.mtl'):
+                        add_material(value)
+                    elif lower_value.endswith(texture_exts):
+                        add_texture(value)
+
+        def add_texture(path):
+            path = clean(path)
+            if not path:
+                return
+            if Path(path).with_suffix('.dds').as_posix() not in p4k_lookup:
+                return
+            if Path(path).suffix == '.dds':
+                path = Path(path).with_suffix('.tif').as_posix()
+            closure.add("Data/" + path)
+
+        def read_xml(filename):
+            # Already extracted files are parsed from disk rather than decompressed from the archive again
+            local_path = __class__.extract_dir / __class__.strip_data_prefix(filename.replace("\\", "/")) if __class__.extract_dir else None
+            if local_path is not None and local_path.is_file():
+                try:
+                    local_content = local_path.read_bytes()
+                    if local_content.startswith(b"CryXmlB"):
+                        from scdatatools.engine.cryxml import etree_from_cryxml_string
+                        return etree_from_cryxml_string(local_content)
+                    return ET.fromstring(local_content)
+                except Exception as e:
+                    if globals_and_threading.debug: print(f"DEBUG: Could not parse {local_path}, reading it from Data.p4k instead: {e}")
+            content = __class__.read_file_from_p4k(filename)
+            if not isinstance(content, str):
+                return None
+            try:
+                return ET.fromstring(content)
+            except ET.ParseError as e:
+                if globals_and_threading.debug: print(f"DEBUG: Could not parse {filename}: {e}")
+                return None
+
+        def walk_loadout(loadout):
+            nonlocal records_by_name
+            if loadout is None or not hasattr(loadout, 'properties'):
+                return
+            for entry in loadout.properties.get('entries', []):
+                props = getattr(entry, 'properties', entry)
+                child_guid = str(props.get('entityClassReference'))
+                entity_class_name = props.get('entityClassName')
+                child_record = None
+                if __class__.is_guid(child_guid):
+                    child_record = dcb.records_by_guid.get(child_guid)
+                elif entity_class_name:
+                    if records_by_name is None:
+                        records_by_name = {r.name.lower(): r for r in dcb.records if hasattr(r, 'name')}
+                    child_record = records_by_name.get(entity_class_name.lower())
+                if child_record is not None:
+                    pending_records.append(child_record)
+                nested_loadout = props.get('loadout')
+                if nested_loadout is not None:
+                    walk_loadout(nested_loadout)
+
+        while pending_records:
+            current = pending_records.pop()
+            record_id = str(getattr(current, 'id', id(current)))
+            if record_id in visited_records:
+                continue
+            visited_records.add(record_id)
+            progress_callback(len(visited_records), len(visited_records) + len(pending_records), f"Resolving dependencies of {current.name}...")
+
+            try:
+                for comp in current.properties.Components:
+                    if comp.name != 'SGeometryResourceParams':
+                        continue
+                    geometry = comp.properties.Geometry.properties.Geometry.properties
+                    try:
+                        add_geometry(geometry.Geometry.properties.path)
+                    except AttributeError:
+                        pass
+                    try:
+                        add_material(geometry.Material.properties.path)
+                    except AttributeError:
+                        pass
+            except AttributeError as e:
+                if globals_and_threading.debug: print(f"DEBUG: No geometry components on {current.name}: {e}")
+
+            walk_loadout(__class__.get_loadout_from_record(current))
+
+        if show_progress_popup:
+            ui_tools.close_progress_bar_popup("resolve_dependencies")
+        if globals_and_threading.debug: print(f"DEBUG: Resolved {len(closure)} dependencies from {len(visited_records)} records")
+        return closure
+
+    @staticmethod
+    def pre_extract_dependencies(guid=None, record=None, on_ready=None, on_geometry_ready=None):
+        """
+        Resolve the full dependency closure of a record and extract everything that is not
+        already in the extract directory in a single batch, before any Blender import starts.
+        Both the walk and the extraction run on the background extraction thread.
+
+        Args:
+            guid: GUID of the record to resolve (ignored if record is given)
+            record: Datacore record to resolve
+            on_ready (callable, optional): Called once on the main thread when the dependencies are
+                extracted, or straight away if there is nothing to do. The import carries on from here.
+            on_geometry_ready (callable, optional): Called once on the main thread as soon as the geometry,
+                CDFs and MTLs are extracted, while textures are still being extracted. Imports that can build
+                the scene before the textures arrive carry on from here instead.
+
+        Returns:
+            bool: True if the extraction was started and the callbacks will be called later
+        """
+        def ready():
+            if on_geometry_ready:
+                on_geometry_ready()
+            if on_ready:
+                on_ready()
+
+        prefs = bpy.context.preferences.addons["scorg_tools"].preferences
+        if not prefs.extract_missing_files or not prefs.pre_extract_dependencies:
+            ready()
+            return False
+        if __class__.extract_dir is None:
+            extract_dir = getattr(prefs, 'extract_dir', None)
+            __class__.extract_dir = Path(extract_dir) if extract_dir else None
+        if not __class__.extract_dir:
+            ready()
+            return False
+
+        dcb = globals_and_threading.dcb
+        if not dcb or not globals_and_threading.p4k:
+            print("Skipping dependency pre-extraction: Data.p4k is not loaded")
+            ready()
+            return False
+        if not prefs.cgf_converter_path or not os.path.exists(prefs.cgf_converter_path):
+            print("Skipping dependency pre-extraction: cgf-converter.exe path not set or invalid in preferences")
+            ready()
+            return False
+        if globals_and_threading.is_extraction_running():
+            print("Skipping dependency pre-extraction: a background extraction is still running")
+            ready()
+            return False
+        if record is None:
+            record = dcb.records_by_guid.get(str(guid))
+
+        extract_dir = __class__.extract_dir
+
+        def list_missing(progress_callback):
+            # Runs on the extraction thread
+            closure = __class__.resolve_dependency_closure(record=record, progress_callback=progress_callback)
+            missing = sorted(
+                path for path in closure
+                if not __class__.case_insensitive_path_exists(extract_dir, path)
+                and not (path.lower().endswith('.dae') and __class__.case_insensitive_path_exists(extract_dir, path[:-4] + '.glb'))
+            )
+            print(f"Dependency closure: {len(closure)} files, {len(missing)} not yet extracted")
+            return "\n".join(missing)
+
+        def report(success_count, fail_count, report_lines):
+            if success_count or fail_count:
+                print(f"Dependency pre-extraction: {success_count} succeeded, {fail_count} failed")
+                if globals_and_threading.debug:
+                    for line in report_lines:
+                        print(line)
+            if on_ready:
+                on_ready()
+
+        def failed(message):
+            if on_ready:
+                on_ready()
+
+        started = globals_and_threading.start_extraction(
+            list_missing, prefs, on_complete=report, on_geometry_ready=on_geometry_ready, on_error=failed
+        )
+        if not started:
+            ready()
+            return False
+        return True
+
+    @staticmethod
+    def extract_missing_files(file_list_text, prefs, mip_cap=None, on_file_complete=None, on_geometry_ready=None, progress_callback=None):
         """
         Extract missing files from Data.p4k archive.
+        Files are processed in priority order: CDF/geometry, then MTLs, then textures smallest first.
         
         Args:
             file_list_text (str): Newline-separated list of files to extract
             prefs: Addon preferences object
+            mip_cap (int, optional): Number of top mip levels to skip for textures, overrides the preference
+            on_file_complete (callable, optional): Called as on_file_complete(search_path, success, message)
+                after each file finishes
+            on_geometry_ready (callable, optional): Called once, with no arguments, as soon as every
+                geometry, CDF and MTL file in the batch has finished (textures may still be running)
+            progress_callback (callable, optional): Called as progress_callback(current, total, message) instead
+                of updating the progress popup, use this when running off the main thread
             
         Returns:
             tuple: (success_count, fail_count, report_lines)
@@ -2542,11 +3596,16 @@ class SCOrg_tools_import():
         import os
         import shutil
         import subprocess
+        import threading
         from pathlib import Path
         
         cgf_converter = prefs.cgf_converter_path
         texconv_path = prefs.texconv_path
         extract_dir = Path(prefs.extract_dir)
+        geometry_suffix = __class__.get_geometry_suffix(prefs)  # worker threads can't read prefs
+        if mip_cap is None:
+            mip_cap = getattr(prefs, 'texture_mip_cap', 0)
+        texture_mip_skips = {}  # search path -> number of mip levels left out
         
         if not cgf_converter or not os.path.exists(cgf_converter):
             raise ValueError("cgf-converter.exe path not set or invalid in preferences.")
@@ -2558,6 +3617,7 @@ class SCOrg_tools_import():
         sc = globals_and_threading.sc
         if not sc or not sc.p4k:
             raise ValueError("Data.p4k not loaded. Please load it first.")
+        p4k_handles = p4k_utils.ThreadHandles(sc.p4k)  # this batch's per-thread handles, closed when it is done
 
         
         # Get files from the list passed by the popup
@@ -2572,29 +3632,49 @@ class SCOrg_tools_import():
         # Skip .ddna.glossmap* files
         files_to_process = [f for f in files_to_process if '.ddna.glossmap' not in f.lower()]
         
-        # De-duplicate the list
-        files_to_process = list(set(files_to_process))
-        
         conversion_exts = ['.chr', '.cga', '.cgf', '.skin']
         texture_exts = ['.tif', '.png', '.tga']
         supported_exts = conversion_exts + ['.mtl', '.chrparams', '.skinm', '.cdf'] + texture_exts
+
+        def is_supported(path):
+            suffix = Path(path).suffix.lower()
+            return suffix == '.dae' or suffix in supported_exts
+
+        # De-duplicate on the source file each request resolves to, so case variants and
+        # .dae/.cga/.cgf aliases are only planned, read and converted once
+        unique_files = {}
+        for file_path_str in files_to_process:
+            key = __class__.get_extraction_key(file_path_str, extract_dir)
+            current = unique_files.get(key)
+            # A request we can extract always beats one we can't, then prefer a .dae request for
+            # geometry, the converted file keeps the requested name
+            if current is None or (is_supported(file_path_str) and not is_supported(current)) or \
+                    (file_path_str.lower().endswith('.dae') and not current.lower().endswith('.dae')):
+                unique_files[key] = file_path_str
+        if globals_and_threading.debug and len(unique_files) != len(files_to_process):
+            print(f"DEBUG: Collapsed {len(files_to_process)} extraction requests to {len(unique_files)} unique files")
+        files_to_process = list(unique_files.values())
         
         success_count = 0
         fail_count = 0
         extracted_files = []
         report_lines = []
         
-        # Start progress using the same system as other functions
-        ui_tools.progress_bar_popup("extract_missing_files", 0, len(files_to_process), "Starting extraction...")
+        # Start progress using the same system as other functions, unless the caller handles progress itself
+        show_progress_popup = progress_callback is None
+        if show_progress_popup:
+            def progress_callback(current, total, message):
+                ui_tools.progress_bar_popup("extract_missing_files", current, total, message)
+        progress_callback(0, len(files_to_process), "Starting extraction...")
         
         import concurrent.futures
         
         # Helper function for processing a single file (Worker Thread)
-        def process_single_file(task_data):
+        def produce_file(task_data):
             # Unpack task data
             search_path = task_data['search_path']
             actual_path = task_data['actual_path']
-            content = task_data['content']
+            content = None
             extract_dir = task_data['extract_dir']
             conversion_exts = task_data['conversion_exts']
             cgf_converter = task_data['cgf_converter']
@@ -2602,17 +3682,17 @@ class SCOrg_tools_import():
             texture_exts = task_data['texture_exts']
             
             if globals_and_threading.debug:
-                import threading
                 print(f"DEBUG [{time.time()*1000:.0f}ms]: Thread {threading.current_thread().name} starting process_single_file for {search_path}")
             
             internal_path = actual_path  # For companion files and texture parts
             
             try:
-                # Extract file manually to control the path
-                # content is the file data
-                
-                # Get the internal filename (e.g. Data/Objects/...)
-                # Since we have content, we don't need p4k_file anymore
+                # Read here rather than while planning, so entries are read in priority order
+                # and geometry isn't kept waiting behind every texture in the batch
+                if task_data['read_content']:
+                    with limiters['io'].slot() as meter:
+                        content = p4k_handles.read_entry(task_data['p4k_info'])
+                        meter['bytes'] = len(content)
                 
                 # Strip "Data/" prefix if present to avoid Data/Data/ structure
                 if globals_and_threading.debug:
@@ -2629,18 +3709,45 @@ class SCOrg_tools_import():
                 final_path = extract_dir / relative_path
                 
                 # Ensure parent directory exists
-                final_path.parent.mkdir(parents=True, exist_ok=True)
+                ensure_dir(final_path.parent)
                 
-                # Copy file content
-                with open(final_path, 'wb') as dst:
-                    dst.write(content)
+                # Copy file content, split DDS textures are assembled with their mip parts in the same write
+                write_start = time.perf_counter()
+                split_parts = dds_part_index.get(actual_path.replace("\\", "/").lower(), []) if final_path.suffix.lower() == '.dds' else []
+                skipped_mips = dds_utils.SCOrg_tools_dds.get_mip_skip(content, len(split_parts), mip_cap) if split_parts else 0
+                pending_writes = []  # large entries a worker process is decompressing straight into the file
+                # Written under a temporary name and moved into place, so other sessions never see a partial file
+                temp_path = lock_utils.SCOrg_tools_lock.get_temp_path(final_path)
+                try:
+                    with limiters['io'].slot() as meter, open(temp_path, 'wb', buffering=dds_utils.SCOrg_tools_dds.WRITE_BUFFER_SIZE) as dst:
+                        if content is None:
+                            written = write_entry(task_data['p4k_info'], temp_path, dst, pending_writes)
+                        elif split_parts:
+                            written = dds_utils.SCOrg_tools_dds.write_assembled(
+                                content,
+                                [lambda dst, part=part: write_entry(part, temp_path, dst, pending_writes) for part in split_parts],
+                                dst,
+                                skip=skipped_mips
+                            )
+                        else:
+                            written = dst.write(content)
+                        meter['bytes'] = written
+                    for future in pending_writes:
+                        future.result()
+                    # Check if it's an MTL file and convert it before it is published
+                    if final_path.suffix.lower() == '.mtl':
+                        __class__.convert_mtl_file(temp_path)
+                    lock_utils.SCOrg_tools_lock.replace(temp_path, final_path)
+                except BaseException:
+                    lock_utils.SCOrg_tools_lock.discard(temp_path)
+                    raise
+                record_write(written, time.perf_counter() - write_start)
+
+                if final_path.suffix.lower() == '.dds':
+                    for texture_path in [search_path] + task_data['merged_search_paths']:
+                        texture_mip_skips[texture_path] = skipped_mips
                 
                 extracted_path = final_path
-                
-                if not extracted_path.exists():
-                    msg = f"Warning: Extracted file not found at expected path: {extracted_path}"
-                    if globals_and_threading.debug: print(msg)
-                    return (False, f"⚠️ {msg}", None)
                     
                 # Convert if it's a geometry file
                 if extracted_path.suffix.lower() in conversion_exts:
@@ -2666,13 +3773,20 @@ class SCOrg_tools_import():
                                 
                                 # Extract companion file
                                 comp_final_path = extract_dir / comp_relative_path
-                                comp_final_path.parent.mkdir(parents=True, exist_ok=True)
-                                
-                                with sc.p4k.open(comp_p4k_file) as src, open(comp_final_path, 'wb') as dst:
-                                    shutil.copyfileobj(src, dst)
+                                ensure_dir(comp_final_path.parent)
                                 
-                                if comp_final_path.exists():
-                                    companion_files.append(comp_final_path)
+                                write_start = time.perf_counter()
+                                comp_temp_path = lock_utils.SCOrg_tools_lock.get_temp_path(comp_final_path)
+                                try:
+                                    with p4k_handles.open_entry(comp_p4k_file) as src, open(comp_temp_path, 'wb', buffering=dds_utils.SCOrg_tools_dds.WRITE_BUFFER_SIZE) as dst:
+                                        shutil.copyfileobj(src, dst, dds_utils.SCOrg_tools_dds.WRITE_BUFFER_SIZE)
+                                        written = dst.tell()
+                                    lock_utils.SCOrg_tools_lock.replace(comp_temp_path, comp_final_path)
+                                except BaseException:
+                                    lock_utils.SCOrg_tools_lock.discard(comp_temp_path)
+                                    raise
+                                record_write(written, time.perf_counter() - write_start)
+                                companion_files.append(comp_final_path)
                         except Exception:
                             pass
                     
@@ -2683,8 +3797,10 @@ class SCOrg_tools_import():
                         return (True, f"⚠️ {msg}", extracted_path)
                     else:
                         try:
-                            converted_dae = extracted_path.with_suffix('.dae')
-                            if __class__.convert_cgf_to_dae(extracted_path, converted_dae, converter_path=cgf_converter):
+                            converted_dae = extracted_path.with_suffix(geometry_suffix)
+                            with limiters['convert'].slot():
+                                converted = __class__.convert_cgf_to_dae(extracted_path, converted_dae, converter_path=cgf_converter, output_format=geometry_suffix[1:])
+                            if converted:
                                 # Delete the original file and all companion files
                                 files_to_delete = [f for f in [extracted_path] + companion_files 
                                                     if f.suffix.lower() not in ['.chr', '.skinm', '.cdf']]
@@ -2697,6 +3813,9 @@ class SCOrg_tools_import():
                                 
                                 # Check if we need to rename the result
                                 target_dae = extracted_path.with_name(Path(search_path).name)
+                                if target_dae.suffix.lower() == '.dae':
+                                    # Requests name the .dae, the file keeps that name with the chosen format's extension
+                                    target_dae = target_dae.with_suffix(geometry_suffix)
                                 
                                 # Only rename if the target has the same extension as the converted file
                                 # This prevents renaming .dae to .cga if the user requested .cga but we converted to .dae
@@ -2722,141 +3841,87 @@ class SCOrg_tools_import():
                             if globals_and_threading.debug: print(msg)
                             return (True, f"⚠️ {msg}", extracted_path)
                 elif extracted_path.suffix.lower() == '.dds':
-                    # This is a texture file - extract split parts and convert with texconv
-                    if not texconv_path or not os.path.exists(texconv_path):
+                    # This is a texture file - convert with texconv, or the built-in decoder if texconv is unavailable.
+                    # Requests for the same texture in several formats are all produced from this one .dds
+                    output_formats = task_data['output_formats']
+                    texconv_available = bool(texconv_path) and os.path.exists(texconv_path)
+                    if (use_builtin_decoder or not texconv_available) and texture_utils.SCOrg_tools_texture.is_available() \
+                            and texture_utils.SCOrg_tools_texture.get_block_format(content)[0]:
+                        try:
+                            with limiters['convert'].slot():
+                                for output_format in output_formats:
+                                    output_path = extracted_path.with_suffix('.' + output_format)
+                                    output_temp_path = lock_utils.SCOrg_tools_lock.get_temp_path(output_path)
+                                    try:
+                                        if texture_pool:
+                                            texture_pool.submit(texture_decode_entry, str(extracted_path), str(output_temp_path)).result()
+                                        else:
+                                            texture_decode_entry(str(extracted_path), str(output_temp_path))
+                                        lock_utils.SCOrg_tools_lock.replace(output_temp_path, output_path)
+                                    except BaseException:
+                                        lock_utils.SCOrg_tools_lock.discard(output_temp_path)
+                                        raise
+                            try:
+                                extracted_path.unlink()
+                            except Exception:
+                                pass
+                            msg = f"Extracted, Decoded & Cleaned: {extracted_path.name}"
+                            if globals_and_threading.debug: print(msg)
+                            return (True, f"✅ {msg}", extracted_path)
+                        except Exception as e:
+                            if not texconv_available:
+                                msg = f"Extracted {extracted_path.name} but decoding failed: {e}"
+                                if globals_and_threading.debug: print(msg)
+                                return (True, f"⚠️ {msg}", extracted_path)
+                            if globals_and_threading.debug: print(f"DEBUG: Built-in decoder failed for {extracted_path.name}, falling back to texconv: {e}")
+
+                    if not texconv_available:
                         msg = f"Extracted {extracted_path.name} but texconv not found."
                         if globals_and_threading.debug: print(msg)
                         return (True, f"⚠️ {msg}", extracted_path)
                     else:
-                        # Extract all split parts (.dds.1, .dds.2, etc.)
-                        split_parts = []
-                        part_num = 1
-                        
-                        while True:
-                            split_part_path_in_p4k = f"{internal_path}.{part_num}"
-                            try:
-                                split_matches = sc.p4k.search(split_part_path_in_p4k)
-                                if split_matches:
-                                    split_p4k_file = split_matches[0]
-                                    split_internal_path = split_p4k_file.filename
-                                    
-                                    split_relative_path = split_internal_path
-                                    if split_relative_path.lower().startswith("data/"):
-                                        split_relative_path = split_relative_path[5:]
-                                    elif split_relative_path.lower().startswith("data\\"):
-                                        split_relative_path = split_relative_path[5:]
-                                    
-                                    split_final_path = extract_dir / split_relative_path
-                                    split_final_path.parent.mkdir(parents=True, exist_ok=True)
-                                    
-                                    with sc.p4k.open(split_p4k_file) as src, open(split_final_path, 'wb') as dst:
-                                        shutil.copyfileobj(src, dst)
-                                    
-                                    if split_final_path.exists():
-                                        split_parts.append(split_final_path)
-                                    
-                                    part_num += 1
-                                else:
-                                    break
-                            except Exception:
-                                break
-                        
-                        # Combine split parts
-                        if split_parts:
-                            split_parts.sort(key=lambda p: int(p.suffix[1:]))
-                            with open(extracted_path, 'ab') as base_file:
-                                for part in split_parts:
-                                    with open(part, 'rb') as part_file:
-                                        shutil.copyfileobj(part_file, base_file)
-                                    part.unlink()
-                            split_parts = []
-                        
-                        # Determine output format
-                        original_suffix = Path(search_path).suffix.lower()
-                        if original_suffix in texture_exts:
-                            output_format = original_suffix[1:]
-                        else:
-                            output_format = 'tif'
-                        
-                        # Check BC5_SNORM
-                        is_bc5 = False
-                        try:
-                            if globals_and_threading.debug:
-                                import threading
-                                print(f"DEBUG [{time.time()*1000:.0f}ms]: Thread {threading.current_thread().name} checking BC5_SNORM for {extracted_path.name}")
-                            process = subprocess.Popen(
-                                [texconv_path, '-nologo', '-fileinfo', str(extracted_path)],
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE
-                            )
-                            stdout, stderr = process.communicate(timeout=10)
-                            if b'BC5_SNORM' in stdout:
-                                is_bc5 = True
-                        except Exception:
-                            pass
+                        # BC5_SNORM normal maps need converting to an unsigned format, read it from the header we already have
+                        is_bc5 = dds_utils.SCOrg_tools_dds.is_bc5_snorm(content)
+                        if globals_and_threading.debug and is_bc5:
+                            print(f"DEBUG: {extracted_path.name} is BC5_SNORM")
                         
                         extra_args = ['-f', 'R8G8B8A8_UNORM'] if is_bc5 else []
                         
-                        # Run texconv
-                        try:
-                            startupinfo = None
-                            if os.name == 'nt':
-                                startupinfo = subprocess.STARTUPINFO()
-                                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                            
-                            cmd = [texconv_path, '-y'] + extra_args + ['-ft', output_format, str(extracted_path), '-o', str(extracted_path.parent)]
-                            
-                            if globals_and_threading.debug:
-                                import threading
-                                print(f"DEBUG [{time.time()*1000:.0f}ms]: Thread {threading.current_thread().name} starting texconv for {extracted_path.name}")
-                            
-                            # Use Popen for non-blocking execution
-                            texconv_start = time.time()
-                            process = subprocess.Popen(
-                                cmd,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                startupinfo=startupinfo
-                            )
-                            
-                            # Wait for completion with timeout
-                            try:
-                                stdout, stderr = process.communicate(timeout=60)  # 60s timeout for texture conversion
-                            except subprocess.TimeoutExpired:
-                                process.terminate()
-                                msg = f"Extracted {extracted_path.name} but conversion timed out"
-                                if globals_and_threading.debug: print(msg)
-                                return (True, f"⚠️ {msg}", extracted_path)
-                            
-                            if globals_and_threading.debug:
-                                import threading
-                                elapsed = time.time() - texconv_start
-                                print(f"DEBUG [{time.time()*1000:.0f}ms]: Thread {threading.current_thread().name} texconv completed for {extracted_path.name} in {elapsed:.2f}s")
-                            
-                            if process.returncode == 0:
-                                # Delete all DDS files
-                                files_to_delete = [extracted_path] + split_parts
-                                for file_to_del in files_to_delete:
-                                    try:
-                                        file_to_del.unlink()
-                                    except Exception:
-                                        pass
-                                
+                        # Queue for texconv, which converts a batch of textures per process. The task finishes
+                        # when its batches do, so hand a future back to the main thread instead of waiting here
+                        if globals_and_threading.debug:
+                            print(f"DEBUG [{time.time()*1000:.0f}ms]: Queued {extracted_path.name} for texconv")
+                        result_future = concurrent.futures.Future()
+                        batch_futures = []
+                        remaining = [len(output_formats)]
+                        remaining_lock = threading.Lock()
+
+                        def finish_texconv(_, extracted_path=extracted_path):
+                            with remaining_lock:
+                                remaining[0] -= 1
+                                if remaining[0]:
+                                    return
+                            errors = [error for ok, error in (future.result() for future in batch_futures) if not ok]
+                            if not errors:
+                                # Delete the assembled DDS file
+                                try:
+                                    extracted_path.unlink()
+                                except Exception:
+                                    pass
                                 msg = f"Extracted, Converted & Cleaned: {extracted_path.name}"
                                 if globals_and_threading.debug: print(msg)
-                                return (True, f"✅ {msg}", extracted_path)
+                                result_future.set_result((True, f"✅ {msg}", extracted_path))
                             else:
-                                msg = f"Extracted {extracted_path.name} but conversion failed: {stderr.decode('utf-8') if stderr else ''}"
+                                msg = f"Extracted {extracted_path.name} but conversion failed: {errors[0]}"
                                 if globals_and_threading.debug: print(msg)
-                                return (True, f"⚠️ {msg}", extracted_path)
-                        except Exception as e:
-                            msg = f"Extracted {extracted_path.name} but converter error: {e}"
-                            if globals_and_threading.debug: print(msg)
-                            return (True, f"⚠️ {msg}", extracted_path)
+                                result_future.set_result((True, f"⚠️ {msg}", extracted_path))
+
+                        for output_format in output_formats:
+                            batch_futures.append(texconv_batcher.submit(extracted_path, output_format, extra_args))
+                        for future in batch_futures:
+                            future.add_done_callback(finish_texconv)
+                        return result_future
                 else:
-                    # Check if it's an MTL file and convert if needed
-                    if extracted_path.suffix.lower() == '.mtl':
-                        __class__.convert_mtl_file(extracted_path)
                     msg = f"Extracted: {extracted_path.name}"
                     if globals_and_threading.debug: print(msg)
                     return (True, f"✅ {msg}", extracted_path)
@@ -2866,14 +3931,41 @@ class SCOrg_tools_import():
                 print(msg)
                 return (False, f"❌ {msg}", None)
 
+        def process_single_file(task_data):
+            # Other sessions may share extract_dir: hold a lock on the requested file while producing it,
+            # and if another session holds it, wait and use their result instead of converting it again
+            requested_path = task_data['extract_dir'] / __class__.strip_data_prefix(task_data['search_path'])
+            lock, waited = lock_utils.SCOrg_tools_lock.acquire(requested_path)
+            if waited and __class__.geometry_file_exists(requested_path, geometry_suffix):
+                lock.release()
+                msg = f"Extracted by another session: {requested_path.name}"
+                if globals_and_threading.debug: print(msg)
+                return (True, f"✅ {msg}", requested_path)
+            try:
+                result = produce_file(task_data)
+            except BaseException:
+                lock.release()
+                raise
+            if isinstance(result, concurrent.futures.Future):
+                # Queued for texconv, keep the lock until its batch is done
+                result.add_done_callback(lambda _: lock.release())
+            else:
+                lock.release()
+            return result
+
         # Main Thread: Pre-calculate tasks
         tasks = []
-        ui_tools.progress_bar_popup("extract_missing_files", 0, len(files_to_process), "Planning extraction...")
+        progress_callback(0, len(files_to_process), "Planning extraction...")
+        
+        # Get max_workers, and the per-stage limits (fixed at max_workers, or tuned as we go in auto mode)
+        max_workers, limiters = concurrency_utils.SCOrg_tools_concurrency.create_limiters(
+            getattr(prefs, 'max_extraction_threads', 4),
+            getattr(prefs, 'auto_extraction_threads', False)
+        )
         
-        # Get max_workers
-        max_workers = getattr(prefs, 'max_extraction_threads', 4)
+        decompress_threshold = getattr(prefs, 'process_decompress_threshold_mb', 0) * 1024 * 1024
         
-        # Helper function for planning (finding and reading file content)
+        # Helper function for planning (finding the archive entry, it is read when the task is processed)
         def plan_file(file_path_str, extract_dir, conversion_exts, texture_exts, supported_exts, cgf_converter, texconv_path, sc):
             # Normalize path
             search_path = file_path_str.replace("\\", "/")
@@ -2918,21 +4010,21 @@ class SCOrg_tools_import():
                     continue
             
             if found_p4k_file:
-                try:
-                    with sc.p4k.open(found_p4k_file) as f:
-                        content = f.read()
-                    return {
-                        'search_path': search_path,
-                        'actual_path': found_p4k_file.filename,
-                        'content': content,
-                        'extract_dir': extract_dir,
-                        'conversion_exts': conversion_exts,
-                        'cgf_converter': cgf_converter,
-                        'texconv_path': texconv_path,
-                        'texture_exts': texture_exts
-                    }
-                except Exception as e:
-                    return {'error': f"Failed to read content for {search_path}: {e}"}
+                # Large geometry is left in the archive and decompressed by a worker process when it is written,
+                # everything else is read through the processing thread's own archive handle
+                read_content = found_p4k_file.filename.lower().endswith('.dds') or \
+                    not p4k_utils.SCOrg_tools_p4k.can_decompress_in_process(found_p4k_file, decompress_threshold)
+                return {
+                    'search_path': search_path,
+                    'actual_path': found_p4k_file.filename,
+                    'p4k_info': found_p4k_file,
+                    'read_content': read_content,
+                    'extract_dir': extract_dir,
+                    'conversion_exts': conversion_exts,
+                    'cgf_converter': cgf_converter,
+                    'texconv_path': texconv_path,
+                    'texture_exts': texture_exts
+                }
             else:
                 return {'error': f"File not found in P4K: {search_path}"}
 
@@ -2952,40 +4044,200 @@ class SCOrg_tools_import():
                     tasks.append(result)
                 
                 # Update progress during planning
-                ui_tools.progress_bar_popup("extract_missing_files", planning_completed, len(files_to_process), f"Planning extraction... {planning_completed}/{len(files_to_process)}")
+                progress_callback(planning_completed, len(files_to_process), f"Planning extraction... {planning_completed}/{len(files_to_process)}")
+
+        # Requests for one texture in different formats share the extracted .dds, so they are produced by a single
+        # task rather than two tasks writing and deleting the same file under each other
+        texture_tasks = {}
+        unique_tasks = []
+        for task in tasks:
+            if task['actual_path'].lower().endswith('.dds'):
+                requested_suffix = Path(task['search_path']).suffix.lower()
+                output_format = requested_suffix[1:] if requested_suffix in texture_exts else 'tif'
+                first = texture_tasks.get(task['actual_path'].lower())
+                if first is not None:
+                    if output_format not in first['output_formats']:
+                        first['output_formats'].append(output_format)
+                    first['merged_search_paths'].append(task['search_path'])
+                    continue
+                task['output_formats'] = [output_format]
+                task['merged_search_paths'] = []
+                texture_tasks[task['actual_path'].lower()] = task
+            unique_tasks.append(task)
+        tasks = unique_tasks
+
+        # Split DDS parts are looked up from one listing of the archive rather than a search per part
+        dds_part_index = {}
+        texture_pool = None
+        use_builtin_decoder = getattr(prefs, 'texture_converter', 'TEXCONV') == 'BUILTIN'
+        texture_decode_entry = texture_utils.SCOrg_tools_texture.convert_dds_file
+        if any(task['actual_path'].lower().endswith('.dds') for task in tasks):
+            dds_part_index = __class__.get_dds_part_index()
+            if use_builtin_decoder or not texconv_path or not os.path.exists(texconv_path):
+                texture_pool = texture_utils.SCOrg_tools_texture.create_process_pool(getattr(prefs, 'texture_decoder_processes', 0))
+                if texture_pool:
+                    texture_decode_entry = texture_utils.SCOrg_tools_texture.get_process_entry_point()
+
+        # texconv runs take a batch of textures each, so process start-up is paid per batch rather than per texture
+        texconv_batcher = None
+        texconv_executor = None
+        if texconv_path and os.path.exists(texconv_path) and any(task['actual_path'].lower().endswith('.dds') for task in tasks):
+            texconv_executor = concurrent.futures.ThreadPoolExecutor(max_workers=limiters['convert'].maximum)
+            texconv_batcher = texconv_utils.TexconvBatcher(
+                texconv_path, getattr(prefs, 'texconv_batch_size', 1), texconv_executor, limiter=limiters['convert']
+            )
+
+        # Large, unencrypted entries are decompressed in worker processes instead of the GIL-bound threads
+        decompress_pool = None
+        decompress_entry = p4k_utils.SCOrg_tools_p4k.decompress_entry
+        if decompress_threshold > 0:
+            large_entries = [task['p4k_info'] for task in tasks if not task['read_content']]
+            for task in tasks:
+                large_entries.extend(
+                    part for part in dds_part_index.get(task['actual_path'].replace("\\", "/").lower(), [])
+                    if p4k_utils.SCOrg_tools_p4k.can_decompress_in_process(part, decompress_threshold)
+                )
+            if large_entries:
+                decompress_pool = p4k_utils.SCOrg_tools_p4k.create_process_pool(min(limiters['decompress'].maximum, os.cpu_count() or 1))
+                decompress_entry = p4k_utils.SCOrg_tools_p4k.get_process_entry_point()
+                if globals_and_threading.debug: print(f"DEBUG: Decompressing {len(large_entries)} large entries in worker processes")
+
+        def write_entry(info, final_path, dst, pending_writes):
+            """
+            Write one archive entry at dst's current position. Large entries are handed to the
+            decompression pool, which writes into final_path while this thread carries on.
+            """
+            if decompress_pool and p4k_utils.SCOrg_tools_p4k.can_decompress_in_process(info, decompress_threshold):
+                data_offset = p4k_utils.SCOrg_tools_p4k.get_data_offset(p4k_handles, info)
+                if data_offset is not None:
+                    offset = dst.tell()
+                    # Skip over the space the worker fills in so the rest of the file lands after it
+                    dst.seek(info.file_size, os.SEEK_CUR)
+                    limiters['decompress'].acquire()
+                    submitted = time.perf_counter()
+                    future = decompress_pool.submit(
+                        decompress_entry, sc.p4k.filename, data_offset, info.compress_size, info.compress_type,
+                        info.file_size, str(final_path), offset
+                    )
+                    future.add_done_callback(lambda _, size=info.file_size: limiters['decompress'].release(time.perf_counter() - submitted, size))
+                    pending_writes.append(future)
+                    return info.file_size
+            return dds_utils.SCOrg_tools_dds.copy_part(lambda: p4k_handles.open_entry(info), dst)
+
+        # Create every destination directory once for the whole batch instead of once per file
+        io_stats = {'mkdir': 0, 'files_written': 0, 'bytes_written': 0, 'write_time': 0.0}
+        io_stats_lock = threading.Lock()
+        known_dirs = set()
+
+        def ensure_dir(directory):
+            # Companion files normally land in an already created directory, only stat/mkdir unknown ones
+            if directory in known_dirs:
+                return
+            with io_stats_lock:
+                if directory in known_dirs:
+                    return
+                directory.mkdir(parents=True, exist_ok=True)
+                io_stats['mkdir'] += 1
+                known_dirs.add(directory)
+
+        def record_write(byte_count, elapsed):
+            with io_stats_lock:
+                io_stats['files_written'] += 1
+                io_stats['bytes_written'] += byte_count
+                io_stats['write_time'] += elapsed
+
+        for directory in sorted({(extract_dir / __class__.strip_data_prefix(task['actual_path'])).parent for task in tasks}):
+            ensure_dir(directory)
+
+        # Order the work so imports are unblocked as early as possible: the executor runs tasks
+        # in submission order, so geometry goes first, then materials, then textures smallest first
+        for task in tasks:
+            task['priority'], task['estimated_size'] = __class__.get_extraction_priority(task, dds_part_index)
+        tasks.sort(key=lambda task: (task['priority'], task['estimated_size']))
+        pending_geometry = sum(1 for task in tasks if task['priority'] < __class__.EXTRACTION_PRIORITY_TEXTURE)
+        if on_geometry_ready and not pending_geometry:
+            on_geometry_ready()
 
         # Use ThreadPoolExecutor for parallel processing
         if globals_and_threading.debug: print(f"DEBUG: Starting extraction of {len(tasks)} files with {max_workers} workers")
         
+        completed_count = 0
+        total_tasks = len(tasks)
+
+        def handle_result(task, future):
+            nonlocal completed_count, success_count, fail_count, pending_geometry
+            completed_count += 1
+            success, msg, extracted_path = False, None, None
+            try:
+                success, msg, extracted_path = future.result()
+                if success:
+                    success_count += 1
+                    if extracted_path:
+                        extracted_files.append(extracted_path)
+                else:
+                    fail_count += 1
+                if msg:
+                    report_lines.append(msg)
+            except Exception as exc:
+                print(f'Task generated an exception: {exc}')
+                fail_count += 1
+                msg = f"❌ Exception: {exc}"
+                report_lines.append(msg)
+            
+            if on_file_complete:
+                on_file_complete(task['search_path'], success, msg)
+            if task['priority'] < __class__.EXTRACTION_PRIORITY_TEXTURE:
+                pending_geometry -= 1
+                if on_geometry_ready and pending_geometry == 0:
+                    # Everything an import needs to build the scene is on disk, textures keep streaming in
+                    on_geometry_ready()
+            
+            # Update progress
+            progress_callback(completed_count, total_tasks, f"Processed {completed_count}/{total_tasks}")
+
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit tasks
             future_to_task = {executor.submit(process_single_file, task): task for task in tasks}
             
-            completed_count = 0
-            total_tasks = len(tasks)
-            
+            # Textures queued for texconv come back as a future that completes with their batch
+            deferred = {}
             for future in concurrent.futures.as_completed(future_to_task):
-                completed_count += 1
-                try:
-                    success, msg, extracted_path = future.result()
-                    if success:
-                        success_count += 1
-                        if extracted_path:
-                            extracted_files.append(extracted_path)
-                    else:
-                        fail_count += 1
-                    if msg:
-                        report_lines.append(msg)
-                except Exception as exc:
-                    print(f'Task generated an exception: {exc}')
-                    fail_count += 1
-                    report_lines.append(f"❌ Exception: {exc}")
-                
-                # Update progress
-                ui_tools.progress_bar_popup("extract_missing_files", completed_count, total_tasks, f"Processed {completed_count}/{total_tasks}")
+                task = future_to_task[future]
+                if not future.exception() and isinstance(future.result(), concurrent.futures.Future):
+                    deferred[future.result()] = task
+                else:
+                    handle_result(task, future)
+
+        if texconv_batcher:
+            texconv_batcher.flush()
+            for future in concurrent.futures.as_completed(deferred):
+                handle_result(deferred[future], future)
+            texconv_executor.shutdown()
+            report_lines.append(f"ℹ️ {texconv_batcher.describe()}")
+        
+        if texture_pool:
+            texture_pool.shutdown()
+        if decompress_pool:
+            decompress_pool.shutdown()
+        p4k_handles.close()
         
         # Clear progress
-        ui_tools.close_progress_bar_popup("extract_missing_files")
+        if show_progress_popup:
+            ui_tools.close_progress_bar_popup("extract_missing_files")
+        
+        if texture_mip_skips:
+            __class__.update_reduced_texture_manifest(extract_dir, texture_mip_skips)
+        
+        concurrency_summary = concurrency_utils.SCOrg_tools_concurrency.describe_limiters(limiters)
+        print(concurrency_summary)
+        report_lines.append(f"ℹ️ {concurrency_summary}")
+        if io_stats['files_written']:
+            write_mb = io_stats['bytes_written'] / (1024 * 1024)
+            write_rate = write_mb / io_stats['write_time'] if io_stats['write_time'] > 0 else 0.0
+            report_lines.append(
+                f"ℹ️ I/O: {io_stats['mkdir']} directories created, {io_stats['files_written']} files written, "
+                f"{write_mb:.1f} MB at {write_rate:.1f} MB/s"
+            )
         
         print(f"Extraction completed: {success_count} succeeded, {fail_count} failed")
         
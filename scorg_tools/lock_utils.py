@@ -0,0 +1,207 @@
+import json
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+
+# Advisory file locks and atomic writes for a shared extract directory.
+# Several Blender sessions (or batch workers) can extract into the same folder, a lock file next to
+# each output tells the others that the file is being produced so they wait for it instead.
+# This module must not import bpy so it can be used from worker threads and standalone scripts.
+
+class FileLock:
+    """
+    An advisory lock held by creating `<path>.scorglock` exclusively. The lock file records the
+    owning host and process so locks left behind by a crashed session can be recognised as stale.
+    """
+
+    def __init__(self, lock_path):
+        self.lock_path = Path(lock_path)
+        self.held = False
+
+    def try_acquire(self):
+        try:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'host': socket.gethostname(), 'pid': os.getpid(), 'time': time.time()}, f)
+        self.held = True
+        return True
+
+    def release(self):
+        if not self.held:
+            return
+        self.held = False
+        try:
+            self.lock_path.unlink()
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class SCOrg_tools_lock():
+    LOCK_SUFFIX = '.scorglock'
+    STALE_AFTER = 15 * 60  # seconds, longer than any single extraction or conversion takes
+    POLL_INTERVAL = 0.2
+
+    @staticmethod
+    def get_lock_path(path):
+        path = Path(path)
+        return path.with_name(path.name + __class__.LOCK_SUFFIX)
+
+    @staticmethod
+    def is_process_alive(pid):
+        """Return True if a process with this id is running on this machine."""
+        if pid == os.getpid():
+            return True
+        if os.name == 'nt':
+            import ctypes
+            PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+            STILL_ACTIVE = 259
+            handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+            if not handle:
+                return False
+            try:
+                exit_code = ctypes.c_ulong()
+                if ctypes.windll.kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                    return exit_code.value == STILL_ACTIVE
+                return True
+            finally:
+                ctypes.windll.kernel32.CloseHandle(handle)
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    @staticmethod
+    def is_stale(lock_path):
+        """A lock is stale if its owner on this machine has exited, or it is older than STALE_AFTER."""
+        try:
+            age = time.time() - os.path.getmtime(lock_path)
+        except OSError:
+            return False
+        if age > __class__.STALE_AFTER:
+            return True
+        try:
+            with open(lock_path, 'r') as f:
+                owner = json.load(f)
+        except (OSError, ValueError):
+            # Released meanwhile, or still being written by its owner
+            return False
+        if owner.get('host') == socket.gethostname() and isinstance(owner.get('pid'), int):
+            return not __class__.is_process_alive(owner['pid'])
+        return False
+
+    @staticmethod
+    def is_locked(path):
+        lock_path = __class__.get_lock_path(path)
+        return lock_path.exists() and not __class__.is_stale(lock_path)
+
+    @staticmethod
+    def read_lock(lock_path):
+        """(mtime, contents) of a lock file, which tells one lock from the next, or None if it is gone."""
+        try:
+            with open(lock_path, 'rb') as f:
+                return os.fstat(f.fileno()).st_mtime_ns, f.read()
+        except OSError:
+            return None
+
+    @staticmethod
+    def break_if_stale(lock_path):
+        seen = __class__.read_lock(lock_path)
+        if seen is None or not __class__.is_stale(lock_path):
+            return
+        # Another session may have judged the same lock stale, removed it and taken a fresh one by now, so
+        # move the lock aside under a name only this thread uses and only remove it if it's the one judged stale
+        aside = f"{lock_path}.{os.getpid()}-{threading.get_ident()}.stale"
+        try:
+            os.replace(lock_path, aside)
+        except OSError:
+            return
+        moved = __class__.read_lock(aside)
+        if moved == seen:
+            print(f"Removing stale lock {lock_path}")
+        elif moved is not None:
+            # Someone else's fresh lock, put it back unless yet another session has taken the lock meanwhile
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except OSError:
+                pass
+            else:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(moved[1])
+        __class__.discard(aside)
+
+    @staticmethod
+    def acquire(path, timeout=None):
+        """
+        Lock `path` for producing it, waiting while another session holds the lock.
+
+        Returns:
+            tuple: (lock, waited) - the held FileLock, and True if another session held it first, in
+            which case the caller should check whether `path` now exists before producing it again.
+            lock is None if the timeout ran out.
+        """
+        lock = FileLock(__class__.get_lock_path(path))
+        waited = False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not lock.try_acquire():
+            waited = True
+            __class__.break_if_stale(lock.lock_path)
+            if deadline is not None and time.monotonic() >= deadline:
+                return None, waited
+            time.sleep(__class__.POLL_INTERVAL)
+        return lock, waited
+
+    @staticmethod
+    def wait_for_unlock(path, timeout=None):
+        """Wait until no session holds the lock on `path`. Returns False if the timeout ran out."""
+        lock_path = __class__.get_lock_path(path)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while lock_path.exists():
+            __class__.break_if_stale(lock_path)
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(__class__.POLL_INTERVAL)
+        return True
+
+    @staticmethod
+    def get_temp_path(path):
+        """
+        A temporary name next to `path` for writing it before publishing with replace(). The
+        extension is kept so tools that pick a format from it (texture writers, mtl parsing) work.
+        """
+        path = Path(path)
+        return path.with_name(f"{path.stem}.{os.getpid()}-{threading.get_ident()}.tmp{path.suffix}")
+
+    @staticmethod
+    def replace(temp_path, path, retries=10):
+        """
+        Move a finished temporary file over `path` in one step, so readers only ever see the old file
+        or the complete new one. Windows refuses while a reader has the target open, so retry briefly.
+        """
+        for attempt in range(retries):
+            try:
+                os.replace(temp_path, path)
+                return
+            except PermissionError:
+                if attempt == retries - 1:
+                    raise
+                time.sleep(__class__.POLL_INTERVAL)
+
+    @staticmethod
+    def discard(temp_path):
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
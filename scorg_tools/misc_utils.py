@@ -311,6 +311,13 @@ class SCOrg_tools_misc():
                 "scorg_tools.misc_utils",
                 "scorg_tools.tint_utils",
                 "scorg_tools.blender_utils",
+                "scorg_tools.dds_utils",
+                "scorg_tools.texture_utils",
+                "scorg_tools.p4k_utils",
+                "scorg_tools.concurrency_utils",
+                "scorg_tools.texconv_utils",
+                "scorg_tools.lock_utils",
+                "scorg_tools.dae_utils",
                 "scorg_tools.import_utils",
                 "scorg_tools.operators",
                 "scorg_tools.panels",
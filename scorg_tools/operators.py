@@ -11,6 +11,7 @@ from pathlib import Path
 import subprocess
 import os
 import shutil
+import threading
 import time
 
 class VIEW3D_OT_paint_warning_popup(bpy.types.Operator):
@@ -189,15 +190,26 @@ class VIEW3D_OT_import_loadout(bpy.types.Operator):
     bl_label = "Import missing loadout"
     bl_description = "Import missing ship components, and materials for the current ship and apply a number of fixes"
     bl_options = {'REGISTER', 'UNDO'}
+    TIME_BUDGET = 0.03  # seconds of import work per modal call
+    TIMER_INTERVAL = 0.01
+    REDRAW_INTERVAL = 0.25
+    # Passed on while the hardpoints import, they only move the view and leave the scene alone
+    VIEW_NAVIGATION_EVENTS = {
+        'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE', 'MOUSEMOVE', 'INBETWEEN_MOUSEMOVE',
+        'TRACKPADPAN', 'TRACKPADZOOM', 'MOUSEROTATE', 'MOUSESMARTZOOM', 'NDOF_MOTION',
+    }
 
     def __init__(self):
         self.entries = []
         self.current_index = 0
         self.empties_to_fill = []
+        self.empties_index = None
         self.top_level_loadout = None
         self.displacement_strength = 0
-        self.batch_size = 1  # Process 1 entry per modal call for better responsiveness
-        self.state = 'init'  # 'init', 'hardpoints', 'postprocess'
+        self.work = None  # Generator over the hardpoint import, advanced one unit of work at a time
+        self.last_redraw = 0.0
+        self.dependencies_ready = None
+        self.state = 'init'  # 'init', 'dependencies', 'hardpoints', 'postprocess'
         self.postprocess_steps = []
         self.current_step = 0
 
@@ -213,6 +225,9 @@ class VIEW3D_OT_import_loadout(bpy.types.Operator):
         # Initialize import state
         os.system('cls')
         import_utils.SCOrg_tools_import.imported_guid_objects = {}
+        import_utils.SCOrg_tools_import.scene_hardpoint_index = None
+        import_utils.SCOrg_tools_import.hardpoint_index_stack = []
+        import_utils.SCOrg_tools_import.instance_collections = {}
         import_utils.SCOrg_tools_import.INCLUDE_HARDPOINTS = [] # all
         globals_and_threading.missing_files = set()
         import_utils.SCOrg_tools_import.set_translation_new_data_preference()
@@ -238,14 +253,12 @@ class VIEW3D_OT_import_loadout(bpy.types.Operator):
             misc_utils.SCOrg_tools_misc.error("Could not find top-level loadout in ship record. Check the structure of the record.")
             return {'CANCELLED'}
 
-        self.empties_to_fill = import_utils.SCOrg_tools_import.get_all_empties_blueprint()
-
-        if globals_and_threading.debug: print(f"Total hardpoints to import: {len(self.empties_to_fill)}")
-
-        # Collect top-level entries
-        self.entries = self.top_level_loadout.properties.get('entries', [])
-        self.current_index = 0
-        self.state = 'hardpoints'
+        # Extract everything the ship's loadout needs up front on the background thread. The hardpoints are
+        # imported as soon as the geometry is on disk, textures keep coming in until post-processing needs them.
+        # The event is set from a timer on the main thread.
+        self.dependencies_ready = threading.Event()
+        self.state = 'dependencies'
+        import_utils.SCOrg_tools_import.pre_extract_dependencies(record=record, on_geometry_ready=self.dependencies_ready.set)
 
         # Prepare post-processing steps
         self.postprocess_steps = []
@@ -277,18 +290,97 @@ class VIEW3D_OT_import_loadout(bpy.types.Operator):
         
         self.current_step = 0
 
-        # Initialize progress
-        ui_tools.progress_bar_popup("import_hardpoints", 0, len(self.entries), "Starting hardpoint import...")
-
         # Add a timer to keep the modal running even without user events
-        self._timer = context.window_manager.event_timer_add(0.1, window=context.window)
+        self._timer = context.window_manager.event_timer_add(self.TIMER_INTERVAL, window=context.window)
 
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
+    def start_hardpoints(self):
+        """Collect the hardpoints to fill and start importing the top-level entries, once the dependencies are extracted."""
+        misc_utils.SCOrg_tools_misc.select_base_collection()  # It may have changed while the files were extracted
+        self.empties_to_fill = import_utils.SCOrg_tools_import.get_all_empties_blueprint()
+        # Matched against by every top-level entry, so index it once and keep it on the level stack
+        self.empties_index = import_utils.HardpointIndex(self.empties_to_fill)
+        import_utils.SCOrg_tools_import.hardpoint_index_stack.append(self.empties_index)
+
+        if globals_and_threading.debug: print(f"Total hardpoints to import: {len(self.empties_to_fill)}")
+
+        # Parse the loadout's geometry in worker processes while the entries are imported
+        import_utils.SCOrg_tools_import.start_dae_preparse(self.top_level_loadout)
+
+        # Collect top-level entries
+        self.entries = self.top_level_loadout.properties.get('entries', [])
+        self.current_index = 0
+        self.state = 'hardpoints'
+
+        # Initialize progress
+        ui_tools.progress_bar_popup("import_hardpoints", 0, len(self.entries), "Starting hardpoint import...")
+
+        self.work = self.iter_hardpoint_work()
+
+    def iter_hardpoint_work(self):
+        """Import the top-level entries one after another, yielding between units of work."""
+        while self.current_index < len(self.entries):
+            entry = self.entries[self.current_index]
+            hardpoint_mapping = {}  # For top level, no mapping
+            yield from import_utils.SCOrg_tools_import.iter_process_single_entry(
+                entry, self.empties_to_fill, is_top_level=True, parent_guid=None, hardpoint_mapping=hardpoint_mapping,
+                empties_index=self.empties_index
+            )
+            self.current_index += 1
+            yield
+
+    def run_hardpoint_work(self):
+        """Advance the hardpoint import until the time budget for this modal call is spent, or it is done."""
+        deadline = time.perf_counter() + self.TIME_BUDGET
+        while self.current_index < len(self.entries) and time.perf_counter() < deadline:
+            try:
+                next(self.work)
+            except StopIteration:
+                break
+            except Exception as e:
+                # Leave this entry and carry on with the next one rather than ending the whole import
+                entry = self.entries[self.current_index]
+                print(f"ERROR: Importing hardpoint '{getattr(entry, 'properties', entry).get('itemPortName')}' failed: {e}")
+                self.current_index += 1
+                self.work = self.iter_hardpoint_work()
+
+    def iter_postprocess_work(self):
+        """Run the post-processing steps one after another, yielding between the objects or materials they work on."""
+        while self.current_step < len(self.postprocess_steps):
+            module_name, step_name, args = self.postprocess_steps[self.current_step]
+            if module_name == 'blender_utils':
+                steps = blender_utils.SCOrg_tools_blender
+            elif module_name == 'import_utils':
+                steps = import_utils.SCOrg_tools_import
+            yield from getattr(steps, 'iter_' + step_name)(*args)
+            blender_utils.SCOrg_tools_blender.update_viewport_with_timer(redraw_now=True)
+            self.current_step += 1
+            yield
+
+    def run_postprocess_work(self):
+        """Advance the post-processing until the time budget for this modal call is spent, or it is done."""
+        deadline = time.perf_counter() + self.TIME_BUDGET
+        while self.current_step < len(self.postprocess_steps) and time.perf_counter() < deadline:
+            try:
+                next(self.work)
+            except StopIteration:
+                break
+            except Exception as e:
+                # Leave this step and carry on with the next one rather than ending the whole import
+                print(f"ERROR: Post-processing step '{self.postprocess_steps[self.current_step][1]}' failed: {e}")
+                self.current_step += 1
+                self.work = self.iter_postprocess_work()
+
     def modal(self, context, event):
         if event.type == 'ESC':
-            ui_tools.close_progress_bar_popup("import_hardpoints")
+            # Generators only stop at a yield, so this lands between two objects or materials of a step
+            if self.work is not None:
+                self.work.close()
+            import_utils.SCOrg_tools_import.stop_dae_preparse()
+            import_utils.SCOrg_tools_import.set_translation_new_data_preference(reset=True)
+            ui_tools.close_progress_bar_popup()  # All of them, a cancelled step leaves its own bar open
             context.window_manager.event_timer_remove(self._timer)
             return {'CANCELLED'}
 
@@ -296,48 +388,51 @@ class VIEW3D_OT_import_loadout(bpy.types.Operator):
         if event.type == 'TIMER':
             pass  # Continue processing below
 
-        if self.state == 'hardpoints':
-            processed = 0
-            while self.current_index < len(self.entries) and processed < self.batch_size:
-                entry = self.entries[self.current_index]
-                
-                # Process this entry
-                hardpoint_mapping = {}  # For top level, no mapping
-                import_utils.SCOrg_tools_import.process_single_entry(
-                    entry, self.empties_to_fill, is_top_level=True, parent_guid=None, hardpoint_mapping=hardpoint_mapping
-                )
-                
-                self.current_index += 1
-                processed += 1
+        if self.state == 'dependencies':
+            if event.type == 'TIMER' and self.dependencies_ready.is_set():
+                self.start_hardpoints()
+                return {'RUNNING_MODAL'}
+            return {'PASS_THROUGH'}  # Nothing is held on to yet, so Blender stays usable while the files are extracted
+
+        elif self.state == 'hardpoints':
+            if event.type in self.VIEW_NAVIGATION_EVENTS:
+                return {'PASS_THROUGH'}  # The view can still be moved around while it imports
+            if event.type != 'TIMER':
+                return {'RUNNING_MODAL'}  # Undo, delete and the like would pull objects out from under the import
+            self.run_hardpoint_work()
             
             # Update progress
             ui_tools.progress_bar_popup("import_hardpoints", self.current_index, len(self.entries), f"Importing hardpoints {self.current_index}/{len(self.entries)}...")
             
-            # Force UI update
-            bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+            # Force UI update, at a few frames per second so redrawing doesn't eat the time budget
+            now = time.perf_counter()
+            if now - self.last_redraw >= self.REDRAW_INTERVAL:
+                bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+                self.last_redraw = now
             
             if self.current_index >= len(self.entries):
+                import_utils.SCOrg_tools_import.stop_dae_preparse()
                 self.state = 'postprocess'
                 self.current_step = 0
+                self.work = self.iter_postprocess_work()
                 ui_tools.progress_bar_popup("postprocess", 0, len(self.postprocess_steps), "Starting post-processing...")
             
             return {'RUNNING_MODAL'}
         
         elif self.state == 'postprocess':
+            if event.type != 'TIMER':
+                return {'RUNNING_MODAL'}  # Keep the scene from being edited under a pass that holds on to its objects
+            if self.current_step == 0 and globals_and_threading.is_extraction_running():
+                return {'RUNNING_MODAL'}  # The material steps need the textures that are still being extracted
+            self.run_postprocess_work()
             if self.current_step < len(self.postprocess_steps):
-                module_name, step_name, args = self.postprocess_steps[self.current_step]
-                if module_name == 'blender_utils':
-                    method = getattr(blender_utils.SCOrg_tools_blender, step_name)
-                elif module_name == 'import_utils':
-                    method = getattr(import_utils.SCOrg_tools_import, step_name)
-                method(*args)
-                blender_utils.SCOrg_tools_blender.update_viewport_with_timer(redraw_now=True)
-                
-                self.current_step += 1
                 ui_tools.progress_bar_popup("postprocess", self.current_step, len(self.postprocess_steps), f"Post-processing {self.current_step}/{len(self.postprocess_steps)}...")
                 
                 # Force UI update
-                bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+                now = time.perf_counter()
+                if now - self.last_redraw >= self.REDRAW_INTERVAL:
+                    bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+                    self.last_redraw = now
                 
                 return {'RUNNING_MODAL'}
             else:
@@ -366,6 +461,17 @@ class VIEW3D_OT_make_instance_real(bpy.types.Operator):
         blender_utils.SCOrg_tools_blender.run_make_instances_real()
         return {'FINISHED'}
 
+class VIEW3D_OT_make_components_real(bpy.types.Operator):
+    bl_idname = "view3d.make_components_real"
+    bl_label = "Make Components Real"
+    bl_description = "Replace the collection instances used for repeated components with real linked duplicates"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        count = import_utils.SCOrg_tools_import.make_component_instances_real()
+        self.report({'INFO'}, f"Made {count} component instances real")
+        return {'FINISHED'}
+
 class VIEW3D_OT_reload(bpy.types.Operator):
     bl_idname = "view3d.reload"
     bl_label = "Reload Addon"
@@ -379,6 +485,8 @@ class GetGUIDOperator(bpy.types.Operator):
     bl_idname = "wm.get_guid_operator"
     bl_label = "Import by ID"
     bl_description = "Import a specific item by entering its GUID or name from StarFab Datacore"
+    bl_options = {'REGISTER', 'UNDO'}
+    TIMER_INTERVAL = 0.1
 
     guid: bpy.props.StringProperty(
         name="GUID ",
@@ -391,13 +499,40 @@ class GetGUIDOperator(bpy.types.Operator):
         return wm.invoke_props_dialog(self)
 
     def execute(self, context):
-        if self.guid:
-            import_utils.SCOrg_tools_import.import_by_id(self.guid)
-            return {'FINISHED'}
-        else:
+        if not self.guid:
             self.report({'WARNING'}, "No GUID entered.")
             return {'CANCELLED'}
 
+        prepared = import_utils.SCOrg_tools_import.prepare_import_by_id(self.guid)
+        if prepared is None:
+            return {'CANCELLED'}
+        self.record_guid, self.record = prepared
+
+        # Extract everything the item and its loadout need on the background thread, then import from modal()
+        # so the import runs inside this operator. The event is set from a timer on the main thread.
+        self.state = 'dependencies'
+        self.dependencies_ready = threading.Event()
+        import_utils.SCOrg_tools_import.pre_extract_dependencies(record=self.record, on_ready=self.dependencies_ready.set)
+
+        self._timer = context.window_manager.event_timer_add(self.TIMER_INTERVAL, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            import_utils.SCOrg_tools_import.set_translation_new_data_preference(reset=True)
+            context.window_manager.event_timer_remove(self._timer)
+            return {'CANCELLED'}
+
+        if self.state == 'dependencies':
+            if event.type == 'TIMER' and self.dependencies_ready.is_set():
+                context.window_manager.event_timer_remove(self._timer)
+                import_utils.SCOrg_tools_import.import_record(self.record_guid, self.record)
+                return {'FINISHED'}
+            return {'PASS_THROUGH'}  # Nothing is held on to yet, so Blender stays usable while the files are extracted
+
+        return {'PASS_THROUGH'}
+
 class SCORG_OT_show_missing_files(bpy.types.Operator):
     bl_idname = "scorg.show_missing_files"
     bl_label = "Show Missing Files"
@@ -435,6 +570,29 @@ class VIEW3D_OT_open_preferences(bpy.types.Operator):
         
         return {'FINISHED'}
 
+# Upgrade Reduced Textures Operator
+class VIEW3D_OT_upgrade_textures(bpy.types.Operator):
+    bl_idname = "view3d.upgrade_textures"
+    bl_label = "Upgrade Textures"
+    bl_description = "Re-extract textures that were extracted with skipped mip levels at full resolution and reload them"
+
+    def execute(self, context):
+        prefs = bpy.context.preferences.addons[__package__].preferences
+        manifest = import_utils.SCOrg_tools_import.load_reduced_texture_manifest(prefs.extract_dir)
+        if not manifest:
+            self.report({'INFO'}, "No reduced resolution textures to upgrade")
+            return {'CANCELLED'}
+
+        def show_completion(success_count, fail_count, report_lines):
+            import_utils.SCOrg_tools_import.reload_extracted_images(prefs.extract_dir, manifest)
+            from . import ui_tools
+            message = f"Texture Upgrade Complete\nSuccess: {success_count} | Failed: {fail_count}"
+            ui_tools.Popup("Texture Upgrade Complete", message + "\n\n" + "\n".join(report_lines), width=800).show()
+
+        if not globals_and_threading.start_extraction("\n".join(sorted(manifest)), prefs, mip_cap=0, on_complete=show_completion):
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
 # Export Missing Operator
 class VIEW3D_OT_export_missing(bpy.types.Operator):
     bl_idname = "view3d.export_missing"
@@ -462,38 +620,22 @@ class VIEW3D_OT_export_missing(bpy.types.Operator):
         # Set flag to indicate extraction has started
         globals_and_threading.extraction_started = True
         
-        # Store parameters for the timer function
+        # Store parameters for the completion callback
         file_list = self.file_list
+        prefs = bpy.context.preferences.addons[__package__].preferences
         
-        # Define the extraction function to run asynchronously
-        def run_extraction():
-            prefs = bpy.context.preferences.addons[__package__].preferences
+        # Show completion popup, called on the main thread once the background extraction finishes
+        def show_completion(success_count, fail_count, report_lines):
+            # Clear missing files if extraction was successful
+            if success_count > 0:
+                globals_and_threading.missing_files = set()
             
-            try:
-                success_count, fail_count, report_lines = import_utils.SCOrg_tools_import.extract_missing_files(file_list, prefs)
-            except ValueError as e:
-                # Report error on main thread
-                def report_error():
-                    bpy.context.window_manager.popup_menu(lambda self, context: self.layout.label(text=str(e)), title="Error", icon='ERROR')
-                bpy.app.timers.register(report_error, first_interval=0.1)
-                return
-            
-            # Calculate the number of files that were actually processed (excluding comments and glossmap files)
-            processed_files_count = len([f.strip() for f in file_list.split('\n') if f.strip() and not f.startswith('#') and '.ddna.glossmap' not in f.lower()])
-            
-            # Show completion popup on main thread
-            def show_completion():
-                # Clear missing files if extraction was successful
-                if success_count > 0:
-                    from . import globals_and_threading
-                    globals_and_threading.missing_files = set()
-                
-                from . import ui_tools
-                message = f"Extraction Complete\nSuccess: {success_count} | Failed: {fail_count}\n\nNow the missing files have been extracted, please re-import the model again."
-                ui_tools.Popup("Extraction Complete", message + "\n\n" + "\n".join(report_lines), width=800).show()
-            bpy.app.timers.register(show_completion, first_interval=0.1)
+            from . import ui_tools
+            message = f"Extraction Complete\nSuccess: {success_count} | Failed: {fail_count}\n\nNow the missing files have been extracted, please re-import the model again."
+            ui_tools.Popup("Extraction Complete", message + "\n\n" + "\n".join(report_lines), width=800).show()
         
-        # Register the extraction to run asynchronously
-        bpy.app.timers.register(run_extraction, first_interval=0.1)
+        # Run the extraction on a background thread so Blender stays responsive
+        if not globals_and_threading.start_extraction(file_list, prefs, on_complete=show_completion):
+            return {'CANCELLED'}
         
         return {'FINISHED'}
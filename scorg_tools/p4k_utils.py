@@ -0,0 +1,149 @@
+import copy
+import importlib
+import importlib.util
+import struct
+import threading
+import zlib
+
+# Helpers for reading Data.p4k from several threads at once.
+# This module must not import bpy so it can be used from worker threads and standalone scripts.
+
+class SCOrg_tools_p4k():
+    COMPRESSION_STORED = 0
+    COMPRESSION_DEFLATE = 8
+    COMPRESSION_ZSTD = 100  # Data.p4k's compression method
+    LOCAL_HEADER_SIGNATURES = (b'PK\x03\x04', b'PK\x03\x14')  # zip, p4k
+    LOCAL_HEADER_SIZE = 30
+
+    @staticmethod
+    def can_decompress_in_process(info, threshold):
+        """
+        Return True if an entry is worth handing to a worker process: at least `threshold` bytes,
+        not encrypted, and compressed with a method the worker can handle without the archive class.
+        """
+        if threshold <= 0 or info.compress_size < threshold:
+            return False
+        if info.flag_bits & 0x1 or getattr(info, 'is_encrypted', False):
+            return False
+        if info.compress_type == __class__.COMPRESSION_ZSTD:
+            return importlib.util.find_spec('zstandard') is not None
+        return info.compress_type in (__class__.COMPRESSION_STORED, __class__.COMPRESSION_DEFLATE)
+
+    @staticmethod
+    def get_data_offset(handles, info):
+        """Find where an entry's compressed data starts by reading its local file header, or None."""
+        handle = handles.get()
+        with handle._lock:
+            handle.fp.seek(info.header_offset)
+            header = handle.fp.read(__class__.LOCAL_HEADER_SIZE)
+        if len(header) < __class__.LOCAL_HEADER_SIZE or header[:4] not in __class__.LOCAL_HEADER_SIGNATURES:
+            return None
+        name_length, extra_length = struct.unpack_from('<HH', header, 26)
+        return info.header_offset + __class__.LOCAL_HEADER_SIZE + name_length + extra_length
+
+    @staticmethod
+    def decompress_entry(archive_path, data_offset, compress_size, compress_type, file_size, dst_path, dst_offset):
+        """
+        Read an entry's raw compressed bytes straight from the archive file, decompress them and write
+        the result into dst_path at dst_offset. Top level entry point for worker processes.
+
+        Returns:
+            int: Number of bytes written
+        """
+        with open(archive_path, 'rb') as archive:
+            archive.seek(data_offset)
+            raw = archive.read(compress_size)
+
+        if compress_type == __class__.COMPRESSION_ZSTD:
+            import zstandard
+            data = zstandard.ZstdDecompressor().decompress(raw, max_output_size=file_size)
+        elif compress_type == __class__.COMPRESSION_DEFLATE:
+            data = zlib.decompress(raw, -15)
+        else:
+            data = raw
+        if len(data) != file_size:
+            raise ValueError(f"Decompressed {len(data)} bytes, expected {file_size}")
+
+        with open(dst_path, 'r+b') as dst:
+            dst.seek(dst_offset)
+            dst.write(data)
+        return len(data)
+
+    @staticmethod
+    def get_process_entry_point():
+        """
+        Return decompress_entry from the top level `p4k_utils` module rather than from the
+        scorg_tools package, so worker processes can unpickle it without importing bpy.
+        """
+        try:
+            module = importlib.import_module('p4k_utils')
+            return module.SCOrg_tools_p4k.decompress_entry
+        except ImportError:
+            return __class__.decompress_entry
+
+    @staticmethod
+    def create_process_pool(processes):
+        """Create a process pool for decompressing large entries."""
+        import concurrent.futures
+        import multiprocessing
+        return concurrent.futures.ProcessPoolExecutor(max_workers=max(1, processes), mp_context=multiprocessing.get_context('spawn'))
+
+
+class ThreadHandles():
+    """
+    The per-thread archive handles of one batch of reads. Every thread reading through it gets its own
+    handle, and close() only closes this batch's handles, so another batch reading the same archive at
+    the same time (e.g. the background extraction) is left alone.
+    """
+    def __init__(self, p4k):
+        self.p4k = p4k
+        self._local = threading.local()
+        self._handles = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        Return a read-only view of the archive with its own file handle for the calling thread.
+
+        ZipFile (and the P4K subclass) share one file object and a lock between every open entry,
+        so reads from different threads queue up behind each other. The view is a shallow copy that
+        shares the parsed directory (filelist/NameToInfo) but seeks and reads through its own handle.
+        Falls back to the shared archive if the copy cannot be made (e.g. an in-memory archive).
+        """
+        handle = getattr(self._local, 'handle', None)
+        if handle is not None and not handle.fp.closed:
+            return handle
+
+        try:
+            handle = copy.copy(self.p4k)
+            handle.fp = open(self.p4k.filename, 'rb')
+            handle._lock = threading.RLock()
+            handle._fpRefCount = 1
+            handle._filePassed = 0
+        except (AttributeError, TypeError, OSError):
+            return self.p4k
+
+        self._local.handle = handle
+        with self._lock:
+            self._handles.append(handle)
+        return handle
+
+    def open_entry(self, info):
+        """Open an archive entry for reading through the calling thread's own handle."""
+        return self.get().open(info)
+
+    def read_entry(self, info):
+        """Read a complete archive entry through the calling thread's own handle."""
+        with self.open_entry(info) as f:
+            return f.read()
+
+    def close(self):
+        """Close this batch's handles, call this once its threaded reads are finished."""
+        with self._lock:
+            handles = self._handles
+            self._handles = []
+        for handle in handles:
+            try:
+                handle.fp.close()
+            except Exception:
+                pass
@@ -140,7 +140,7 @@ class VIEW3D_PT_scorg_tools_panel(bpy.types.Panel):
                 if not cgf_path or not Path(cgf_path).is_file() or not cgf_path.lower().endswith(".exe"):
                     missing_converters.append("CGF Converter")
                 
-                if not tex_path or not Path(tex_path).is_file() or not tex_path.lower().endswith(".exe"):
+                if prefs.texture_converter == 'TEXCONV' and tex_path and (not Path(tex_path).is_file() or not tex_path.lower().endswith(".exe")):
                     missing_converters.append("TexConv")
                 
                 if missing_converters:
@@ -158,6 +158,11 @@ class VIEW3D_PT_scorg_tools_panel(bpy.types.Panel):
                 op = layout.operator("scorg.show_missing_files", text="Show Missing Files", icon='ERROR')
                 layout.separator()
 
+            # Upgrade Textures Button (if any textures were extracted with skipped mip levels)
+            if import_utils.SCOrg_tools_import.get_reduced_texture_manifest_path(dir_path).is_file():
+                layout.operator("view3d.upgrade_textures", text="Upgrade Textures to Full Resolution", icon='TEXTURE')
+                layout.separator()
+
             # --- Sections dependent on P4K being loaded ---
             if globals_and_threading.p4k:
                 # Display ship loaded status and subsequent options
@@ -168,6 +173,8 @@ class VIEW3D_PT_scorg_tools_panel(bpy.types.Panel):
                     if dir_path.is_dir() and extract_dir != "":
                         layout.operator("view3d.import_loadout", text="Import loadout & mats", icon='IMPORT')
                         layout.operator("view3d.separate_decals", text="Separate Decals", icon='MOD_DISPLACE')
+                        if import_utils.SCOrg_tools_import.INSTANCE_LIBRARY_NAME in bpy.data.collections:
+                            layout.operator("view3d.make_components_real", text="Make Components Real", icon='OUTLINER_OB_GROUP_INSTANCE')
                     layout.separator()
                 else:
                     # Don't show import by guid button if a ship is loaded
@@ -45,6 +45,46 @@ class SCOrg_tools_AddonPreferences(bpy.types.AddonPreferences):
         description="Directory where StarFab extracts game data (e.g., C:\\StarFab\\extracted_data\\Data)"
     )
 
+    geometry_importer: bpy.props.EnumProperty(
+        name="Geometry Importer",
+        description="How converted .dae files are imported",
+        items=[
+            ('NATIVE', "Native", "Built-in importer for the files cgf-converter writes, faster than Collada. Skinned meshes still use the Collada importer where it is available"),
+            ('COLLADA', "Collada", "Blender's Collada importer (not available in recent Blender releases, the native importer is used there)"),
+        ],
+        default='NATIVE'
+    )
+
+    geometry_format: bpy.props.EnumProperty(
+        name="Geometry Format",
+        description="Format cgf-converter writes extracted geometry in. Files already converted in the other format are still imported",
+        items=[
+            ('DAE', "Collada (.dae)", "Imported with the Geometry Importer above"),
+            ('GLB', "glTF binary (.glb)", "Smaller files, imported with Blender's glTF importer"),
+        ],
+        default='DAE'
+    )
+
+    dae_preparse_processes: bpy.props.IntProperty(
+        name="Geometry Parse Processes",
+        description="Number of worker processes that parse the loadout's .dae files ahead of the import, so Blender only has to create the objects (0 = parse each file when it is imported)",
+        default=0,
+        min=0,
+        max=32
+    )
+
+    use_geometry_cache: BoolProperty(
+        name="Cache Imported Geometry",
+        description="Save each DAE's imported objects to a .blend in the extracted data directory (scorg_geometry_cache) and append from it next time, instead of running the Collada importer again. Entries are refreshed when the DAE changes",
+        default=True
+    )
+
+    instance_repeated_components: BoolProperty(
+        name="Instance Repeated Components",
+        description="Import each component once into a hidden collection and place repeats of it as collection instances, instead of copying every object. Much lighter for ships with many identical parts. Components with a loadout of their own are still copied",
+        default=False
+    )
+
     extract_missing_files: BoolProperty(
         name="Extract and convert missing files",
         description="If enabled, missing files will be extracted when clicking OK on the missing files popup",
@@ -59,6 +99,60 @@ class SCOrg_tools_AddonPreferences(bpy.types.AddonPreferences):
         max=32
     )
 
+    auto_extraction_threads: BoolProperty(
+        name="Auto Thread Count",
+        description="Measure throughput while extracting and tune the number of archive I/O, decompression and conversion workers separately, within the CPU and memory available. Max Extraction Threads is ignored when enabled",
+        default=False
+    )
+
+    process_decompress_threshold_mb: bpy.props.IntProperty(
+        name="Process Decompression Threshold (MB)",
+        description="Archive entries at least this large (compressed) are decompressed in separate processes to use more CPU cores. Smaller entries stay on the extraction threads. 0 disables",
+        default=8,
+        min=0,
+        max=1024
+    )
+
+    texture_mip_cap: bpy.props.IntProperty(
+        name="Skip Top Mip Levels",
+        description="Leave out this many of the highest resolution mip levels when extracting textures (0 = full resolution). Use 'Upgrade Textures' to re-extract them at full resolution later",
+        default=0,
+        min=0,
+        max=6
+    )
+
+    texture_converter: bpy.props.EnumProperty(
+        name="Texture Converter",
+        description="Tool used to convert extracted DDS textures",
+        items=[
+            ('TEXCONV', "TexConv", "Use texconv.exe, falls back to the built-in decoder if texconv is not set"),
+            ('BUILTIN', "Built-in", "Use the built-in NumPy BCn decoder (BC1/BC3/BC4/BC5/BC7), no texconv needed"),
+        ],
+        default='TEXCONV'
+    )
+
+    texconv_batch_size: bpy.props.IntProperty(
+        name="TexConv Batch Size",
+        description="Number of textures converted per texconv run. Textures in the same folder share one texconv process, which saves its start-up time on many small textures (1 = one run per texture)",
+        default=32,
+        min=1,
+        max=256
+    )
+
+    texture_decoder_processes: bpy.props.IntProperty(
+        name="Decoder Processes",
+        description="Number of worker processes for the built-in texture decoder (0 = decode in the extraction threads)",
+        default=0,
+        min=0,
+        max=32
+    )
+
+    pre_extract_dependencies: BoolProperty(
+        name="Pre-extract all dependencies",
+        description="Before importing, resolve every geometry, material and texture the item and its loadout need and extract the missing ones in a single batch",
+        default=True
+    )
+
     cgf_converter_path: StringProperty(
         name="CGF Converter Path",
         subtype='FILE_PATH',
@@ -199,10 +293,22 @@ class SCOrg_tools_AddonPreferences(bpy.types.AddonPreferences):
             objects_dir = path.join(abs_chosen_dir, "Objects")
             if not path.isdir(objects_dir):
                 layout.label(text=f"Directory '{objects_dir}' not found. This doesn't appear to be the correct folder.", icon='ERROR')
+        layout.prop(self, "geometry_format")
+        if self.geometry_format == 'DAE':
+            layout.prop(self, "geometry_importer")
+            if self.geometry_importer == 'NATIVE':
+                layout.prop(self, "dae_preparse_processes")
+        layout.prop(self, "use_geometry_cache")
+        layout.prop(self, "instance_repeated_components")
         
         layout.prop(self, "extract_missing_files")
         if self.extract_missing_files:
-            layout.prop(self, "max_extraction_threads")
+            layout.prop(self, "auto_extraction_threads")
+            if not self.auto_extraction_threads:
+                layout.prop(self, "max_extraction_threads")
+            layout.prop(self, "process_decompress_threshold_mb")
+            layout.prop(self, "pre_extract_dependencies")
+            layout.prop(self, "texture_mip_cap")
         
         layout.separator()
         layout.label(text="CGF Converter:")
@@ -225,8 +331,14 @@ class SCOrg_tools_AddonPreferences(bpy.types.AddonPreferences):
                 layout.label(text="Warning: File not found", icon='ERROR')
             elif not self.texconv_path.lower().endswith(".exe"):
                 layout.label(text="Warning: Not an .exe file", icon='ERROR')
-        elif self.extract_missing_files:
-            layout.label(text="Warning: TexConv required for extraction", icon='ERROR')
+        elif self.extract_missing_files and self.texture_converter == 'TEXCONV':
+            layout.label(text="Warning: TexConv not set, the built-in decoder will be used", icon='INFO')
+        if self.extract_missing_files:
+            layout.prop(self, "texture_converter")
+            if self.texture_converter == 'BUILTIN' or not self.texconv_path:
+                layout.prop(self, "texture_decoder_processes")
+            else:
+                layout.prop(self, "texconv_batch_size")
         
         col = layout.column()        
         # Displacement settings
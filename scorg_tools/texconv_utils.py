@@ -0,0 +1,166 @@
+import concurrent.futures
+import os
+import subprocess
+import threading
+from pathlib import Path
+
+# Runs texconv over many textures per process instead of one process per texture.
+# This module must not import bpy so it can be used from worker threads and standalone scripts.
+
+class TexconvBatcher:
+    """
+    Collects textures waiting for texconv and converts them in batches.
+
+    Textures are grouped by (output directory, output format, extra args), since those are
+    fixed for one texconv invocation. A group is run as soon as it holds `batch_size` files,
+    the rest are run by flush(). submit() returns a Future that resolves to (ok, error_text)
+    for that one texture.
+    """
+
+    def __init__(self, texconv_path, batch_size, executor, limiter=None):
+        self.texconv_path = texconv_path
+        self.batch_size = max(1, batch_size)
+        self.executor = executor
+        self.limiter = limiter  # optional concurrency_utils.AdaptiveLimiter for converter processes
+        self.lock = threading.Lock()
+        self.groups = {}
+        self.batches_run = 0
+        self.files_run = 0
+
+    def submit(self, input_path, output_format, extra_args=()):
+        future = concurrent.futures.Future()
+        key = (str(Path(input_path).parent), output_format, tuple(extra_args))
+        with self.lock:
+            group = self.groups.setdefault(key, [])
+            group.append((Path(input_path), future))
+            command = SCOrg_tools_texconv.build_command(self.texconv_path, [path for path, _ in group], output_format, extra_args, key[0])
+            if len(group) >= self.batch_size or SCOrg_tools_texconv.command_length(command) >= SCOrg_tools_texconv.MAX_COMMAND_LENGTH:
+                self._start(key, self.groups.pop(key))
+        return future
+
+    def flush(self):
+        """Run every partly filled group, call once no more textures will be submitted."""
+        with self.lock:
+            groups = self.groups
+            self.groups = {}
+        for key, group in groups.items():
+            self._start(key, group)
+
+    def _start(self, key, group):
+        self.batches_run += 1
+        self.files_run += len(group)
+        self.executor.submit(self._run, key, group)
+
+    def _run(self, key, group):
+        output_dir, output_format, extra_args = key
+        try:
+            if self.limiter:
+                with self.limiter.slot():
+                    results = SCOrg_tools_texconv.run_batch(self.texconv_path, [path for path, _ in group], output_format, extra_args, output_dir)
+            else:
+                results = SCOrg_tools_texconv.run_batch(self.texconv_path, [path for path, _ in group], output_format, extra_args, output_dir)
+        except Exception as e:
+            results = {path: (False, str(e)) for path, _ in group}
+        for path, future in group:
+            future.set_result(results.get(path, (False, "no result from texconv")))
+
+    def describe(self):
+        """One line summary for the extraction report."""
+        return f"texconv: {self.files_run} textures in {self.batches_run} runs"
+
+
+class SCOrg_tools_texconv():
+    TIMEOUT_BASE = 60  # seconds, as for a single texture
+    TIMEOUT_PER_FILE = 10
+    MAX_COMMAND_LENGTH = 30000  # characters, stay well under the Windows command line limit (32767 characters)
+
+    @staticmethod
+    def get_temp_suffix():
+        """Suffix texconv adds to its output names (-sx), outputs are renamed into place once complete."""
+        return f".{os.getpid()}.tmp"
+
+    @staticmethod
+    def build_command(texconv_path, input_paths, output_format, extra_args, output_dir):
+        """Build the texconv command line for one batch."""
+        return [texconv_path, '-nologo', '-y', '-sx', __class__.get_temp_suffix()] + list(extra_args) + \
+            ['-ft', output_format, '-o', str(output_dir)] + [str(path) for path in input_paths]
+
+    @staticmethod
+    def command_length(cmd):
+        """Approximate length of the command line once quoted."""
+        return sum(len(arg) + 3 for arg in cmd)
+
+    @staticmethod
+    def run_batch(texconv_path, input_paths, output_format, extra_args, output_dir):
+        """
+        Convert several DDS files with one texconv process.
+
+        texconv carries on after a file fails, so each input is checked separately: it succeeded
+        if its output file exists, and any FAILED line texconv printed for it is used as the error.
+        Outputs are written under a temporary name and replaced into place, so another session
+        never reads a half written texture.
+
+        Returns:
+            dict: {input_path: (ok, error_text)}
+        """
+        output_dir = Path(output_dir)
+        expected = {}
+        for path in input_paths:
+            temp_output_path = output_dir / (path.stem + __class__.get_temp_suffix() + '.' + output_format)
+            # -y overwrites, remove stale output so existence means this run wrote it
+            try:
+                temp_output_path.unlink()
+            except OSError:
+                pass
+            expected[path] = (temp_output_path, output_dir / (path.stem + '.' + output_format))
+
+        startupinfo = None
+        if os.name == 'nt':
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+
+        cmd = __class__.build_command(texconv_path, input_paths, output_format, extra_args, output_dir)
+        timeout = __class__.TIMEOUT_BASE + __class__.TIMEOUT_PER_FILE * len(input_paths)
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, startupinfo=startupinfo)
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            stdout, stderr = process.communicate()
+            timed_out = True
+        else:
+            timed_out = False
+
+        errors = __class__.parse_failures(stdout.decode('utf-8', errors='replace') if stdout else '', input_paths)
+        stderr_text = stderr.decode('utf-8', errors='replace').strip() if stderr else ''
+        results = {}
+        for path, (temp_output_path, output_path) in expected.items():
+            if temp_output_path.exists():
+                try:
+                    os.replace(temp_output_path, output_path)
+                    results[path] = (True, '')
+                except OSError as e:
+                    results[path] = (False, f"could not move output into place: {e}")
+            elif timed_out:
+                results[path] = (False, "conversion timed out")
+            else:
+                results[path] = (False, errors.get(path) or stderr_text or f"texconv exited with code {process.returncode}")
+        return results
+
+    @staticmethod
+    def parse_failures(output, input_paths):
+        """
+        Pick out per-file errors from texconv's output, which reads as "reading <file> ..." followed
+        by a line containing FAILED when that file could not be converted.
+        """
+        by_name = {str(path).lower(): path for path in input_paths}
+        errors = {}
+        current = None
+        for line in output.splitlines():
+            stripped = line.strip()
+            if stripped.lower().startswith('reading '):
+                name = stripped[8:].split(' (', 1)[0].strip().lower()
+                current = by_name.get(name)
+            if current is not None and 'FAILED' in stripped:
+                errors[current] = stripped
+        return errors
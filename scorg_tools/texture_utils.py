@@ -0,0 +1,533 @@
+import importlib
+import os
+import struct
+import zlib
+
+# Built-in BCn texture decoder, used when texconv is not available (or by preference).
+# This module must not import bpy or the scorg_tools package (it is loaded by worker
+# processes that only have the addon directory on sys.path), so numpy is optional here.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _dds():
+    """Return the DDS helper class whether we were imported as part of the addon or standalone."""
+    try:
+        from . import dds_utils
+    except ImportError:
+        import dds_utils
+    return dds_utils.SCOrg_tools_dds
+
+
+class SCOrg_tools_texture():
+    # DXGI_FORMAT values and legacy FourCC codes -> (decoder, signed)
+    DXGI_FORMATS = {
+        70: ('BC1', False), 71: ('BC1', False), 72: ('BC1', False),
+        76: ('BC3', False), 77: ('BC3', False), 78: ('BC3', False),
+        79: ('BC4', False), 80: ('BC4', False), 81: ('BC4', True),
+        82: ('BC5', False), 83: ('BC5', False), 84: ('BC5', True),
+        97: ('BC7', False), 98: ('BC7', False), 99: ('BC7', False),
+    }
+    FOURCC_FORMATS = {
+        b'DXT1': ('BC1', False),
+        b'DXT5': ('BC3', False),
+        b'ATI1': ('BC4', False), b'BC4U': ('BC4', False), b'BC4S': ('BC4', True),
+        b'ATI2': ('BC5', False), b'BC5U': ('BC5', False), b'BC5S': ('BC5', True),
+    }
+    BLOCK_SIZES = {'BC1': 8, 'BC3': 16, 'BC4': 8, 'BC5': 16, 'BC7': 16}
+    OUTPUT_FORMATS = ('tif', 'png', 'tga')
+    CHUNK_BLOCKS = 65536  # blocks decoded per numpy pass, bounds peak memory for BC7
+
+    # BC7 mode table: subsets, partition bits, rotation bits, index selection bits, colour bits,
+    # alpha bits, endpoint p-bits, shared p-bits, index bits, secondary index bits
+    BC7_MODES = (
+        (3, 4, 0, 0, 4, 0, 1, 0, 3, 0),
+        (2, 6, 0, 0, 6, 0, 0, 1, 3, 0),
+        (3, 6, 0, 0, 5, 0, 0, 0, 2, 0),
+        (2, 6, 0, 0, 7, 0, 1, 0, 2, 0),
+        (1, 0, 2, 1, 5, 6, 0, 0, 2, 3),
+        (1, 0, 2, 0, 7, 8, 0, 0, 2, 2),
+        (1, 0, 0, 0, 7, 7, 1, 0, 4, 0),
+        (2, 6, 0, 0, 5, 5, 1, 0, 2, 0),
+    )
+    BC7_WEIGHTS = {
+        2: (0, 21, 43, 64),
+        3: (0, 9, 18, 27, 37, 46, 55, 64),
+        4: (0, 4, 9, 13, 17, 21, 26, 30, 34, 38, 43, 47, 51, 55, 60, 64),
+    }
+    # Two subset partitions as 16 bit masks, bit i set = pixel i is in subset 1
+    BC7_PARTITIONS_2 = (
+        0xCCCC, 0x8888, 0xEEEE, 0xECC8, 0xC880, 0xFEEC, 0xFEC8, 0xEC80,
+        0xC800, 0xFFEC, 0xFE80, 0xE800, 0xFFE8, 0xFF00, 0xFFF0, 0xF000,
+        0xF710, 0x008E, 0x7100, 0x08CE, 0x008C, 0x7310, 0x3100, 0x8CCE,
+        0x088C, 0x3110, 0x6666, 0x366C, 0x17E8, 0x0FF0, 0x718E, 0x399C,
+        0xAAAA, 0xF0F0, 0x5A5A, 0x33CC, 0x3C3C, 0x55AA, 0x9696, 0xA55A,
+        0x73CE, 0x13C8, 0x324C, 0x3BDC, 0x6996, 0xC33C, 0x9966, 0x0660,
+        0x0272, 0x04E4, 0x4E40, 0x2720, 0xC936, 0x936C, 0x39C6, 0x639C,
+        0x9336, 0x9CC6, 0x817E, 0xE718, 0xCCF0, 0x0FCC, 0x7744, 0xEE22,
+    )
+    # Three subset partitions, one string of 16 subset numbers per partition
+    BC7_PARTITIONS_3 = (
+        "0011001102212222", "0001001122112221", "0000200122112211", "0222002200110111",
+        "0000000011221122", "0011001100220022", "0022002211111111", "0011001122112211",
+        "0000000011112222", "0000111111112222", "0000111122222222", "0012001200120012",
+        "0112011201120112", "0122012201220122", "0011011211221222", "0011200122002220",
+        "0001001101121122", "0111001120012200", "0000112211221122", "0022002200221111",
+        "0111011102220222", "0001000122212221", "0000001101220122", "0000110022102210",
+        "0122012200110000", "0012001211222222", "0110122112210110", "0000011012211221",
+        "0022110211020022", "0110011020022222", "0011012201220011", "0000200022112221",
+        "0000000211221222", "0222002200120011", "0011001200220222", "0120012001200120",
+        "0000111122220000", "0120120120120120", "0120201212010120", "0011220011220011",
+        "0011112222000011", "0101010122222222", "0000000021212121", "0022112200221122",
+        "0022001100220011", "0220122102201221", "0101222222220101", "0000212121212121",
+        "0101010101012222", "0222011102220111", "0002111200021112", "0000211221122112",
+        "0222011101110222", "0002111211120002", "0110011001102222", "0000000021122112",
+        "0110011022222222", "0022001100110022", "0022112211220022", "0000000000002112",
+        "0002000100020001", "0222122202221222", "0101222222222222", "0111201122012220",
+    )
+    BC7_ANCHORS_2 = (
+        15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15,
+        15, 2, 8, 2, 2, 8, 8, 15, 2, 8, 2, 2, 8, 8, 2, 2,
+        15, 15, 6, 8, 2, 8, 15, 15, 2, 8, 2, 2, 2, 15, 15, 6,
+        6, 2, 6, 8, 15, 15, 2, 2, 15, 15, 15, 15, 15, 2, 2, 15,
+    )
+    BC7_ANCHORS_3A = (
+        3, 3, 15, 15, 8, 3, 15, 15, 8, 8, 6, 6, 6, 5, 3, 3,
+        3, 3, 8, 15, 3, 3, 6, 10, 5, 8, 8, 6, 8, 5, 15, 15,
+        8, 15, 3, 5, 6, 10, 8, 15, 15, 3, 15, 5, 15, 15, 15, 15,
+        3, 15, 5, 5, 5, 8, 5, 10, 5, 10, 8, 13, 15, 12, 3, 3,
+    )
+    BC7_ANCHORS_3B = (
+        15, 8, 8, 3, 15, 15, 3, 8, 15, 15, 15, 15, 15, 15, 15, 8,
+        15, 8, 15, 3, 15, 8, 15, 8, 3, 15, 6, 10, 15, 15, 10, 8,
+        15, 3, 15, 10, 10, 8, 9, 10, 6, 15, 8, 15, 3, 6, 6, 8,
+        15, 3, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 3, 15, 15, 8,
+    )
+    _bc7_tables = None
+
+    @staticmethod
+    def is_available():
+        """Return True if the built-in decoder can run (numpy is installed)."""
+        return np is not None
+
+    @staticmethod
+    def get_block_format(data):
+        """
+        Work out which decoder handles a DDS file.
+
+        Returns:
+            tuple: (block_format, signed), or (None, False) if the format is not supported
+        """
+        four_cc, dxgi_format = _dds().get_format(data)
+        if dxgi_format is not None:
+            return __class__.DXGI_FORMATS.get(dxgi_format, (None, False))
+        return __class__.FOURCC_FORMATS.get(four_cc, (None, False))
+
+    @staticmethod
+    def decode_dds(data):
+        """
+        Decode the top mip level of a block-compressed DDS file.
+
+        Args:
+            data (bytes): Complete (assembled) DDS file
+
+        Returns:
+            numpy.ndarray: (height, width, channels) uint8 image. BC4 gives one channel, everything else RGBA.
+        """
+        if np is None:
+            raise RuntimeError("numpy is required for the built-in texture decoder")
+        header_len = _dds().header_size(data)
+        if not header_len:
+            raise ValueError("Not a DDS file")
+        block_format, signed = __class__.get_block_format(data)
+        if block_format is None:
+            raise ValueError("Unsupported DDS pixel format")
+
+        height, width = struct.unpack_from('<II', data, 12)
+        blocks_x = max(1, (width + 3) // 4)
+        blocks_y = max(1, (height + 3) // 4)
+        block_size = __class__.BLOCK_SIZES[block_format]
+        top_mip_size = blocks_x * blocks_y * block_size
+        if len(data) < header_len + top_mip_size:
+            raise ValueError("DDS file is truncated")
+        blocks = np.frombuffer(data, dtype=np.uint8, count=top_mip_size, offset=header_len).reshape(-1, block_size)
+
+        decoder = {
+            'BC1': __class__.decode_bc1,
+            'BC3': __class__.decode_bc3,
+            'BC4': __class__.decode_bc4,
+            'BC5': __class__.decode_bc5,
+            'BC7': __class__.decode_bc7,
+        }[block_format]
+        pixels = np.concatenate([
+            decoder(blocks[start:start + __class__.CHUNK_BLOCKS], signed)
+            for start in range(0, len(blocks), __class__.CHUNK_BLOCKS)
+        ])
+
+        # (blocks, 16, channels) -> (height, width, channels)
+        channels = pixels.shape[-1]
+        image = pixels.reshape(blocks_y, blocks_x, 4, 4, channels).transpose(0, 2, 1, 3, 4)
+        image = image.reshape(blocks_y * 4, blocks_x * 4, channels)
+        return np.ascontiguousarray(image[:height, :width])
+
+    @staticmethod
+    def _expand_565(colors):
+        """Expand packed RGB565 values to (n, 3) uint16 RGB888."""
+        r = (colors >> 11) & 0x1F
+        g = (colors >> 5) & 0x3F
+        b = colors & 0x1F
+        return np.stack([(r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)], axis=-1).astype(np.uint16)
+
+    @staticmethod
+    def _unpack_indices(packed, bits, count=16):
+        """Unpack `count` little-endian indices of `bits` bits from an unsigned integer column."""
+        shifts = np.arange(count, dtype=np.uint64) * np.uint64(bits)
+        return ((packed.astype(np.uint64)[:, None] >> shifts) & np.uint64((1 << bits) - 1)).astype(np.intp)
+
+    @staticmethod
+    def _decode_color_block(blocks, force_four_color):
+        """Decode the 8 byte BC1 colour block at the start of each row of blocks to (n, 16, 4)."""
+        color0 = blocks[:, 0].astype(np.uint16) | (blocks[:, 1].astype(np.uint16) << 8)
+        color1 = blocks[:, 2].astype(np.uint16) | (blocks[:, 3].astype(np.uint16) << 8)
+        c0 = __class__._expand_565(color0)
+        c1 = __class__._expand_565(color1)
+
+        four_color = (color0 > color1) | force_four_color
+        palette = np.empty((len(blocks), 4, 4), dtype=np.uint16)
+        palette[:, 0, :3] = c0
+        palette[:, 1, :3] = c1
+        palette[:, :, 3] = 255
+        palette[:, 2, :3] = np.where(four_color[:, None], (2 * c0 + c1 + 1) // 3, (c0 + c1) // 2)
+        palette[:, 3, :3] = np.where(four_color[:, None], (c0 + 2 * c1 + 1) // 3, 0)
+        palette[:, 3, 3] = np.where(four_color, 255, 0)
+
+        packed = blocks[:, 4:8].copy().view('<u4').reshape(-1)
+        indices = __class__._unpack_indices(packed, 2)
+        return np.take_along_axis(palette, indices[:, :, None], axis=1).astype(np.uint8)
+
+    @staticmethod
+    def _decode_alpha_block(blocks, signed):
+        """Decode the 8 byte BC4 block at the start of each row of blocks to (n, 16) uint8."""
+        if signed:
+            a0 = np.maximum(blocks[:, 0].view(np.int8).astype(np.float32), -127.0) / 127.0
+            a1 = np.maximum(blocks[:, 1].view(np.int8).astype(np.float32), -127.0) / 127.0
+            low, high = -1.0, 1.0
+            eight_values = blocks[:, 0].view(np.int8) > blocks[:, 1].view(np.int8)
+        else:
+            a0 = blocks[:, 0].astype(np.float32) / 255.0
+            a1 = blocks[:, 1].astype(np.float32) / 255.0
+            low, high = 0.0, 1.0
+            eight_values = blocks[:, 0] > blocks[:, 1]
+
+        steps = np.arange(8, dtype=np.float32)
+        palette = np.empty((len(blocks), 8), dtype=np.float32)
+        palette[:, 0] = a0
+        palette[:, 1] = a1
+        eight = (a0[:, None] * (7 - steps[1:7]) + a1[:, None] * (steps[1:7])) / 7.0
+        six = (a0[:, None] * (5 - steps[1:5]) + a1[:, None] * (steps[1:5])) / 5.0
+        palette[:, 2:8] = np.where(eight_values[:, None], eight[:, :6], np.concatenate([six, np.full((len(blocks), 1), low, np.float32), np.full((len(blocks), 1), high, np.float32)], axis=1))
+
+        packed = np.zeros(len(blocks), dtype=np.uint64)
+        for i in range(6):
+            packed |= blocks[:, 2 + i].astype(np.uint64) << np.uint64(8 * i)
+        indices = __class__._unpack_indices(packed, 3)
+        values = np.take_along_axis(palette, indices, axis=1)
+        if signed:
+            # Same bias texconv applies when converting SNORM data to an UNORM format
+            values = (values + 1.0) * 0.5
+        return np.clip(np.rint(values * 255.0), 0, 255).astype(np.uint8)
+
+    @staticmethod
+    def decode_bc1(blocks, signed=False):
+        return __class__._decode_color_block(blocks, False)
+
+    @staticmethod
+    def decode_bc3(blocks, signed=False):
+        pixels = __class__._decode_color_block(blocks[:, 8:], True)
+        pixels[:, :, 3] = __class__._decode_alpha_block(blocks, False)
+        return pixels
+
+    @staticmethod
+    def decode_bc4(blocks, signed=False):
+        return __class__._decode_alpha_block(blocks, signed)[:, :, None]
+
+    @staticmethod
+    def decode_bc5(blocks, signed=False):
+        # Two channel normal maps, blue is left at 0 and alpha opaque to match texconv's output
+        pixels = np.zeros((len(blocks), 16, 4), dtype=np.uint8)
+        pixels[:, :, 0] = __class__._decode_alpha_block(blocks, signed)
+        pixels[:, :, 1] = __class__._decode_alpha_block(blocks[:, 8:], signed)
+        pixels[:, :, 3] = 255
+        return pixels
+
+    @staticmethod
+    def _get_bc7_tables():
+        """Build (once) the BC7 partition lookup: (subsets, partition) -> (16,) subset numbers and anchors."""
+        if __class__._bc7_tables is None:
+            partitions = np.zeros((4, 64, 16), dtype=np.intp)
+            anchors = np.zeros((4, 64, 3), dtype=np.intp)  # index of the anchor pixel per subset
+            for p in range(64):
+                mask = __class__.BC7_PARTITIONS_2[p]
+                partitions[2, p] = [(mask >> i) & 1 for i in range(16)]
+                partitions[3, p] = [int(c) for c in __class__.BC7_PARTITIONS_3[p]]
+                anchors[2, p] = (0, __class__.BC7_ANCHORS_2[p], 0)
+                anchors[3, p] = (0, __class__.BC7_ANCHORS_3A[p], __class__.BC7_ANCHORS_3B[p])
+            __class__._bc7_tables = (partitions, anchors)
+        return __class__._bc7_tables
+
+    @staticmethod
+    def decode_bc7(blocks, signed=False):
+        pixels = np.zeros((len(blocks), 16, 4), dtype=np.uint8)
+        bits = np.unpackbits(blocks, axis=1, bitorder='little')  # (n, 128)
+        # Mode is the position of the lowest set bit in the first byte, 0 bytes are reserved (transparent black)
+        first = blocks[:, 0]
+        modes = np.full(len(blocks), 8, dtype=np.intp)
+        for mode in range(7, -1, -1):
+            modes[(first >> mode) & 1 == 1] = mode
+        for mode in range(8):
+            selected = np.nonzero(modes == mode)[0]
+            if len(selected):
+                pixels[selected] = __class__._decode_bc7_mode(bits[selected], mode)
+        return pixels
+
+    @staticmethod
+    def _read_bits(bits, offset, count):
+        """Read a `count` bit little-endian field at a fixed bit offset for every block."""
+        value = np.zeros(len(bits), dtype=np.int32)
+        for i in range(count):
+            value |= bits[:, offset + i].astype(np.int32) << i
+        return value
+
+    @staticmethod
+    def _read_indices(bits, offset, index_bits, anchor_mask):
+        """
+        Read 16 indices starting at `offset`. Anchor pixels (anchor_mask, (n, 16) bool) are stored
+        with one bit less, so every block gets its own offsets.
+        Returns (indices (n, 16), offset after the last index (n,))
+        """
+        widths = np.where(anchor_mask, index_bits - 1, index_bits)
+        offset = np.asarray(offset).reshape(-1, 1)
+        starts = offset + np.concatenate([np.zeros((len(bits), 1), dtype=np.intp), np.cumsum(widths, axis=1)[:, :-1]], axis=1)
+        rows = np.arange(len(bits))[:, None]
+        indices = np.zeros((len(bits), 16), dtype=np.intp)
+        for i in range(index_bits):
+            bit = bits[rows, np.minimum(starts + i, 127)].astype(np.intp)
+            indices |= np.where(i < widths, bit, 0) << i
+        return indices, starts[:, -1] + widths[:, -1]
+
+    @staticmethod
+    def _decode_bc7_mode(bits, mode):
+        subsets, partition_bits, rotation_bits, selection_bits, color_bits, alpha_bits, endpoint_pbits, shared_pbits, index_bits, index_bits2 = __class__.BC7_MODES[mode]
+        count = len(bits)
+        offset = mode + 1
+        partition = __class__._read_bits(bits, offset, partition_bits)
+        offset += partition_bits
+        rotation = __class__._read_bits(bits, offset, rotation_bits)
+        offset += rotation_bits
+        selection = __class__._read_bits(bits, offset, selection_bits)
+        offset += selection_bits
+
+        # Endpoints: all R values, then all G, then all B, then all A
+        endpoints = np.zeros((count, subsets * 2, 4), dtype=np.int32)
+        for channel in range(3):
+            for e in range(subsets * 2):
+                endpoints[:, e, channel] = __class__._read_bits(bits, offset, color_bits)
+                offset += color_bits
+        if alpha_bits:
+            for e in range(subsets * 2):
+                endpoints[:, e, 3] = __class__._read_bits(bits, offset, alpha_bits)
+                offset += alpha_bits
+
+        channel_bits = np.array([color_bits] * 3 + [alpha_bits or color_bits], dtype=np.int32)
+        if endpoint_pbits or shared_pbits:
+            for e in range(subsets * 2):
+                pbit_offset = offset + (e if endpoint_pbits else e // 2)
+                pbit = bits[:, pbit_offset].astype(np.int32)
+                endpoints[:, e, :] = (endpoints[:, e, :] << 1) | pbit[:, None]
+            offset += subsets * 2 if endpoint_pbits else subsets
+            channel_bits = channel_bits + 1
+
+        # Expand each channel to 8 bits by replicating its top bits (BC7 channels are always 4-8 bits)
+        for channel in range(4):
+            n = int(channel_bits[channel])
+            endpoints[:, :, channel] = (endpoints[:, :, channel] << (8 - n)) | (endpoints[:, :, channel] >> (2 * n - 8))
+        if not alpha_bits:
+            endpoints[:, :, 3] = 255
+
+        # Subset of each pixel and which pixels are anchors (stored with one index bit less)
+        partitions, anchors = __class__._get_bc7_tables()
+        if subsets == 1:
+            subset = np.zeros((count, 16), dtype=np.intp)
+            anchor_mask = np.zeros((count, 16), dtype=bool)
+            anchor_mask[:, 0] = True
+        else:
+            subset = partitions[subsets][partition]
+            anchor_mask = np.zeros((count, 16), dtype=bool)
+            for s in range(subsets):
+                anchor_mask[np.arange(count), anchors[subsets][partition][:, s]] = True
+
+        indices, next_offset = __class__._read_indices(bits, offset, index_bits, anchor_mask)
+        if index_bits2:
+            secondary_anchor = np.zeros((count, 16), dtype=bool)
+            secondary_anchor[:, 0] = True
+            indices2, _ = __class__._read_indices(bits, next_offset, index_bits2, secondary_anchor)
+        else:
+            indices2 = None
+
+        # Alpha shares the colour indices unless the mode has a second index set
+        color_index, color_weight_bits = indices, index_bits
+        alpha_index, alpha_weight_bits = indices, index_bits
+        if indices2 is not None:
+            alpha_index, alpha_weight_bits = indices2, index_bits2
+
+        rows = np.arange(count)[:, None]
+        e0 = endpoints[rows, subset * 2]
+        e1 = endpoints[rows, subset * 2 + 1]
+
+        def interpolate(index, weight_bits, channels):
+            weights = np.array(__class__.BC7_WEIGHTS[weight_bits], dtype=np.int32)[index][:, :, None]
+            return ((64 - weights) * e0[:, :, channels] + weights * e1[:, :, channels] + 32) >> 6
+
+        pixels = np.zeros((count, 16, 4), dtype=np.int32)
+        pixels[:, :, :3] = interpolate(color_index, color_weight_bits, slice(0, 3))
+        pixels[:, :, 3:] = interpolate(alpha_index, alpha_weight_bits, slice(3, 4))
+
+        if selection_bits:
+            # Mode 4 can swap which index set drives colour and alpha
+            swapped = selection == 1
+            if swapped.any():
+                pixels[swapped, :, :3] = interpolate(indices2, index_bits2, slice(0, 3))[swapped]
+                pixels[swapped, :, 3:] = interpolate(indices, index_bits, slice(3, 4))[swapped]
+
+        if rotation_bits:
+            for channel in range(3):
+                rotate = rotation == channel + 1
+                if rotate.any():
+                    swap = pixels[rotate, :, channel].copy()
+                    pixels[rotate, :, channel] = pixels[rotate, :, 3]
+                    pixels[rotate, :, 3] = swap
+
+        return pixels.astype(np.uint8)
+
+    @staticmethod
+    def write_png(path, image):
+        """Write a (height, width, channels) uint8 image as an uncompressed-filter, zlib compressed PNG."""
+        height, width, channels = image.shape
+        color_type = {1: 0, 2: 4, 3: 2, 4: 6}[channels]
+        rows = np.empty((height, width * channels + 1), dtype=np.uint8)
+        rows[:, 0] = 0  # filter type None
+        rows[:, 1:] = image.reshape(height, width * channels)
+
+        def chunk(tag, payload):
+            return struct.pack('>I', len(payload)) + tag + payload + struct.pack('>I', zlib.crc32(tag + payload) & 0xFFFFFFFF)
+
+        with open(path, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n')
+            f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)))
+            f.write(chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)))
+            f.write(chunk(b'IEND', b''))
+
+    @staticmethod
+    def write_tif(path, image):
+        """Write a (height, width, channels) uint8 image as a baseline, single strip, uncompressed TIFF."""
+        height, width, channels = image.shape
+        pixel_data = image.tobytes()
+        has_alpha = channels in (2, 4)
+
+        # Layout: header, pixel data, BitsPerSample values, IFD
+        data_offset = 8
+        bps_offset = data_offset + len(pixel_data)
+        ifd_offset = bps_offset + 2 * channels
+        ifd_offset += ifd_offset % 2  # IFD must start on a word boundary
+
+        entries = [
+            (256, 4, 1, width),  # ImageWidth
+            (257, 4, 1, height),  # ImageLength
+            (258, 3, channels, bps_offset if channels > 2 else 8 | (8 << 16) if channels == 2 else 8),  # BitsPerSample
+            (259, 3, 1, 1),  # Compression: none
+            (262, 3, 1, 2 if channels >= 3 else 1),  # Photometric: RGB or BlackIsZero
+            (273, 4, 1, data_offset),  # StripOffsets
+            (277, 3, 1, channels),  # SamplesPerPixel
+            (278, 4, 1, height),  # RowsPerStrip
+            (279, 4, 1, len(pixel_data)),  # StripByteCounts
+            (284, 3, 1, 1),  # PlanarConfiguration: chunky
+        ]
+        if has_alpha:
+            entries.append((338, 3, 1, 2))  # ExtraSamples: unassociated alpha
+
+        with open(path, 'wb') as f:
+            f.write(struct.pack('<2sHI', b'II', 42, ifd_offset))
+            f.write(pixel_data)
+            f.write(struct.pack(f'<{channels}H', *([8] * channels)))
+            f.write(b'\0' * (ifd_offset - bps_offset - 2 * channels))
+            f.write(struct.pack('<H', len(entries)))
+            for tag, field_type, field_count, value in entries:
+                if field_type == 3 and field_count == 1:
+                    f.write(struct.pack('<HHIHH', tag, field_type, field_count, value, 0))
+                else:
+                    f.write(struct.pack('<HHII', tag, field_type, field_count, value))
+            f.write(struct.pack('<I', 0))
+
+    @staticmethod
+    def write_tga(path, image):
+        """Write a (height, width, channels) uint8 image as an uncompressed, top-left origin TGA."""
+        height, width, channels = image.shape
+        if channels == 1:
+            image_type, depth, descriptor, pixels = 3, 8, 0x20, image
+        elif channels == 3:
+            image_type, depth, descriptor, pixels = 2, 24, 0x20, image[:, :, ::-1]
+        else:
+            if channels == 2:
+                image = np.concatenate([image[:, :, :1].repeat(3, axis=2), image[:, :, 1:]], axis=2)
+            image_type, depth, descriptor = 2, 32, 0x28
+            pixels = image[:, :, [2, 1, 0, 3]]
+        with open(path, 'wb') as f:
+            f.write(struct.pack('<BBBHHBHHHHBB', 0, 0, image_type, 0, 0, 0, 0, 0, width, height, depth, descriptor))
+            f.write(np.ascontiguousarray(pixels).tobytes())
+
+    @staticmethod
+    def convert_dds_file(dds_path, output_path):
+        """
+        Decode a DDS file and write it as PNG, TIF or TGA (picked from output_path's extension).
+        Top level entry point for worker processes.
+
+        Returns:
+            tuple: (output_path, width, height)
+        """
+        with open(dds_path, 'rb') as f:
+            data = f.read()
+        image = __class__.decode_dds(data)
+        output_format = os.path.splitext(str(output_path))[1].lower().lstrip('.')
+        writer = {
+            'png': __class__.write_png,
+            'tif': __class__.write_tif,
+            'tiff': __class__.write_tif,
+            'tga': __class__.write_tga,
+        }.get(output_format)
+        if writer is None:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        writer(str(output_path), image)
+        return str(output_path), image.shape[1], image.shape[0]
+
+    @staticmethod
+    def get_process_entry_point():
+        """
+        Return convert_dds_file from the top level `texture_utils` module rather than from the
+        scorg_tools package, so worker processes can unpickle it without importing bpy.
+        """
+        try:
+            module = importlib.import_module('texture_utils')
+            return module.SCOrg_tools_texture.convert_dds_file
+        except ImportError:
+            return __class__.convert_dds_file
+
+    @staticmethod
+    def create_process_pool(processes):
+        """Create a process pool for texture decoding, or None if processes is 0 or numpy is missing."""
+        if processes <= 0 or np is None:
+            return None
+        import concurrent.futures
+        import multiprocessing
+        return concurrent.futures.ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'))